@@ -2,11 +2,15 @@ from .utils import *
 from .bernoulli_arm import *
 from .gaussian_arm import *
 from .pseudo_arm import *
+from .pseudo_arm_bank import *
 
 
 __all__ = [
     'Arm',
+    'CompensatedSum',
     'BernoulliArm',
     'GaussianArm',
     'PseudoArm',
+    'PseudoArmBank',
+    'RewardStats',
 ]
@@ -1,6 +1,6 @@
 import numpy as np
 
-from .utils import Arm
+from .utils import Arm, RewardStats
 
 
 class BernoulliArm(Arm):
@@ -8,6 +8,7 @@ class BernoulliArm(Arm):
 
   Arm with rewards generated from a Bernoulli distribution.
   """
+  __slots__ = ('__mu',)
 
   def __init__(self, mu: float, name: str = None):
     """
@@ -44,3 +45,16 @@ class BernoulliArm(Arm):
       stochastic rewards
     """
     return np.random.binomial(1, self.__mu, pulls)
+
+  def pull_stats(self, pulls: int = 1) -> RewardStats:
+    """Pull the arm and only keep the sufficient statistics of the rewards
+
+    Args:
+      pulls: number of times to pull
+
+    Returns:
+      sufficient statistics of the rewards
+    """
+    # rewards are either 0 or 1 so the sum of squared rewards equals the sum
+    total_rewards = np.random.binomial(pulls, self.__mu)
+    return RewardStats(pulls, total_rewards, total_rewards)
@@ -1,7 +1,7 @@
 import math
 import numpy as np
 
-from .utils import Arm
+from .utils import Arm, RewardStats
 
 
 class GaussianArm(Arm):
@@ -9,6 +9,7 @@ class GaussianArm(Arm):
 
   Arm with rewards generated from a Gaussian distribution.
   """
+  __slots__ = ('__mu', '__var', '__std')
 
   def __init__(self, mu: float, var: float, name: str = None):
     """
@@ -57,3 +58,24 @@ class GaussianArm(Arm):
       stochastic rewards
     """
     return np.random.normal(self.__mu, self.__std, pulls)
+
+  def pull_stats(self, pulls: int = 1) -> RewardStats:
+    r"""Pull the arm and only keep the sufficient statistics of the rewards
+
+    The sum of :math:`n` rewards follows :math:`\mathcal{N}(n \mu, n \sigma^2)`
+    and the sum of squared deviations from the empirical mean follows
+    :math:`\sigma^2 \chi^2_{n-1}` independently, from which the sum of squared
+    rewards is recovered.
+
+    Args:
+      pulls: number of times to pull
+
+    Returns:
+      sufficient statistics of the rewards
+    """
+    total_rewards = np.random.normal(pulls * self.__mu,
+                                     math.sqrt(pulls) * self.__std)
+    sum_of_square_rewards = total_rewards**2 / pulls
+    if pulls > 1:
+      sum_of_square_rewards += self.__var * np.random.chisquare(pulls - 1)
+    return RewardStats(pulls, total_rewards, sum_of_square_rewards)
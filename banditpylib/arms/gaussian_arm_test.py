@@ -17,3 +17,16 @@ class TestGaussianArm:
         prob_within_one_std
     ) > 0.68, ('Probability of rewards within one std in N(0, 1) %.2f is '
                'no greater than 0.68!' % prob_within_one_std)
+
+  def test_pull_stats(self):
+    mu, var = 1, 4
+    gaussian_arm = GaussianArm(mu, var)
+    stats = gaussian_arm.pull_stats(100000)
+    assert len(stats) == 100000
+    em_mean = stats.total_rewards / stats.pulls
+    em_var = stats.sum_of_square_rewards / stats.pulls - em_mean**2
+    assert abs(em_mean - mu) < 0.1
+    assert abs(em_var - var) < 0.2
+    # sum of squared rewards of one pull is the squared reward
+    stats = gaussian_arm.pull_stats(1)
+    assert abs(stats.sum_of_square_rewards - stats.total_rewards**2) < 1e-9
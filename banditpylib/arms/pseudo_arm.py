@@ -1,13 +1,21 @@
+from typing import Union
+
 import numpy as np
 
+from .utils import RewardStats
+
 
 class PseudoArm:
   """Pseudo arm
 
   This class is used to store empirical information of an arm. Currently, only
   the information regarding the first and second moments of empirical rewards
-  i.e., mean and variance are stored.
+  i.e., mean and variance are stored. The rewards of each update are reduced
+  with NumPy.
   """
+  __slots__ = ('__name', '__total_pulls', '__total_rewards',
+               '__sum_of_square_reward')
+
   def __init__(self, name: str = None):
     """
     Args:
@@ -53,15 +61,22 @@ class PseudoArm:
   def reset(self):
     """Clear information"""
     self.__total_pulls = 0
-    self.__total_rewards = 0
-    self.__sum_of_square_reward = 0
+    self.__total_rewards = 0.0
+    self.__sum_of_square_reward = 0.0
 
-  def update(self, rewards: np.ndarray):
+  def update(self, rewards: Union[np.ndarray, RewardStats]):
     """Update information
 
     Args:
-      rewards: empirical rewards
+      rewards: empirical rewards or their sufficient statistics
     """
+    if isinstance(rewards, RewardStats):
+      self.__total_pulls += rewards.pulls
+      self.__total_rewards += rewards.total_rewards
+      self.__sum_of_square_reward += rewards.sum_of_square_rewards
+      return
+    rewards = np.asarray(rewards, dtype=float)
     self.__total_pulls += len(rewards)
-    self.__total_rewards += sum(rewards)
-    self.__sum_of_square_reward += sum(rewards**2)
+    # `ndarray.sum` uses pairwise summation and skips the overhead of `np.sum`
+    self.__total_rewards += rewards.sum()
+    self.__sum_of_square_reward += rewards.dot(rewards)
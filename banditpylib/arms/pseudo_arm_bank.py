@@ -0,0 +1,116 @@
+from typing import Union
+
+import numpy as np
+
+from .utils import RewardStats
+
+
+class PseudoArmBank:
+  """Pseudo arm bank
+
+  This class is used to store empirical information of a group of arms. It
+  plays the same role as a list of :class:`PseudoArm` but the information i.e.,
+  the number of pulls, the total rewards and the sum of squared rewards of all
+  the arms is stored in contiguous arrays so that the empirical means and
+  variances can be computed in one shot.
+  """
+  __slots__ = ('__arm_num', '__name', '__total_pulls', '__total_rewards',
+               '__sum_of_square_reward')
+
+  def __init__(self, arm_num: int, name: str = None):
+    """
+    Args:
+      arm_num: number of arms
+      name: alias name
+    """
+    if arm_num < 1:
+      raise Exception('Number of arms %d is less than 1!' % arm_num)
+    self.__arm_num = arm_num
+    self.__name = 'pseudo_arm_bank' if name is None else name
+    self.reset()
+
+  @property
+  def name(self) -> str:
+    """arm bank name"""
+    return self.__name
+
+  def arm_num(self) -> int:
+    """
+    Returns:
+      number of arms
+    """
+    return self.__arm_num
+
+  def total_pulls(self) -> np.ndarray:
+    """
+    Returns:
+      total number of pulls of each arm
+    """
+    return self.__total_pulls
+
+  def total_rewards(self) -> np.ndarray:
+    """
+    Returns:
+      total rewards of each arm obtained so far
+    """
+    return self.__total_rewards
+
+  @property
+  def em_means(self) -> np.ndarray:
+    """empirical means of rewards of each arm"""
+    if np.any(self.__total_pulls == 0):
+      raise Exception('Number of pulls of some arm is 0. No empirical mean!')
+    return self.__total_rewards / self.__total_pulls
+
+  @property
+  def em_vars(self) -> np.ndarray:
+    """empirical variances of rewards of each arm"""
+    if np.any(self.__total_pulls == 0):
+      raise Exception(
+          'Number of pulls of some arm is 0. No empirical variance!')
+    return (self.__sum_of_square_reward -
+            self.__total_rewards**2 / self.__total_pulls) / self.__total_pulls
+
+  def reset(self):
+    """Clear information"""
+    self.__total_pulls = np.zeros(self.__arm_num)
+    self.__total_rewards = np.zeros(self.__arm_num)
+    self.__sum_of_square_reward = np.zeros(self.__arm_num)
+
+  def update(self, arm_ids: Union[int, np.ndarray],
+             rewards: Union[np.ndarray, RewardStats]):
+    """Update information
+
+    Args:
+      arm_ids: arm id of each reward. If it is an integer, all the rewards are
+        considered to be obtained from this arm.
+      rewards: empirical rewards or their sufficient statistics. Sufficient
+        statistics can only be used when `arm_ids` is an integer.
+    """
+    if np.ndim(arm_ids) == 0:
+      if isinstance(rewards, RewardStats):
+        self.__total_pulls[arm_ids] += rewards.pulls
+        self.__total_rewards[arm_ids] += rewards.total_rewards
+        self.__sum_of_square_reward[arm_ids] += rewards.sum_of_square_rewards
+        return
+      rewards = np.asarray(rewards, dtype=float)
+      self.__total_pulls[arm_ids] += len(rewards)
+      # `ndarray.sum` uses pairwise summation and skips the overhead of `np.sum`
+      self.__total_rewards[arm_ids] += rewards.sum()
+      self.__sum_of_square_reward[arm_ids] += rewards.dot(rewards)
+      return
+    if isinstance(rewards, RewardStats):
+      raise Exception('Sufficient statistics can only be used to update '
+                      'one arm!')
+    rewards = np.asarray(rewards, dtype=float)
+    arm_ids = np.asarray(arm_ids)
+    if arm_ids.shape != rewards.shape:
+      raise Exception('Number of arm ids %d does not equal to number of '
+                      'rewards %d!' % (len(arm_ids), len(rewards)))
+    self.__total_pulls += np.bincount(arm_ids, minlength=self.__arm_num)
+    self.__total_rewards += np.bincount(arm_ids,
+                                        weights=rewards,
+                                        minlength=self.__arm_num)
+    self.__sum_of_square_reward += np.bincount(arm_ids,
+                                               weights=rewards**2,
+                                               minlength=self.__arm_num)
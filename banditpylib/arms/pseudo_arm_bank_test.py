@@ -0,0 +1,24 @@
+import numpy as np
+
+from .pseudo_arm import PseudoArm
+from .pseudo_arm_bank import PseudoArmBank
+
+
+class TestPseudoArmBank:
+  """Test pseudo-arm bank"""
+
+  def test_consistency_with_pseudo_arm(self):
+    arm_ids = np.array([0, 1, 2, 1, 0, 2, 2])
+    rewards = np.array([0.5, 0.1, 0.9, 0.3, 0.7, 0.2, 0.4])
+    pseudo_arm_bank = PseudoArmBank(arm_num=3)
+    pseudo_arm_bank.update(arm_ids, rewards)
+    pseudo_arm_bank.update(1, np.array([0.6, 0.8]))
+    for arm_id in range(3):
+      pseudo_arm = PseudoArm()
+      pseudo_arm.update(rewards[arm_ids == arm_id])
+      if arm_id == 1:
+        pseudo_arm.update(np.array([0.6, 0.8]))
+      assert pseudo_arm_bank.total_pulls()[arm_id] == \
+          pseudo_arm.total_pulls()
+      assert np.isclose(pseudo_arm_bank.em_means[arm_id], pseudo_arm.em_mean)
+      assert np.isclose(pseudo_arm_bank.em_vars[arm_id], pseudo_arm.em_var)
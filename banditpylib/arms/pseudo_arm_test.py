@@ -12,3 +12,8 @@ class TestPseudoArm:
     em_var = pseudo_arm.em_var
     assert em_var <= 1, \
         ('Empirical variance of Bernoulli arm %.2f is greater than 1!' % em_var)
+
+  def test_slots(self):
+    # pseudo arms and arms have no instance dictionary
+    assert not hasattr(PseudoArm(), '__dict__')
+    assert not hasattr(BernoulliArm(0.5), '__dict__')
@@ -1,12 +1,149 @@
 from abc import ABC, abstractmethod
 
-from typing import Optional
+from typing import Optional, Union
 
 import numpy as np
 
 
+class CompensatedSum:
+  """Compensated accumulator
+
+  Values are accumulated in float64 with Neumaier's variant of Kahan summation
+  i.e., the rounding error of each addition is kept in a separate compensation
+  term, so that the accumulated value does not drift when a huge number of
+  small values are added to a large total. The accumulator is either a scalar
+  or an array of accumulators of the given size.
+
+  .. note::
+    Each addition costs more than a plain float addition, so it is meant for
+    totals kept over a whole game such as regrets rather than for the
+    statistics of arms updated at every time step.
+  """
+  __slots__ = ('__size', '__sum', '__compensation', '__value')
+
+  def __init__(self, size: Optional[int] = None):
+    """
+    Args:
+      size: number of accumulators. A scalar accumulator is used if it is
+        `None`.
+    """
+    self.__size = size
+    self.reset()
+
+  def reset(self):
+    """Clear the accumulated value"""
+    if self.__size is None:
+      self.__sum = 0.0
+      self.__compensation = 0.0
+    else:
+      self.__sum = np.zeros(self.__size)
+      self.__compensation = np.zeros(self.__size)
+      # compensated values are cached so that reading them does not allocate
+      self.__value = np.zeros(self.__size)
+
+  @property
+  def value(self) -> Union[float, np.ndarray]:
+    """accumulated value"""
+    if self.__size is None:
+      return self.__sum + self.__compensation
+    return self.__value
+
+  def add(self, value: Union[float, np.ndarray], index: Optional[int] = None):
+    """Add a value to the accumulator
+
+    Args:
+      value: value to add. For an array of accumulators, it is added to all the
+        accumulators elementwise unless `index` is given.
+      index: index of the only accumulator to add to
+    """
+    if self.__size is None or index is not None:
+      # scalar additions are done with python floats which are float64
+      value = float(value)
+      total = float(self.__sum if index is None else self.__sum[index])
+      new_total = total + value
+      if abs(total) >= abs(value):
+        error = (total - new_total) + value
+      else:
+        error = (value - new_total) + total
+      if index is None:
+        self.__sum = new_total
+        self.__compensation += error
+      else:
+        self.__sum[index] = new_total
+        self.__compensation[index] += error
+        self.__value[index] = new_total + self.__compensation[index]
+      return
+    value = np.asarray(value, dtype=float)
+    new_total = self.__sum + value
+    self.__compensation += np.where(
+        np.abs(self.__sum) >= np.abs(value), (self.__sum - new_total) + value,
+        (value - new_total) + self.__sum)
+    self.__sum = new_total
+    np.add(self.__sum, self.__compensation, out=self.__value)
+
+
+class RewardStats:
+  """Sufficient statistics of the rewards of repeated pulls of one arm
+
+  The statistics are the number of pulls, the total rewards and the sum of
+  squared rewards, which are all the information needed to estimate the mean
+  and the variance of the rewards. `len` of the statistics is the number of
+  pulls so that they can be used in place of an array of rewards.
+  """
+  __slots__ = ('__pulls', '__total_rewards', '__sum_of_square_rewards')
+
+  def __init__(self, pulls: int, total_rewards: float,
+               sum_of_square_rewards: float):
+    """
+    Args:
+      pulls: number of pulls
+      total_rewards: total rewards
+      sum_of_square_rewards: sum of squared rewards
+    """
+    self.__pulls = int(pulls)
+    self.__total_rewards = float(total_rewards)
+    self.__sum_of_square_rewards = float(sum_of_square_rewards)
+
+  @classmethod
+  def from_rewards(cls, rewards: np.ndarray) -> 'RewardStats':
+    """
+    Args:
+      rewards: empirical rewards
+
+    Returns:
+      sufficient statistics of `rewards`
+    """
+    rewards = np.asarray(rewards, dtype=float)
+    # `ndarray.sum` uses pairwise summation and skips the overhead of `np.sum`
+    return cls(len(rewards), rewards.sum(), rewards.dot(rewards))
+
+  def __len__(self) -> int:
+    return self.__pulls
+
+  def __repr__(self) -> str:
+    return 'RewardStats(pulls=%d, total_rewards=%r, ' \
+        'sum_of_square_rewards=%r)' % (self.__pulls, self.__total_rewards,
+                                      self.__sum_of_square_rewards)
+
+  @property
+  def pulls(self) -> int:
+    """number of pulls"""
+    return self.__pulls
+
+  @property
+  def total_rewards(self) -> float:
+    """total rewards"""
+    return self.__total_rewards
+
+  @property
+  def sum_of_square_rewards(self) -> float:
+    """sum of squared rewards"""
+    return self.__sum_of_square_rewards
+
+
 class Arm(ABC):
   """Arm"""
+  __slots__ = ('__name',)
 
   def __init__(self, name: Optional[str]):
     """
@@ -42,3 +179,17 @@ class Arm(ABC):
     Returns:
       rewards
     """
+
+  def pull_stats(self, pulls: int = 1) -> RewardStats:
+    """Pull the arm and only keep the sufficient statistics of the rewards
+
+    Subclasses should override this method if the statistics can be drawn
+    without generating the rewards one by one.
+
+    Args:
+      pulls: number of times to pull
+
+    Returns:
+      sufficient statistics of the rewards
+    """
+    return RewardStats.from_rewards(self.pull(pulls=pulls))
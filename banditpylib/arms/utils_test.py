@@ -0,0 +1,24 @@
+import numpy as np
+
+from .utils import CompensatedSum
+
+
+class TestCompensatedSum:
+  """Test compensated sum"""
+
+  def test_scalar_sum(self):
+    accumulator = CompensatedSum()
+    accumulator.add(1e16)
+    for _ in range(1000):
+      accumulator.add(1.0)
+    accumulator.add(-1e16)
+    # naive summation loses all the small values
+    assert accumulator.value == 1000
+
+  def test_array_sum(self):
+    accumulator = CompensatedSum(3)
+    accumulator.add(np.array([1e16, 0, 1]))
+    for _ in range(100):
+      accumulator.add(np.array([1.0, 0.1, 0]))
+    accumulator.add(-1e16, index=0)
+    assert np.allclose(accumulator.value, [100, 10, 1], rtol=0, atol=1e-12)
@@ -18,6 +18,7 @@ __all__ = [
     'CvarReward',
     'search_best_assortment',
     'local_search_best_assortment',
+    'multi_start_local_search_best_assortment',
     'OrdinaryMNLBandit',
     'ThresholdingBandit'
 ]
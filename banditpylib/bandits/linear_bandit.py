@@ -1,11 +1,13 @@
-from typing import List, Tuple
+import math
+from typing import Callable, List, Tuple, Union
 
 import numpy as np
 
-from banditpylib.arms import GaussianArm
+from banditpylib.arms import CompensatedSum
 from banditpylib.learners import Goal, BestArmId, MaxReward
 from .ordinary_bandit_itf import OrdinaryBanditItf
 from .linear_bandit_itf import LinearBanditItf
+from .utils import read_only_array
 
 
 class LinearBandit(OrdinaryBanditItf, LinearBanditItf):
@@ -15,41 +17,101 @@ class LinearBandit(OrdinaryBanditItf, LinearBanditItf):
   an `i.i.d.` reward from distribution :math:`\langle \theta, v_i \rangle
   + \epsilon`, where :math:`v_i` is the feature of arm :math:`i`, :math:`\theta`
   is an unknown parameter and :math:`\epsilon` is a zero-mean noise.
+
+  Both the realized regret and the expected regret
+  :math:`\sum_i n_i \Delta_i` are tracked, where :math:`n_i` is the number of
+  pulls of arm :math:`i` and :math:`\Delta_i` is its gap to the best arm.
+  `expected_regret` decides which one is reported by :func:`regret` by default.
+
+  The means of the arms, their gaps to the best arm and the arms sorted by
+  their means in descending order are computed once when the bandit is
+  constructed and exposed as read-only arrays.
+
+  The features are kept in one matrix and the means of all the arms are
+  computed with one matrix product. For huge action sets, the features can be
+  given by a function generating the features of any arms so that they are
+  never stored. No per-arm object is created in either case.
   """
 
   def __init__(self,
-               features: List[np.ndarray],
+               features: Union[np.ndarray, List[np.ndarray],
+                               Callable[[np.ndarray], np.ndarray]],
                theta: np.ndarray,
                var: float = 1.0,
-               name: str = None):
+               name: str = None,
+               expected_regret: bool = False,
+               arm_num: int = None,
+               block_size: int = 4096):
     """
     Args:
-      features: features of the arms
+      features: features of the arms. It is either a matrix whose rows are the
+        features of the arms, a list of feature vectors, or a function which
+        generates the features of a given array of arm ids as a matrix. In the
+        last case, the features are never stored and `arm_num` must be given.
       theta: parameter theta
       var: variance of noise
       name: alias name
+      expected_regret: whether to report the expected regret rather than the
+        realized regret by default
+      arm_num: number of arms. It is required when `features` is a function.
+      block_size: number of arms whose features are generated at a time when
+        `features` is a function
     """
     super().__init__(name)
-    if len(features) < 2:
-      raise Exception('Number of arms %d is less than 2!' % len(features))
-    for (i, feature) in enumerate(features):
-      if feature.shape != theta.shape:
-        raise Exception('Dimension of arm %d\'s feature %d does not equal to '
-                        'theta\'s %d!' % (i, len(feature), len(theta)))
-    self.__features = features
+    theta = np.asarray(theta, dtype=float)
+    if callable(features):
+      if arm_num is None:
+        raise Exception('Number of arms is required when features are '
+                        'generated!')
+      if block_size < 1:
+        raise Exception('Block size %d is less than 1!' % block_size)
+      self.__features = None
+      self.__feature_fn = features
+      self.__arm_num = arm_num
+      # means are computed block by block without keeping the features
+      means = np.zeros(arm_num)
+      for start in range(0, arm_num, block_size):
+        arm_ids = np.arange(start, min(arm_num, start + block_size))
+        means[arm_ids] = self.__check_features(features(arm_ids),
+                                               theta) @ theta
+    else:
+      self.__features = read_only_array(
+          self.__check_features(np.asarray(features, dtype=float), theta))
+      self.__feature_fn = None
+      self.__arm_num = len(self.__features)
+      # means of all the arms are computed with one matrix product
+      means = self.__features @ theta
+    if self.__arm_num < 2:
+      raise Exception('Number of arms %d is less than 2!' % self.__arm_num)
     self.__theta = theta
-    self.__arm_num = len(features)
 
     if var < 0:
       raise Exception('Variance of noise %d is less than 0!' % var)
     self.__var = var
-    # each arm in linear bandit can be seen as a Gaussian arm
-    self.__arms = [GaussianArm(np.dot(feature, self.__theta), self.__var) \
-                   for feature in self.__features]
-    self.__best_arm_id = max(
-        [(arm_id, arm.mean) for (arm_id, arm) in enumerate(self.__arms)],
-        key=lambda x: x[1])[0]
-    self.__best_arm = self.__arms[self.__best_arm_id]
+    self.__std = math.sqrt(var)
+    self.__means = read_only_array(means)
+    self.__best_arm_id = int(np.argmax(self.__means))
+    self.__best_mean = float(self.__means[self.__best_arm_id])
+    # gap between the mean of the best arm and the mean of each arm
+    self.__gaps = read_only_array(self.__best_mean - self.__means)
+    self.__sorted_arms = read_only_array(
+        np.argsort(-self.__means, kind='stable'))
+    self.__expected_regret = expected_regret
+
+  @staticmethod
+  def __check_features(features: np.ndarray, theta: np.ndarray) -> np.ndarray:
+    """
+    Args:
+      features: features of some arms
+      theta: parameter theta
+
+    Returns:
+      `features` if their dimension matches the dimension of `theta`
+    """
+    if features.ndim != 2 or features.shape[1] != len(theta):
+      raise Exception('Shape of features %s does not match theta\'s '
+                      'dimension %d!' % (features.shape, len(theta)))
+    return features
 
   def _name(self) -> str:
     """
@@ -68,19 +130,14 @@ class LinearBandit(OrdinaryBanditItf, LinearBanditItf):
     Returns:
       feedback where the first dimension denotes the stochastic rewards
     """
-    if arm_id not in range(self.__arm_num):
-      raise Exception('Arm id %d is out of range [0, %d)!' % \
-          (arm_id, self.__arm_num))
-    em_rewards = self.__arms[arm_id].pull(pulls)
-    if em_rewards is not None:
-      self.__regret += (self.__best_arm.mean * pulls - em_rewards)
-      self.__total_pulls += pulls
-    return (em_rewards, None)
+    return self.feed([(arm_id, pulls)])[0]
 
   def feed(self,
            actions: List[Tuple[int, int]]) -> List[Tuple[np.ndarray, None]]:
     """Pull multiple arms
 
+    The noises of all the pulls are drawn at once.
+
     Args:
       actions: for each tuple, the first dimension denotes the arm id and the
         second dimension is the number of times this arm will be pulled
@@ -88,10 +145,26 @@ class LinearBandit(OrdinaryBanditItf, LinearBanditItf):
     Returns:
       feedback. For each tuple, the first dimension is the stochatic rewards.
     """
-    feedback = []
-    for (arm_id, pulls) in actions:
-      feedback.append(self._take_action(arm_id, pulls))
-    return feedback
+    if not actions:
+      return []
+    arm_ids = np.array([arm_id for (arm_id, _) in actions])
+    pulls = np.array([pulls for (_, pulls) in actions], dtype=int)
+    if np.any((arm_ids < 0) | (arm_ids >= self.__arm_num)):
+      arm_id = arm_ids[(arm_ids < 0) | (arm_ids >= self.__arm_num)][0]
+      raise Exception('Arm id %d is out of range [0, %d)!' % \
+          (arm_id, self.__arm_num))
+    if np.any(pulls < 0):
+      raise Exception('Number of pulls %d is negative!' %
+                      pulls[pulls < 0][0])
+    total_pulls = int(np.sum(pulls))
+    rewards = self.__means[np.repeat(arm_ids, pulls)] + np.random.normal(
+        0, self.__std, total_pulls)
+    np.add.at(self.__arm_pulls, arm_ids, pulls)
+    self.__regret.add(self.__best_mean * total_pulls -
+                      rewards.sum(dtype=float))
+    self.__total_pulls += total_pulls
+    return [(em_rewards, None)
+            for em_rewards in np.split(rewards, np.cumsum(pulls)[:-1])]
 
   def reset(self):
     """Reset the bandit environment
@@ -100,7 +173,28 @@ class LinearBandit(OrdinaryBanditItf, LinearBanditItf):
       This function should be called before the start of the game.
     """
     self.__total_pulls = 0
-    self.__regret = 0.0
+    self.__arm_pulls = np.zeros(self.__arm_num, dtype=int)
+    self.__regret = CompensatedSum()
+
+  @property
+  def expected_regret(self) -> bool:
+    """whether the expected regret is reported by default"""
+    return self.__expected_regret
+
+  @property
+  def means(self) -> np.ndarray:
+    """means of the arms"""
+    return self.__means
+
+  @property
+  def gaps(self) -> np.ndarray:
+    """gaps between the mean of the best arm and the means of the arms"""
+    return self.__gaps
+
+  @property
+  def sorted_arms(self) -> np.ndarray:
+    """arms sorted by their means in descending order"""
+    return self.__sorted_arms
 
   def arm_num(self) -> int:
     """
@@ -116,12 +210,28 @@ class LinearBandit(OrdinaryBanditItf, LinearBanditItf):
     """
     return self.__total_pulls
 
-  def features(self) -> List[np.ndarray]:
+  def arm_pulls(self) -> np.ndarray:
     """
     Returns:
-      feature vectors
+      number of pulls of each arm
+    """
+    return self.__arm_pulls
+
+  def features(self, arm_ids: np.ndarray = None) -> np.ndarray:
+    """
+    Args:
+      arm_ids: arms whose features are returned. If it is `None`, the features
+        of all the arms are returned, which are generated in full when the
+        features are given by a function.
+
+    Returns:
+      feature vectors as rows of a matrix
     """
-    return self.__features
+    if arm_ids is None:
+      arm_ids = np.arange(self.__arm_num)
+    if self.__features is not None:
+      return self.__features[arm_ids]
+    return self.__feature_fn(np.asarray(arm_ids))
 
   def __best_arm_regret(self, arm_id) -> int:
     """
@@ -133,10 +243,13 @@ class LinearBandit(OrdinaryBanditItf, LinearBanditItf):
     """
     return int(self.__best_arm_id != arm_id)
 
-  def regret(self, goal: Goal) -> float:
+  def regret(self, goal: Goal, expected: bool = None) -> float:
     """
     Args:
       goal: goal of the learner
+      expected: whether to report the expected regret rather than the realized
+        regret when the goal is :class:`banditpylib.learners.MaxReward`. If it
+        is `None`, :attr:`expected_regret` is used.
 
     Returns:
       regret of the learner
@@ -144,5 +257,9 @@ class LinearBandit(OrdinaryBanditItf, LinearBanditItf):
     if isinstance(goal, BestArmId):
       return self.__best_arm_regret(goal.value)
     elif isinstance(goal, MaxReward):
-      return self.__regret
+      if expected is None:
+        expected = self.__expected_regret
+      if expected:
+        return float(self.__arm_pulls @ self.__gaps)
+      return self.__regret.value
     raise Exception('Goal %s is not supported!' % goal.name)
@@ -1,8 +1,8 @@
 from abc import abstractmethod
 
-from typing import List
-
 import numpy as np
+
+from banditpylib.learners import Goal
 from .utils import Bandit
 
 
@@ -24,10 +24,14 @@ class LinearBanditItf(Bandit):
     """
 
   @abstractmethod
-  def features(self) -> List[np.ndarray]:
+  def features(self, arm_ids: np.ndarray = None) -> np.ndarray:
     """
+    Args:
+      arm_ids: arms whose features are returned. If it is `None`, the features
+        of all the arms are returned.
+
     Returns:
-      feature vectors
+      feature vectors as rows of a matrix
     """
 
   @abstractmethod
@@ -36,3 +40,21 @@ class LinearBanditItf(Bandit):
     Returns:
       total number of pulls so far
     """
+
+  @property
+  @abstractmethod
+  def expected_regret(self) -> bool:
+    """whether the expected regret is reported by :func:`regret` by default"""
+
+  @abstractmethod
+  def regret(self, goal: Goal, expected: bool = None) -> float:
+    """
+    Args:
+      goal: goal of the learner
+      expected: whether to report the expected regret rather than the realized
+        regret when the goal is :class:`banditpylib.learners.MaxReward`. If it
+        is `None`, :attr:`expected_regret` is used.
+
+    Returns:
+      regret of the learner
+    """
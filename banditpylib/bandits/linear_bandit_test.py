@@ -1,6 +1,6 @@
 import numpy as np
 
-from banditpylib.learners import BestArmId
+from banditpylib.learners import BestArmId, MaxReward
 from .linear_bandit import LinearBandit
 
 
@@ -13,3 +13,38 @@ class TestLinearBandit:
     linear_bandit = LinearBandit(features, theta)
     linear_bandit.reset()
     assert linear_bandit.regret(BestArmId(best_arm=0)) == 1
+
+  def test_generated_features(self):
+    features = np.random.random((100, 5))
+    theta = np.random.random(5)
+    linear_bandit = LinearBandit(features, theta, var=0)
+    # features generated block by block give the same arm table
+    generated_linear_bandit = LinearBandit(lambda arm_ids: features[arm_ids],
+                                           theta,
+                                           var=0,
+                                           arm_num=100,
+                                           block_size=7)
+    assert np.allclose(linear_bandit.means, generated_linear_bandit.means)
+    assert np.allclose(generated_linear_bandit.features([3, 5]),
+                       features[[3, 5]])
+
+  def test_feed(self):
+    features = np.array([[0, 1], [1, 0]])
+    theta = np.array([1, 0])
+    linear_bandit = LinearBandit(features, theta, var=0)
+    linear_bandit.reset()
+    feedback = linear_bandit.feed([(0, 2), (1, 3)])
+    assert list(feedback[0][0]) == [0, 0]
+    assert list(feedback[1][0]) == [1, 1, 1]
+    assert linear_bandit.regret(MaxReward()) == 2
+
+  def test_expected_regret(self):
+    features = np.array([[0, 1], [1, 0]])
+    theta = np.array([1, 0])
+    linear_bandit = LinearBandit(features, theta, expected_regret=True)
+    assert linear_bandit.expected_regret
+    linear_bandit.reset()
+    linear_bandit.feed([(0, 3), (1, 2)])
+    # arm 0 has gap 1
+    assert linear_bandit.regret(MaxReward()) == 3
+    assert linear_bandit.regret(MaxReward(), expected=True) == 3
@@ -1,10 +1,11 @@
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
 
 import numpy as np
 
-from banditpylib.arms import Arm
+from banditpylib.arms import Arm, CompensatedSum, RewardStats
 from banditpylib.learners import Goal, BestArmId, MaxReward
 from .ordinary_bandit_itf import OrdinaryBanditItf
+from .utils import read_only_array
 
 
 class OrdinaryBandit(OrdinaryBanditItf):
@@ -13,24 +14,56 @@ class OrdinaryBandit(OrdinaryBanditItf):
   Arms are indexed from 0 by default. Each pull of arm :math:`i` will generate
   an `i.i.d.` reward from distribution :math:`\mathcal{D}_i`, which is unknown
   beforehand.
+
+  When `stats_feedback` is set, the feedback of pulling an arm is the
+  :class:`banditpylib.arms.RewardStats` of the rewards rather than the rewards
+  themselves, which are drawn by :func:`banditpylib.arms.Arm.pull_stats` without
+  generating the rewards one by one. This is only suitable for learners which
+  only need the number of pulls, the total rewards and the sum of squared
+  rewards of each arm.
+
+  Both the realized regret i.e., the total rewards of the best arm minus the
+  total rewards obtained, and the expected regret i.e.,
+  :math:`\sum_i n_i \Delta_i` where :math:`n_i` is the number of pulls of arm
+  :math:`i` and :math:`\Delta_i` is its gap to the best arm, are tracked. The
+  expected regret does not depend on the sampled rewards and hence has much
+  lower variance. `expected_regret` decides which one is reported by
+  :func:`regret` by default.
+
+  The means of the arms, their gaps to the best arm and the arms sorted by
+  their means in descending order are computed once when the bandit is
+  constructed and exposed as read-only arrays.
   """
 
-  def __init__(self, arms: List[Arm], name: str = None):
+  def __init__(self,
+               arms: List[Arm],
+               name: str = None,
+               stats_feedback: bool = False,
+               expected_regret: bool = False):
     """
     Args:
       arms: arms in ordinary bandit
       name: alias name
+      stats_feedback: whether to return sufficient statistics of the rewards as
+        feedback
+      expected_regret: whether to report the expected regret rather than the
+        realized regret by default
     """
     super().__init__(name)
     if len(arms) < 2:
       raise Exception('The number of arms %d is less than 2!' % len(arms))
     self.__arms = arms
     self.__arm_num = len(arms)
+    self.__means = read_only_array([arm.mean for arm in arms])
     # find the best arm
-    self.__best_arm_id = max(
-        [(arm_id, arm.mean) for (arm_id, arm) in enumerate(self.__arms)],
-        key=lambda x: x[1])[0]
+    self.__best_arm_id = int(np.argmax(self.__means))
     self.__best_arm = self.__arms[self.__best_arm_id]
+    # gap between the mean of the best arm and the mean of each arm
+    self.__gaps = read_only_array(self.__best_arm.mean - self.__means)
+    self.__sorted_arms = read_only_array(
+        np.argsort(-self.__means, kind='stable'))
+    self.__stats_feedback = stats_feedback
+    self.__expected_regret = expected_regret
 
   def _name(self) -> str:
     """
@@ -40,7 +73,7 @@ class OrdinaryBandit(OrdinaryBanditItf):
     return 'ordinary_bandit'
 
   def _take_action(self, arm_id: int, pulls: int) -> \
-      Optional[Tuple[np.ndarray, None]]:
+      Optional[Tuple[Union[np.ndarray, RewardStats], None]]:
     """Pull one arm
 
     Args:
@@ -49,21 +82,29 @@ class OrdinaryBandit(OrdinaryBanditItf):
 
     Returns:
       stochastic rewards after `arm_id` is pulled. The first element is the
-        stochstic rewards. `None` is returned if `pulls` is less than 1.
+        stochstic rewards or their sufficient statistics. `None` is returned if
+        `pulls` is less than 1.
     """
     if arm_id not in range(self.__arm_num):
       raise Exception('Arm id %d is out of range [0, %d)!' % \
           (arm_id, self.__arm_num))
     if pulls < 1:
       return None
+    self.__arm_pulls[arm_id] += pulls
+    if self.__stats_feedback:
+      stats = self.__arms[arm_id].pull_stats(pulls=pulls)
+      self.__regret.add(self.__best_arm.mean * pulls - stats.total_rewards)
+      self.__total_pulls += pulls
+      return (stats, None)
     # empirical rewards when `arm_id` is pulled for `pulls` times
     em_rewards = self.__arms[arm_id].pull(pulls=pulls)
-    self.__regret += (self.__best_arm.mean * pulls - sum(em_rewards))
+    self.__regret.add(self.__best_arm.mean * pulls -
+                      em_rewards.sum(dtype=float))
     self.__total_pulls += pulls
     return (em_rewards, None)
 
   def feed(self, actions: List[Tuple[int, int]]) -> \
-      List[Tuple[np.ndarray, None]]:
+      List[Tuple[Union[np.ndarray, RewardStats], None]]:
     """Pull multiple arms
 
     Args:
@@ -81,6 +122,63 @@ class OrdinaryBandit(OrdinaryBanditItf):
         feedback.append(stochastic_rewards)
     return feedback
 
+  def batch_pull(self, arm_ids: np.ndarray) -> np.ndarray:
+    """Pull one arm in each of a batch of independent trials
+
+    The state of the bandit environment is not changed. This method is used to
+    simulate many trials of the game in lockstep.
+
+    Args:
+      arm_ids: arm to pull in each trial
+
+    Returns:
+      stochastic reward of each trial
+    """
+    arm_ids = np.asarray(arm_ids)
+    if np.any((arm_ids < 0) | (arm_ids >= self.__arm_num)):
+      raise Exception('Arm ids are out of range [0, %d)!' % self.__arm_num)
+    rewards = np.zeros(len(arm_ids))
+    # group the trials by the arm they pull so that each arm is pulled only once
+    order = np.argsort(arm_ids, kind='stable')
+    pulls = np.bincount(arm_ids, minlength=self.__arm_num)
+    start = 0
+    for arm_id in np.flatnonzero(pulls):
+      end = start + pulls[arm_id]
+      rewards[order[start:end]] = self.__arms[arm_id].pull(pulls=pulls[arm_id])
+      start = end
+    return rewards
+
+  def batch_regret(self, total_rewards: np.ndarray,
+                   total_pulls: int) -> np.ndarray:
+    """Regrets of a batch of independent trials with goal
+    :class:`banditpylib.learners.MaxReward`
+
+    Args:
+      total_rewards: total rewards obtained in each trial
+      total_pulls: total number of pulls in each trial
+
+    Returns:
+      regret of each trial
+    """
+    return self.__best_arm.mean * total_pulls - np.asarray(total_rewards)
+
+  def batch_expected_regret(self, arm_pulls: np.ndarray) -> np.ndarray:
+    """Expected regrets of a batch of independent trials with goal
+    :class:`banditpylib.learners.MaxReward`
+
+    Args:
+      arm_pulls: number of pulls of each arm in each trial
+
+    Returns:
+      expected regret of each trial
+    """
+    return np.asarray(arm_pulls) @ self.__gaps
+
+  @property
+  def expected_regret(self) -> bool:
+    """whether the expected regret is reported by default"""
+    return self.__expected_regret
+
   def reset(self):
     """Reset the bandit environment
 
@@ -88,7 +186,23 @@ class OrdinaryBandit(OrdinaryBanditItf):
       This function should be called before the start of the game.
     """
     self.__total_pulls = 0
-    self.__regret = 0.0
+    self.__arm_pulls = np.zeros(self.__arm_num, dtype=int)
+    self.__regret = CompensatedSum()
+
+  @property
+  def means(self) -> np.ndarray:
+    """means of the arms"""
+    return self.__means
+
+  @property
+  def gaps(self) -> np.ndarray:
+    """gaps between the mean of the best arm and the means of the arms"""
+    return self.__gaps
+
+  @property
+  def sorted_arms(self) -> np.ndarray:
+    """arms sorted by their means in descending order"""
+    return self.__sorted_arms
 
   def arm_num(self) -> int:
     """
@@ -104,6 +218,13 @@ class OrdinaryBandit(OrdinaryBanditItf):
     """
     return self.__total_pulls
 
+  def arm_pulls(self) -> np.ndarray:
+    """
+    Returns:
+      number of pulls of each arm
+    """
+    return self.__arm_pulls
+
   def __best_arm_regret(self, arm_id: int) -> int:
     """
     Args:
@@ -114,10 +235,13 @@ class OrdinaryBandit(OrdinaryBanditItf):
     """
     return int(self.__best_arm_id != arm_id)
 
-  def regret(self, goal: Goal) -> float:
+  def regret(self, goal: Goal, expected: bool = None) -> float:
     """
     Args:
       goal: goal of the learner
+      expected: whether to report the expected regret rather than the realized
+        regret when the goal is :class:`banditpylib.learners.MaxReward`. If it
+        is `None`, :attr:`expected_regret` is used.
 
     Returns:
       regret of the learner
@@ -125,5 +249,9 @@ class OrdinaryBandit(OrdinaryBanditItf):
     if isinstance(goal, BestArmId):
       return self.__best_arm_regret(goal.value)
     elif isinstance(goal, MaxReward):
-      return self.__regret
+      if expected is None:
+        expected = self.__expected_regret
+      if expected:
+        return float(self.__arm_pulls @ self.__gaps)
+      return self.__regret.value
     raise Exception('Goal %s is not supported!' % goal.name)
@@ -1,5 +1,6 @@
 from abc import abstractmethod
 
+from banditpylib.learners import Goal
 from .utils import Bandit
 
 
@@ -26,3 +27,21 @@ class OrdinaryBanditItf(Bandit):
     Returns:
       total number of pulls
     """
+
+  @property
+  @abstractmethod
+  def expected_regret(self) -> bool:
+    """whether the expected regret is reported by :func:`regret` by default"""
+
+  @abstractmethod
+  def regret(self, goal: Goal, expected: bool = None) -> float:
+    """
+    Args:
+      goal: goal of the learner
+      expected: whether to report the expected regret rather than the realized
+        regret when the goal is :class:`banditpylib.learners.MaxReward`. If it
+        is `None`, :attr:`expected_regret` is used.
+
+    Returns:
+      regret of the learner
+    """
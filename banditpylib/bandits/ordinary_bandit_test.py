@@ -1,3 +1,5 @@
+import numpy as np
+
 from banditpylib.arms import BernoulliArm
 from banditpylib.learners import MaxReward, BestArmId
 from .ordinary_bandit import OrdinaryBandit
@@ -15,3 +17,52 @@ class TestOrdinaryBandit:
     ordinary_bandit.feed([(0, 100)])
     assert ordinary_bandit.regret(MaxReward()) == 100
     assert ordinary_bandit.regret(BestArmId(best_arm=1)) == 0
+
+  def test_batch_pull(self):
+    means = [0, 1]
+    arms = [BernoulliArm(mean) for mean in means]
+    ordinary_bandit = OrdinaryBandit(arms)
+    rewards = ordinary_bandit.batch_pull(np.array([1, 0, 1, 1]))
+    assert list(rewards) == [1, 0, 1, 1]
+    assert list(ordinary_bandit.batch_regret(rewards, 1)) == [0, 1, 0, 0]
+
+  def test_stats_feedback(self):
+    means = [0, 1]
+    arms = [BernoulliArm(mean) for mean in means]
+    ordinary_bandit = OrdinaryBandit(arms, stats_feedback=True)
+    ordinary_bandit.reset()
+    feedback = ordinary_bandit.feed([(0, 100), (1, 10**9)])
+    assert len(feedback[0][0]) == 100
+    assert feedback[1][0].total_rewards == 10**9
+    assert feedback[1][0].sum_of_square_rewards == 10**9
+    assert ordinary_bandit.regret(MaxReward()) == 100
+
+  def test_expected_regret(self):
+    means = [0.2, 0.5, 0.7]
+    arms = [BernoulliArm(mean) for mean in means]
+    ordinary_bandit = OrdinaryBandit(arms, expected_regret=True)
+    assert ordinary_bandit.expected_regret
+    ordinary_bandit.reset()
+    ordinary_bandit.feed([(0, 10), (1, 20), (2, 30)])
+    assert list(ordinary_bandit.arm_pulls()) == [10, 20, 30]
+    assert np.isclose(ordinary_bandit.regret(MaxReward()), 9)
+    assert np.allclose(
+        ordinary_bandit.batch_expected_regret(np.array([[1, 0, 0], [0, 0,
+                                                                    1]])),
+        [0.5, 0])
+    # deterministic rewards make the realized regret equal to the expected one
+    arms = [BernoulliArm(mean) for mean in [0, 1]]
+    ordinary_bandit = OrdinaryBandit(arms)
+    ordinary_bandit.reset()
+    ordinary_bandit.feed([(0, 10), (1, 20)])
+    assert ordinary_bandit.regret(MaxReward()) == \
+        ordinary_bandit.regret(MaxReward(), expected=True) == 10
+
+  def test_arm_table(self):
+    means = [0.5, 0.7, 0.2]
+    arms = [BernoulliArm(mean) for mean in means]
+    ordinary_bandit = OrdinaryBandit(arms)
+    assert list(ordinary_bandit.sorted_arms) == [1, 0, 2]
+    assert np.allclose(ordinary_bandit.gaps, [0.2, 0, 0.5])
+    # the table is read-only
+    assert not ordinary_bandit.means.flags.writeable
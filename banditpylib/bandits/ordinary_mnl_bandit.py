@@ -1,7 +1,13 @@
 from abc import abstractmethod
 
 import copy
-from typing import List, Tuple, Set, Optional
+import itertools
+from collections import OrderedDict
+import multiprocessing
+from multiprocessing import Pool
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, \
+    Set, Optional
 
 from absl import logging
 
@@ -40,16 +46,126 @@ def search(assortments: List[Set[int]],
          restricted_products)
 
 
+def iter_assortments(
+    product_num: int,
+    card_limit: int = np.inf,
+    restricted_products: Set[int] = None,
+    prune: Callable[[Tuple[int, ...], int], bool] = None
+) -> Iterator[Tuple[int, ...]]:
+  """Lazily enumerate all assortments satisfying cardinality limit
+
+  Assortments are yielded in the same order as :func:`search`.
+
+  Args:
+    product_num: total number of products
+    card_limit: cardinality limit
+    restricted_products: products can only be selected from this restricted set
+    prune: a function called with the current assortment and the next product
+      to consider before exploring further. If it returns `True`, none of the
+      assortments extending the current one with products no less than the
+      next product is yielded.
+
+  Returns:
+    assortments as sorted tuples of product ids
+  """
+  # each entry is (next product to consider, current assortment)
+  stack: List[Tuple[int, Tuple[int, ...]]] = [(1, ())]
+  while stack:
+    (next_product_id, assortment) = stack.pop()
+    if next_product_id == (product_num + 1):
+      # ignore empty assortment
+      if assortment:
+        yield assortment
+      continue
+    if prune is not None and prune(assortment, next_product_id):
+      continue
+    # push the branch excluding the next product first so that the branch
+    # including it is explored first
+    stack.append((next_product_id + 1, assortment))
+    if len(assortment) < card_limit and (
+        restricted_products is None or next_product_id in restricted_products):
+      stack.append((next_product_id + 1, assortment + (next_product_id, )))
+
+
+def sample_assortment(product_num: int, card_limit: int = np.inf) -> Set[int]:
+  """Uniformly sample one assortment satisfying cardinality limit
+
+  The size of the assortment is sampled with probability proportional to the
+  number of assortments of that size and then the products are sampled
+  uniformly without replacement, so that no assortment is enumerated.
+
+  Args:
+    product_num: total number of products
+    card_limit: cardinality limit
+
+  Returns:
+    sampled assortment
+  """
+  max_size = int(min(card_limit, product_num))
+  if max_size < 1:
+    raise Exception('Cardinality limit %d is less than 1!' % max_size)
+  # numbers of assortments of size 1, 2, ..., `max_size` computed by
+  # C(n, k) = C(n, k - 1) * (n - k + 1) / k with exact integer arithmetic
+  counts = [product_num]
+  for size in range(2, max_size + 1):
+    counts.append(counts[-1] * (product_num - size + 1) // size)
+  total = sum(counts)
+  size = np.random.choice(max_size, p=[count / total for count in counts]) + 1
+  return set((np.random.choice(product_num, size, replace=False) +
+              1).tolist())
+
+
+def assortment_masks(assortments: List[Iterable[int]],
+                     product_num: int) -> np.ndarray:
+  """Convert assortments to a mask matrix
+
+  Args:
+    assortments: assortments to convert
+    product_num: total number of products
+
+  Returns:
+    boolean matrix of shape (number of assortments, `product_num` + 1) where
+    entry (i, j) denotes whether product j is in the i-th assortment. Column 0
+    is always `False`.
+  """
+  assortments = [list(assortment) for assortment in assortments]
+  masks = np.zeros((len(assortments), product_num + 1), dtype=bool)
+  rows = np.repeat(np.arange(len(assortments)),
+                   [len(assortment) for assortment in assortments])
+  masks[rows, np.fromiter(itertools.chain.from_iterable(assortments),
+                          dtype=int, count=len(rows))] = True
+  return masks
+
+
 class Reward:
-  """General reward class"""
-  def __init__(self, name: Optional[str]):
+  """General reward class
+
+  Rewards of assortments are memoized in a bounded LRU cache keyed on the
+  bitmasks of the assortments. The cache is invalidated once the preference
+  parameters or the revenues are changed, which is tracked by :attr:`version`.
+
+  .. warning::
+    The cache is not thread-safe so a reward should not be shared by threads.
+  """
+  def __init__(self, name: Optional[str], cache_size: int = 100000):
     """
     Args:
       name: alias name
+      cache_size: maximum number of rewards to memoize. 0 means no memoization.
     """
+    if cache_size < 0:
+      raise Exception('Cache size %d is less than 0!' % cache_size)
     self.__name = self._name() if name is None else name
     self.__preference_params = None
     self.__revenues = None
+    # preference parameters and revenues as lists together with the products
+    # in descending order of revenue, which are used to compute bounds
+    self.__bound_tables: Tuple[List[float], List[float], List[int]] = None
+    self.__cache_size = cache_size
+    self.__cache: Dict[int, float] = OrderedDict()
+    self.__cache_hits = 0
+    self.__cache_misses = 0
+    self.__version = 0
 
   @property
   def name(self) -> str:
@@ -64,6 +180,15 @@ class Reward:
     """
 
   @abstractmethod
+  def _calc(self, assortment: Set[int]) -> float:
+    """
+    Args:
+      assortment: assortment to calculate
+
+    Returns:
+      reward of the assortment
+    """
+
   def calc(self, assortment: Set[int]) -> float:
     """
     Args:
@@ -72,6 +197,105 @@ class Reward:
     Returns:
       reward of the assortment
     """
+    if self.__cache_size == 0:
+      return self._calc(assortment)
+    key = 0
+    for product in assortment:
+      key |= 1 << int(product)
+    if key in self.__cache:
+      self.__cache_hits += 1
+      self.__cache.move_to_end(key)
+      return self.__cache[key]
+    self.__cache_misses += 1
+    reward = self._calc(assortment)
+    self.__cache[key] = reward
+    if len(self.__cache) > self.__cache_size:
+      self.__cache.popitem(last=False)
+    return reward
+
+  def batch_calc(self, masks: np.ndarray) -> np.ndarray:
+    """Calculate rewards of many assortments at once
+
+    By default, :func:`calc` is called for each assortment.
+
+    Args:
+      masks: boolean matrix of shape (number of assortments, number of
+        products + 1) where entry (i, j) denotes whether product j is in the
+        i-th assortment. Column 0 is ignored. See :func:`assortment_masks`.
+
+    Returns:
+      rewards of the assortments
+    """
+    masks = np.asarray(masks, dtype=bool)
+    return np.array(
+        [self.calc(set(np.flatnonzero(mask[1:]) + 1)) for mask in masks],
+        dtype=float)
+
+  @property
+  def version(self) -> int:
+    """number of times the preference parameters or the revenues are changed"""
+    return self.__version
+
+  def cache_info(self) -> Dict[str, int]:
+    """
+    Returns:
+      number of cache hits, number of cache misses and number of memoized
+      rewards
+    """
+    return {
+        'hits': self.__cache_hits,
+        'misses': self.__cache_misses,
+        'size': len(self.__cache)
+    }
+
+  def __invalidate(self):
+    """Invalidate memoized rewards"""
+    self.__version += 1
+    self.__cache.clear()
+    self.__bound_tables = None
+
+  def _mean_reward_upper_bound(self, assortment: Tuple[int, ...],
+                               next_product_id: int) -> float:
+    """Maximum mean reward of assortments extending an assortment
+
+    Products are sorted by revenue once per update of the parameters rather
+    than whenever the bound is computed.
+
+    Args:
+      assortment: assortment to extend
+      next_product_id: products no less than this one can be added to
+        `assortment`
+
+    Returns:
+      see :func:`mean_reward_upper_bound`
+    """
+    if self.__bound_tables is None:
+      self.__bound_tables = (
+          self.preference_params.tolist(), self.revenues.tolist(),
+          (np.argsort(-self.revenues[1:], kind='stable') + 1).tolist())
+    preference_params, revenues, products_by_revenue = self.__bound_tables
+    return mean_reward_upper_bound(preference_params, revenues, assortment,
+                                   next_product_id, products_by_revenue)
+
+  def upper_bound(self, assortment: Tuple[int, ...],
+                  next_product_id: int) -> float:
+    """Upper bound of the rewards of assortments extending an assortment
+
+    This is used to prune the search of the best assortment. By default, no
+    bound is known.
+
+    Args:
+      assortment: assortment to extend
+      next_product_id: products no less than this one can be added to
+        `assortment`
+
+    Returns:
+      upper bound of the rewards of the assortments containing `assortment`
+      and contained in the union of `assortment` and the products no less than
+      `next_product_id`
+    """
+    del assortment, next_product_id
+    return np.inf
 
   @property
   def preference_params(self) -> np.ndarray:
@@ -92,24 +316,76 @@ class Reward:
     Args:
       preference_params: preference parameters of products
     """
-    self.__preference_params = preference_params
+    if self.__preference_params is not None and np.array_equal(
+        self.__preference_params, preference_params):
+      return
+    # keep a copy so that the parameters can not be changed from outside
+    self.__preference_params = np.array(preference_params)
+    self.__invalidate()
 
   def set_revenues(self, revenues: np.ndarray):
     """
     Args:
       revenues: revenues of products
     """
-    self.__revenues = revenues
+    if self.__revenues is not None and np.array_equal(self.__revenues,
+                                                      revenues):
+      return
+    # keep a copy so that the revenues can not be changed from outside
+    self.__revenues = np.array(revenues)
+    self.__invalidate()
+
+
+def mean_reward_upper_bound(preference_params: Sequence[float],
+                            revenues: Sequence[float],
+                            assortment: Tuple[int, ...], next_product_id: int,
+                            products_by_revenue: List[int]) -> float:
+  """Maximum mean reward of assortments extending an assortment
+
+  Ignoring cardinality limit, the best assortment is formed by adding the
+  candidates in decreasing order of revenue as long as the revenue is greater
+  than the current mean reward. The products are sorted in advance so the
+  scan stops at the first product whose revenue is too small.
+
+  Args:
+    preference_params: preference parameters (product 0 is included)
+    revenues: revenues (product 0 is included)
+    assortment: assortment to extend
+    next_product_id: products no less than this one can be added to
+      `assortment`
+    products_by_revenue: products in descending order of revenue
+
+  Returns:
+    maximum mean reward of the assortments containing `assortment` and
+    contained in the union of `assortment` and the products no less than
+    `next_product_id`
+  """
+  weighted_revenue = 0.0
+  preference_params_sum = preference_params[0]
+  for product in assortment:
+    weighted_revenue += preference_params[product] * revenues[product]
+    preference_params_sum += preference_params[product]
+  mean_reward = weighted_revenue / preference_params_sum
+  for product in products_by_revenue:
+    if revenues[product] <= mean_reward:
+      break
+    if product < next_product_id:
+      continue
+    weighted_revenue += preference_params[product] * revenues[product]
+    preference_params_sum += preference_params[product]
+    mean_reward = weighted_revenue / preference_params_sum
+  return mean_reward
 
 
 class MeanReward(Reward):
   """Mean reward"""
-  def __init__(self, name: str = None):
+  def __init__(self, name: str = None, cache_size: int = 100000):
     """
     Args:
       name: alias name
+      cache_size: maximum number of rewards to memoize. 0 means no memoization.
     """
-    super().__init__(name)
+    super().__init__(name, cache_size)
 
   def _name(self) -> str:
     """
@@ -118,7 +394,7 @@ class MeanReward(Reward):
     """
     return 'mean_reward'
 
-  def calc(self, assortment: Set[int]) -> float:
+  def _calc(self, assortment: Set[int]) -> float:
     """
     Args:
       assortment: assortment to calculate
@@ -134,16 +410,49 @@ class MeanReward(Reward):
         self.revenues[product] for product in assortment
     ])
 
+  def batch_calc(self, masks: np.ndarray) -> np.ndarray:
+    """Calculate rewards of many assortments at once
+
+    Args:
+      masks: boolean matrix of shape (number of assortments, number of
+        products + 1) where entry (i, j) denotes whether product j is in the
+        i-th assortment. Column 0 is ignored. See :func:`assortment_masks`.
+
+    Returns:
+      rewards of the assortments
+    """
+    preference_params = np.asarray(self.preference_params, dtype=float)
+    weights = np.asarray(masks, dtype=bool)[:, 1:] * preference_params[1:]
+    return weights.dot(np.asarray(self.revenues, dtype=float)[1:]) / (
+        np.sum(weights, axis=1) + preference_params[0])
+
+  def upper_bound(self, assortment: Tuple[int, ...],
+                  next_product_id: int) -> float:
+    """Upper bound of the rewards of assortments extending an assortment
+
+    Args:
+      assortment: assortment to extend
+      next_product_id: products no less than this one can be added to
+        `assortment`
+
+    Returns:
+      upper bound of the rewards of the assortments containing `assortment`
+      and contained in the union of `assortment` and the products no less
+      than `next_product_id`
+    """
+    return self._mean_reward_upper_bound(assortment, next_product_id)
+
 
 class CvarReward(Reward):
   """CVaR reward"""
-  def __init__(self, alpha: float, name: str = None):
+  def __init__(self, alpha: float, name: str = None, cache_size: int = 100000):
     """
     Args:
       alpha: percentile of cvar
       name: alias name
+      cache_size: maximum number of rewards to memoize. 0 means no memoization.
     """
-    super().__init__(name)
+    super().__init__(name, cache_size)
     if alpha <= 0:
       raise Exception('Alpha %.2f is no greater than 0!' % alpha)
     # alpha is at most 1.0
@@ -151,6 +460,10 @@ class CvarReward(Reward):
       logging.error(
           'Alpha %.2f is greater than 1! I am setting it to 1.' % alpha)
     self.__alpha = alpha if alpha <= 1.0 else 1.0
+    # revenues sorted in increasing order, which are updated lazily
+    self.__revenue_order_version = -1
+    self.__revenues_array = np.zeros(0)
+    self.__revenue_order = np.zeros(0, dtype=int)
 
   def _name(self) -> str:
     """
@@ -164,7 +477,7 @@ class CvarReward(Reward):
     """percentile of cvar"""
     return self.__alpha
 
-  def calc(self, assortment: Set[int]) -> float:
+  def _calc(self, assortment: Set[int]) -> float:
     """
     Args:
       assortment: assortment to calculate
@@ -203,20 +516,169 @@ class CvarReward(Reward):
     cvar_alpha /= self.__alpha
     return cvar_alpha
 
+  def batch_calc(self, masks: np.ndarray) -> np.ndarray:
+    """Calculate rewards of many assortments at once
+
+    After the products are sorted in increasing order of revenue, the
+    probability mass of each product within the lowest `alpha` quantile is the
+    increment of the cumulative probabilities clipped at `alpha`. The order of
+    revenues is computed once and reused until the revenues change.
+
+    Args:
+      masks: boolean matrix of shape (number of assortments, number of
+        products + 1) where entry (i, j) denotes whether product j is in the
+        i-th assortment. Column 0 is ignored. See :func:`assortment_masks`.
+
+    Returns:
+      rewards of the assortments
+    """
+    if self.__revenue_order_version != self.version:
+      self.__revenues_array = np.asarray(self.revenues, dtype=float)
+      self.__revenue_order = np.argsort(self.__revenues_array, kind='stable')
+      self.__revenue_order_version = self.version
+    masks = np.array(masks, dtype=bool)
+    # non-purchase is always available
+    masks[:, 0] = True
+    weights = masks * np.asarray(self.preference_params, dtype=float)
+    probs = weights[:, self.__revenue_order] / np.sum(
+        weights, axis=1, keepdims=True)
+    quantile_probs = np.diff(np.minimum(np.cumsum(probs, axis=1),
+                                        self.__alpha),
+                             axis=1,
+                             prepend=0)
+    return quantile_probs.dot(
+        self.__revenues_array[self.__revenue_order]) / self.__alpha
+
+  def upper_bound(self, assortment: Tuple[int, ...],
+                  next_product_id: int) -> float:
+    """Upper bound of the rewards of assortments extending an assortment
+
+    CVaR is no greater than the mean, so the maximum mean reward is used as the
+    bound.
+
+    Args:
+      assortment: assortment to extend
+      next_product_id: products no less than this one can be added to
+        `assortment`
 
-def search_best_assortment(reward: Reward,
-                           card_limit: int = np.inf) -> Tuple[float, Set[int]]:
+    Returns:
+      upper bound of the rewards of the assortments containing `assortment`
+      and contained in the union of `assortment` and the products no less
+      than `next_product_id`
+    """
+    return self._mean_reward_upper_bound(assortment, next_product_id)
+
+
+def capacitated_best_assortment(reward: MeanReward,
+                                card_limit: int) -> Tuple[float, Set[int]]:
+  r"""Search assortment with the maximum mean reward under cardinality
+  constraint :cite:`rusmevichientong2010dynamic`
+
+  The maximum mean reward :math:`z^*` is the root of the decreasing function
+
+  .. math::
+    g(z) = \max_{|S| \leq K} \sum_{i \in S} v_i (r_i - z) - v_0 z
+
+  and the best assortment consists of the top :math:`K` products with positive
+  :math:`v_i (r_i - z^*)`. The order of :math:`v_i (r_i - z)` only changes
+  at :math:`z = r_i` or where two of them intersect. Hence :math:`z^*` is
+  located by binary search over these breakpoints and the best assortment is
+  read off the interval containing :math:`z^*`, which takes
+  :math:`O(N^2 \log N)` time in total.
+
+  Args:
+    reward: mean reward definition
+    card_limit: cardinality constraint
+
+  Returns:
+    assortment with the maximum reward
+  """
+  preference_params = np.asarray(reward.preference_params, dtype=float)
+  revenues = np.asarray(reward.revenues, dtype=float)
+  products = np.flatnonzero(preference_params[1:] > 0) + 1
+  if len(products) == 0:
+    # all the assortments have reward 0
+    best_assortment = {int(np.argmax(revenues[1:])) + 1}
+    return (reward.calc(best_assortment), best_assortment)
+  params, weighted_revenues = preference_params[products], (
+      preference_params * revenues)[products]
+
+  def top_products(z: float) -> np.ndarray:
+    """
+    Args:
+      z: parameter
+
+    Returns:
+      indexes of the top products with positive :math:`v_i (r_i - z)`
+    """
+    values = weighted_revenues - params * z
+    positive = np.flatnonzero(values > 0)
+    if len(positive) > card_limit:
+      positive = positive[np.argpartition(-values[positive],
+                                          card_limit - 1)[:card_limit]]
+    return positive
+
+  def g(z: float) -> float:
+    """
+    Args:
+      z: parameter
+
+    Returns:
+      value of :math:`g(z)`
+    """
+    top = top_products(z)
+    return np.sum(weighted_revenues[top] -
+                  params[top] * z) - preference_params[0] * z
+
+  max_revenue = np.max(revenues[products])
+  # intersections of each pair of products
+  (i, j) = np.triu_indices(len(products), k=1)
+  slope_diffs = params[i] - params[j]
+  crossing = slope_diffs != 0
+  intersections = (weighted_revenues[i][crossing] -
+                   weighted_revenues[j][crossing]) / slope_diffs[crossing]
+  breakpoints = np.unique(
+      np.concatenate(([0.0, max_revenue], revenues[products], intersections)))
+  breakpoints = breakpoints[(breakpoints >= 0) & (breakpoints <= max_revenue)]
+  # g(0) >= 0 and g(max_revenue) < 0 so find the last breakpoint where g is
+  # non-negative
+  (low, high) = (0, len(breakpoints) - 1)
+  while high - low > 1:
+    mid = (low + high) // 2
+    if g(breakpoints[mid]) >= 0:
+      low = mid
+    else:
+      high = mid
+  best_assortment = set(
+      products[top_products(
+          (breakpoints[low] + breakpoints[high]) / 2)].tolist())
+  return (reward.calc(best_assortment), best_assortment)
+
+
+def search_best_assortment(
+    reward: Reward,
+    card_limit: int = np.inf,
+    batch_size: int = 1024,
+    prune_min_candidates: int = 4) -> Tuple[float, Set[int]]:
   """Search assortment with the maximum reward
 
+  Subtrees of the search are pruned via :func:`Reward.upper_bound` once a
+  reward has been found. The bound is only checked for non-empty assortments
+  which can still be extended by at least `prune_min_candidates` products,
+  since smaller subtrees are cheaper to score than to bound.
+
   Args:
     reward: reward definition
     card_limit: cardinality constraint
+    batch_size: number of assortments scored at once via
+      :func:`Reward.batch_calc`
+    prune_min_candidates: minimum number of candidates for a subtree to be
+      checked for pruning
 
   Returns:
     assortment with the maximum reward
   """
   product_num = len(reward.revenues) - 1
-  restricted_products = None
 
   if isinstance(reward, MeanReward):
     # a fast method to find the best assortment when the reward is MeanReward
@@ -231,34 +693,59 @@ def search_best_assortment(reward: Reward,
       next_ind -= 1
     if len(best_assortment) <= card_limit:
       return (reward.calc(best_assortment), best_assortment)
-    else:
-      restricted_products = best_assortment
-
-  assortments: List[Set[int]] = []
-  search(assortments=assortments,
-         product_num=product_num,
-         next_product_id=1,
-         assortment=set(),
-         card_limit=card_limit,
-         restricted_products=restricted_products)
-  # sort assortments according to reward value
-  sorted_assort = sorted([(reward.calc(assortment), assortment)
-                          for assortment in assortments],
-                         key=lambda x: x[0])
-  # randomly select one assortment with the maximum reward
-  ind = len(sorted_assort) - 1
-  while (ind > 0 and sorted_assort[ind - 1][0] == sorted_assort[ind][0]):
-    ind -= 1
-  return sorted_assort[np.random.randint(ind, len(sorted_assort))]
+    return capacitated_best_assortment(reward=reward, card_limit=card_limit)
+
+  best_reward, best_assortment = -np.inf, ()
+  # number of assortments with the maximum reward found so far
+  ties = 0
+
+  def prune(assortment: Tuple[int, ...], next_product_id: int) -> bool:
+    # the subtree is scored instead when it is small, i.e., when few products
+    # can be added or when at most one more product can be added
+    if (best_reward == -np.inf or not assortment or
+        product_num - next_product_id + 1 < prune_min_candidates or
+        len(assortment) + 1 >= card_limit):
+      return False
+    # ties are kept so that the best assortment can be selected randomly
+    return reward.upper_bound(assortment, next_product_id) < best_reward
+
+  assortments = iter_assortments(product_num=product_num,
+                                 card_limit=card_limit,
+                                 prune=prune)
+  while True:
+    # score a batch of assortments at once
+    batch = list(itertools.islice(assortments, batch_size))
+    if not batch:
+      break
+    rewards = reward.batch_calc(assortment_masks(batch, product_num))
+    batch_best_reward = np.max(rewards)
+    if batch_best_reward < best_reward:
+      continue
+    batch_ties = np.flatnonzero(rewards == batch_best_reward)
+    if batch_best_reward > best_reward:
+      best_reward, ties = batch_best_reward, 0
+    # randomly select one assortment with the maximum reward
+    ties += len(batch_ties)
+    if np.random.randint(ties) < len(batch_ties):
+      best_assortment = batch[np.random.choice(batch_ties)]
+  return (best_reward, set(best_assortment))
 
 
 def local_search_best_assortment(
     reward: Reward,
     random_neighbors: int,
     card_limit: int,
-    init_assortment: Set[int] = None) -> Tuple[float, Set[int]]:
+    init_assortment: Set[int] = None,
+    full_neighborhood: bool = False,
+    random_state: np.random.RandomState = None,
+    deadline: float = None) -> Tuple[float, Set[int]]:
   """Local search assortment with the maximum reward
 
+  During each iteration, the neighbors of the current assortment are obtained
+  by replacing, removing or adding one product. They are represented as rows of
+  a mask matrix and scored at once via :func:`Reward.batch_calc`. The search
+  moves to the best neighbor until no neighbor is better.
+
   .. warning::
     This method does not guarantee to output the best assortment.
 
@@ -270,77 +757,222 @@ def local_search_best_assortment(
     random_neighbors: number of random neighbors to look up
     card_limit: cardinality constraint
     init_assortment: initial assortment to start
+    full_neighborhood: whether to look up all the neighbors rather than random
+      ones i.e., steepest ascent. `random_neighbors` is ignored if it is set.
+    random_state: random number generator to use. If it is `None`, the global
+      one of numpy is used.
+    deadline: time in seconds since the epoch after which no more iterations
+      are started. If it is `None`, there is no deadline.
 
   Returns:
     local best assortment with its reward
   """
-  if random_neighbors <= 0:
+  if not full_neighborhood and random_neighbors <= 0:
     raise Exception('Number of neighbors to look up %d is no greater than 0!' \
         % random_neighbors)
 
   product_num = len(reward.revenues) - 1
+  # the global random number generator and `np.random.RandomState` share the
+  # same interface
+  random = np.random if random_state is None else random_state
 
-  # all available products
-  all_products = set(range(1, product_num + 1))
   if init_assortment is None:
     # randomly generate an assortment initially
-    best_assortment = set(
-        np.random.choice(list(all_products), card_limit, replace=False))
-    best_reward = reward.calc(best_assortment)
-  else:
-    best_assortment = set(init_assortment)
-    best_reward = reward.calc(best_assortment)
-  remaining_products = all_products - best_assortment
+    init_assortment = random.choice(np.arange(1, product_num + 1),
+                                       card_limit,
+                                       replace=False)
+  best_mask = assortment_masks([init_assortment], product_num)[0]
+  best_reward = reward.batch_calc(best_mask[np.newaxis])[0]
+
+  while deadline is None or time.time() < deadline:
+    products = np.flatnonzero(best_mask[1:]) + 1
+    remaining_products = np.flatnonzero(~best_mask[1:]) + 1
+    can_replace = len(remaining_products) > 0
+    can_remove = len(products) > 1
+    can_add = len(remaining_products) > 0 and len(products) < card_limit
+    if not (can_replace or can_remove or can_add):
+      break
 
-  while True:
-    available_operations = []
-    if len(remaining_products) > 0:
-      available_operations.append('replace')
-    if len(best_assortment) > 1:
-      available_operations.append('remove')
-    if len(remaining_products) > 0 and len(best_assortment) < card_limit:
-      available_operations.append('add')
-
-    local_best_assortment = set()
-    local_best_reward = 0.0
-    for _ in range(random_neighbors):
+    # each neighbor is given by the product to remove and the product to add,
+    # where product 0 means no product
+    if full_neighborhood:
+      products_to_remove = [
+          np.repeat(products, len(remaining_products) if can_replace else 0),
+          products if can_remove else [],
+          np.zeros(len(remaining_products) if can_add else 0, dtype=int)
+      ]
+      products_to_add = [
+          np.tile(remaining_products, len(products) if can_replace else 0),
+          np.zeros(len(products) if can_remove else 0, dtype=int),
+          remaining_products if can_add else []
+      ]
+      products_to_remove = np.concatenate(products_to_remove).astype(int)
+      products_to_add = np.concatenate(products_to_add).astype(int)
+    else:
+      available_operations = np.flatnonzero([can_replace, can_remove, can_add])
       # pylint: disable=no-member
-      operation = np.random.choice(available_operations)
-
-      if operation == 'replace':
-        # replace one product
-        product_to_remove = np.random.choice(list(best_assortment))
-        product_to_add = np.random.choice(list(remaining_products))
-        new_assortment = set(best_assortment)
-        new_assortment.remove(product_to_remove)
-        new_assortment.add(product_to_add)
-        new_reward = reward.calc(new_assortment)
-      elif operation == 'remove':
-        # remove one product
-        product_to_remove = np.random.choice(list(best_assortment))
-        new_assortment = set(best_assortment)
-        new_assortment.remove(product_to_remove)
-        new_reward = reward.calc(new_assortment)
-      else:
-        # operation = 'add'
-        # add one product
-        product_to_add = np.random.choice(list(remaining_products))
-        new_assortment = set(best_assortment)
-        new_assortment.add(product_to_add)
-        new_reward = reward.calc(new_assortment)
-
-      if new_reward > local_best_reward:
-        local_best_assortment = new_assortment
-        local_best_reward = new_reward
-
-    if local_best_reward > best_reward:
-      best_assortment = local_best_assortment
-      best_reward = local_best_reward
-      remaining_products = all_products - best_assortment
+      operations = random.choice(available_operations, random_neighbors)
+      # operation 0 is replace, 1 is remove and 2 is add
+      products_to_remove = np.where(
+          operations <= 1,
+          products[random.randint(len(products), size=random_neighbors)], 0)
+      products_to_add = np.zeros(random_neighbors, dtype=int)
+      if can_replace:
+        products_to_add = np.where(
+            operations != 1, remaining_products[random.randint(
+                len(remaining_products), size=random_neighbors)], 0)
+
+    neighbors = np.tile(best_mask, (len(products_to_remove), 1))
+    rows = np.arange(len(neighbors))
+    neighbors[rows, products_to_remove] = False
+    neighbors[rows, products_to_add] = True
+    # column 0 is ignored
+    neighbors[:, 0] = False
+
+    # score all the neighbors at once
+    rewards = reward.batch_calc(neighbors)
+    local_best_ind = int(np.argmax(rewards))
+
+    if rewards[local_best_ind] > best_reward:
+      best_mask = neighbors[local_best_ind]
+      best_reward = rewards[local_best_ind]
     else:
       break
 
-  return (best_reward, best_assortment)
+  return (best_reward, set((np.flatnonzero(best_mask[1:]) + 1).tolist()))
+
+
+# reward shipped to the worker process by the pool initializer
+_reward = None
+
+
+def _init_restart_worker(reward: Reward):
+  """Initialize the worker process
+
+  Args:
+    reward: reward definition used by the restarts run in the worker process
+  """
+  global _reward  # pylint: disable=global-statement
+  _reward = reward
+
+
+def _restart(
+    reward: Reward,
+    task: Tuple[int, int, Optional[Set[int]], bool, np.random.SeedSequence,
+                Optional[float]]
+) -> Tuple[float, Set[int]]:
+  """Run one restart of the local search
+
+  Args:
+    reward: reward definition
+    task: number of random neighbors, cardinality constraint, initial
+      assortment, whether to look up all the neighbors, seed sequence of the
+      restart and deadline
+
+  Returns:
+    best assortment found by the restart with its reward
+  """
+  (random_neighbors, card_limit, init_assortment, full_neighborhood, seed_seq,
+   deadline) = task
+  return local_search_best_assortment(
+      reward=reward,
+      random_neighbors=random_neighbors,
+      card_limit=card_limit,
+      init_assortment=init_assortment,
+      full_neighborhood=full_neighborhood,
+      random_state=np.random.RandomState(np.random.MT19937(seed_seq)),
+      deadline=deadline)
+
+
+def _run_restart(
+    task: Tuple[int, int, Optional[Set[int]], bool, np.random.SeedSequence,
+                Optional[float]]
+) -> Tuple[float, Set[int]]:
+  """Run one restart of the local search in the worker process
+
+  Args:
+    task: see :func:`_restart`
+
+  Returns:
+    best assortment found by the restart with its reward
+  """
+  return _restart(_reward, task)
+
+
+def multi_start_local_search_best_assortment(
+    reward: Reward,
+    random_neighbors: int,
+    card_limit: int,
+    restarts: int,
+    init_assortments: List[Set[int]] = None,
+    full_neighborhood: bool = False,
+    seed: int = None,
+    time_budget: float = None,
+    processes: int = -1) -> Tuple[float, Set[int]]:
+  """Local search assortment with the maximum reward from multiple starts
+
+  :func:`local_search_best_assortment` is run from `restarts` initial
+  assortments and the best result is returned. Each restart has its own random
+  number generator seeded by a child of `seed`, so the result only depends on
+  `seed` and not on how the restarts are scheduled.
+
+  .. note::
+    The search is dominated by python code holding the GIL, so the restarts
+    are run in a pool of processes rather than threads. Every worker process
+    receives its own copy of `reward` via pickle, hence the rewards memoized
+    by the restarts are not shared. A single restart is run in the calling
+    process.
+
+  .. warning::
+    This method does not guarantee to output the best assortment.
+
+  Args:
+    reward: reward definition
+    random_neighbors: number of random neighbors to look up
+    card_limit: cardinality constraint
+    restarts: number of restarts
+    init_assortments: initial assortments of the first restarts i.e., warm
+      starts. The remaining restarts start from random assortments.
+    full_neighborhood: whether to look up all the neighbors rather than random
+      ones
+    seed: random seed. If it is `None`, it is drawn from the global random
+      number generator of numpy.
+    time_budget: number of seconds shared by all the restarts after which the
+      restarts stop searching and return the best assortments found so far.
+      Restarts which begin after the time budget is used up return their
+      initial assortments. If it is `None`, there is no time limit.
+    processes: maximum number of processes to run the restarts. -1 means no
+      limit
+
+  Returns:
+    best assortment found with its reward
+  """
+  if restarts < 1:
+    raise Exception('Number of restarts %d is less than 1!' % restarts)
+  init_assortments = [] if init_assortments is None else init_assortments
+  if len(init_assortments) > restarts:
+    raise Exception('Number of initial assortments %d is greater than number '
+                    'of restarts %d!' % (len(init_assortments), restarts))
+  if seed is None:
+    seed = np.random.randint(2**31 - 1)
+  deadline = None if time_budget is None else time.time() + time_budget
+  tasks = [(random_neighbors, card_limit,
+            init_assortments[ind] if ind < len(init_assortments) else None,
+            full_neighborhood, seed_seq, deadline)
+           for (ind, seed_seq) in enumerate(
+               np.random.SeedSequence(seed).spawn(restarts))]
+
+  if restarts == 1:
+    return _restart(reward, tasks[0])
+
+  processes = multiprocessing.cpu_count() if processes < 0 else processes
+  with Pool(processes=min(processes, restarts),
+            initializer=_init_restart_worker,
+            initargs=(reward, )) as pool:
+    # results are in the order of the restarts
+    results = pool.map(_run_restart, tasks)
+  # the first restart wins if there is a tie
+  return max(results, key=lambda x: x[0])
 
 
 class OrdinaryMNLBandit(Bandit):
@@ -410,6 +1042,10 @@ class OrdinaryMNLBandit(Bandit):
 
     self.__preference_params = preference_params
     self.__revenues = revenues
+    # arrays used to simulate the choices of the customers
+    self.__preference_params_array = np.asarray(preference_params,
+                                                dtype=float)
+    self.__revenues_array = np.asarray(revenues, dtype=float)
     # product 0 is reserved for non-purchase
     self.__product_num = len(self.__preference_params) - 1
     if self.__product_num == 0:
@@ -446,54 +1082,52 @@ class OrdinaryMNLBandit(Bandit):
     """
     return 'ordinary_mnl_bandit'
 
-  def _take_action(self, assortment: Set[int], times: int) -> \
-      Tuple[np.ndarray, List[int]]:
-    """Serve one assortment
+  def __check_assortment(self, assortment: Set[int]) -> List[int]:
+    """Check whether an assortment is valid
 
     Args:
       assortment: assortment to serve
-      times: number of serving times
 
     Returns:
-      feedback by serving `assortment`. The first dimension is the
-        stochatic rewards, and the second dimension is the choices of the
-        customer.
+      sorted product ids of `assortment`
     """
     if not assortment:
       raise Exception('Empty assortment!')
-    for product_id in assortment:
+    products = sorted(assortment)
+    for product_id in (products[0], products[-1]):
       if product_id < 1 or product_id > self.__product_num:
         raise Exception('Product id %d is out of range [1, %d]!' %
                         (product_id, self.__product_num))
-    if len(assortment) > self.__card_limit:
+    if len(products) > self.__card_limit:
       raise Exception('Assortment %s has products more than cardinality'
-                      ' constraint %d!' % (sorted(list(assortment)),
-                                           self.__card_limit))
+                      ' constraint %d!' % (products, self.__card_limit))
+    return products
 
-    preference_params_sum = sum(
-        [self.__preference_params[product_id] for product_id in assortment]) +\
-        self.__preference_params[0]
-    sorted_assort = sorted(list(assortment))
-    sample_prob = [self.__preference_params[0] / preference_params_sum] + \
-        [self.__preference_params[product] / preference_params_sum
-         for product in sorted_assort]
-    sample_results = np.random.choice(len(sample_prob), times, p=sample_prob)
-    choices = [
-        0 if (sample == 0) else sorted_assort[sample - 1]
-        for sample in sample_results
-    ]
-    # feedback = (stochastic rewards, choices)
-    feedback = ([self.__revenues[choice] for choice in choices], choices)
-
-    # update regret
-    self.__regret += \
-        (self.__best_reward - self.__reward.calc(assortment)) * times
-    return feedback
+  def _take_action(self, assortment: Set[int], times: int) -> \
+      Tuple[np.ndarray, np.ndarray]:
+    """Serve one assortment
+
+    Args:
+      assortment: assortment to serve
+      times: number of serving times
+
+    Returns:
+      feedback by serving `assortment`. The first dimension is the
+        stochatic rewards, and the second dimension is the choices of the
+        customer.
+    """
+    return self.feed([(assortment, times)])[0]
 
   def feed(self, actions: List[Tuple[Set[int], int]]) -> \
-      List[Tuple[np.ndarray, List[int]]]:
+      List[Tuple[np.ndarray, np.ndarray]]:
     """Serve multiple assortments
 
+    The choices of the customers of all the assortments are sampled in one
+    shot. Each assortment together with non-purchase forms one segment of the
+    cumulative sums of the preference parameters, and each choice is found by
+    looking up a uniform random number scaled into the segment of its
+    assortment.
+
     Args:
       actions: for each tuple, the first dimension is the assortment to serve
         and the second dimension is the number of serving times
@@ -503,9 +1137,45 @@ class OrdinaryMNLBandit(Bandit):
         the stochatic rewards, and the second dimension is the choices of the
         customer.
     """
+    if not actions:
+      return []
+    # products which can be chosen by the customers of each action where
+    # product 0 is added for non-purchase
+    candidate_list: List[int] = []
+    # start of the segment of each action
+    starts = [0]
+    for (assortment, serving_times) in actions:
+      if serving_times < 0:
+        raise Exception('Number of serving times %d is less than 0!' %
+                        serving_times)
+      candidate_list.append(0)
+      candidate_list.extend(self.__check_assortment(assortment))
+      starts.append(len(candidate_list))
+    candidates = np.array(candidate_list)
+    times = np.array([serving_times for (_, serving_times) in actions],
+                     dtype=int)
+    ends = np.array(starts[1:]) - 1
+    cum_params = np.cumsum(self.__preference_params_array[candidates])
+    segment_begins = cum_params[starts[:-1]] - \
+        self.__preference_params_array[0]
+    action_ids = np.repeat(np.arange(len(actions)), times)
+    targets = segment_begins[action_ids] + np.random.random(len(action_ids)) * (
+        cum_params[ends] - segment_begins)[action_ids]
+    # guard against rounding errors at the end of the segments
+    samples = np.minimum(np.searchsorted(cum_params, targets, side='right'),
+                         ends[action_ids])
+    choices = candidates[samples]
+    rewards = self.__revenues_array[choices]
+
     feedback = []
-    for (assortment, times) in actions:
-      feedback.append(self._take_action(assortment, times))
+    sample_ends = np.cumsum(times)
+    for (i, (assortment, _)) in enumerate(actions):
+      feedback.append(
+          (rewards[sample_ends[i] - times[i]:sample_ends[i]],
+           choices[sample_ends[i] - times[i]:sample_ends[i]]))
+      # update regret
+      self.__regret += \
+          (self.__best_reward - self.__reward.calc(assortment)) * times[i]
     return feedback
 
   def reset(self):
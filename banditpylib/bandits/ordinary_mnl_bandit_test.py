@@ -4,7 +4,9 @@ import pytest
 from banditpylib.learners import MaxReward
 from .ordinary_mnl_bandit import OrdinaryMNLBandit, \
     search, search_best_assortment, MeanReward, CvarReward, \
-    local_search_best_assortment
+    local_search_best_assortment, capacitated_best_assortment, \
+    iter_assortments, sample_assortment, assortment_masks, \
+    multi_start_local_search_best_assortment
 
 
 class TestOrdinaryMNLBandit:
@@ -42,6 +44,52 @@ class TestOrdinaryMNLBandit:
     assert best_assortment == {1, 2, 3, 4}
     assert best_revenue == pytest.approx(0.41, 1e-2)
 
+  def test_search_best_assortment_pruning(self):
+    random_state = np.random.RandomState(0)
+    preference_params = np.concatenate([[1], random_state.uniform(0.1, 1, 12)])
+    revenues = np.concatenate([[0], random_state.uniform(0.1, 1, 12)])
+    results = []
+    for prune in [True, False]:
+      reward = CvarReward(0.5)
+      reward.set_preference_params(preference_params)
+      reward.set_revenues(revenues)
+      # count the number of assortments which are scored
+      scored = [0]
+      batch_calc = reward.batch_calc
+
+      def counted_batch_calc(masks, batch_calc=batch_calc, scored=scored):
+        scored[0] += len(masks)
+        return batch_calc(masks)
+
+      reward.batch_calc = counted_batch_calc
+      if not prune:
+        reward.upper_bound = lambda assortment, next_product_id: np.inf
+      best_reward, _ = search_best_assortment(reward=reward)
+      results.append((best_reward, scored[0]))
+    assert results[0][0] == pytest.approx(results[1][0], 1e-8)
+    assert results[1][1] == 2**12 - 1
+    assert results[0][1] < results[1][1]
+
+  def test_capacitated_best_assortment(self):
+    reward = MeanReward()
+    reward.set_preference_params(
+        np.array([1, 0.9, 0.2, 0.7, 0.5, 1.0, 0.3, 0.8]))
+    reward.set_revenues(np.array([0, 0.6, 0.95, 0.7, 0.8, 0.5, 0.9, 0.65]))
+    product_num = len(reward.revenues) - 1
+    for card_limit in range(1, product_num + 1):
+      assortments = []
+      search(assortments=assortments,
+             product_num=product_num,
+             next_product_id=1,
+             assortment=set(),
+             card_limit=card_limit)
+      best_reward = max(
+          [reward.calc(assortment) for assortment in assortments])
+      capacitated_best_reward, best_assortment = capacitated_best_assortment(
+          reward=reward, card_limit=card_limit)
+      assert len(best_assortment) <= card_limit
+      assert capacitated_best_reward == pytest.approx(best_reward, 1e-8)
+
   def test_local_search_best_assortment(self):
     reward = MeanReward()
     reward.set_preference_params(
@@ -68,6 +116,14 @@ class TestOrdinaryMNLBandit:
     # assortment.
     assert best_assortment == local_best_assortment
 
+    _, local_best_assortment = local_search_best_assortment(
+        reward=reward,
+        random_neighbors=10,
+        card_limit=3,
+        full_neighborhood=True)
+    assert len(local_best_assortment) <= 3
+    assert set(local_best_assortment).issubset(set(range(1, product_num + 1)))
+
 
   def test_cvar_calculation(self):
     reward = CvarReward(alpha=0.5)
@@ -105,3 +161,125 @@ class TestOrdinaryMNLBandit:
     bandit.reset()
     # always get no purchase
     assert set(bandit.feed([({1}, 5)])[0][1]) == {0}
+
+  def test_batch_feed(self):
+    preference_params = np.array([1.0, 0.0, 1.0, 0.0, 1.0])
+    revenues = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+    bandit = OrdinaryMNLBandit(preference_params, revenues)
+    bandit.reset()
+    feedback = bandit.feed([({1, 2}, 10), ({3}, 0), ({3, 4}, 20)])
+    assert [len(rewards) for (rewards, _) in feedback] == [10, 0, 20]
+    assert set(feedback[0][1]).issubset({0, 2})
+    assert set(feedback[2][1]).issubset({0, 4})
+    for (rewards, choices) in feedback:
+      np.testing.assert_array_equal(rewards, revenues[choices])
+
+  def test_iter_assortments(self):
+    results = []
+    search(assortments=results,
+           product_num=4,
+           next_product_id=1,
+           assortment=set(),
+           card_limit=2)
+    assert [set(assortment) for assortment in iter_assortments(
+        product_num=4, card_limit=2)] == results
+    # prune the assortments containing product 1
+    assert {1} not in [
+        set(assortment) for assortment in iter_assortments(
+            product_num=4, prune=lambda assortment, _: 1 in assortment)
+    ]
+
+  def test_sample_assortment(self):
+    for _ in range(20):
+      assortment = sample_assortment(product_num=25, card_limit=3)
+      assert 1 <= len(assortment) <= 3
+      assert assortment.issubset(set(range(1, 26)))
+    # 5 of the 15 assortments of 5 products with at most 2 products have size 1
+    sizes = [
+        len(sample_assortment(product_num=5, card_limit=2))
+        for _ in range(2000)
+    ]
+    assert abs(sizes.count(1) / len(sizes) - 1 / 3) < 0.05
+
+  def test_reward_cache(self):
+    reward = CvarReward(alpha=0.5, cache_size=2)
+    reward.set_preference_params(np.array([1, 1, 1, 1]))
+    reward.set_revenues(np.array([0, 1, 1, 1]))
+    version = reward.version
+    cvar_alpha = reward.calc({2, 3})
+    assert reward.calc({3, 2}) == cvar_alpha
+    assert reward.cache_info() == {'hits': 1, 'misses': 1, 'size': 1}
+    reward.calc({1})
+    reward.calc({1, 2})
+    # {2, 3} is evicted
+    assert reward.cache_info()['size'] == 2
+    reward.calc({2, 3})
+    assert reward.cache_info()['misses'] == 4
+    # setting the same parameters keeps the cache
+    reward.set_preference_params(np.array([1, 1, 1, 1]))
+    assert reward.version == version
+    assert reward.cache_info()['size'] == 2
+    reward.set_preference_params(np.array([1, 0.5, 0.5, 0.5]))
+    assert reward.version == version + 1
+    assert reward.cache_info()['size'] == 0
+    assert reward.calc({2, 3}) != cvar_alpha
+
+  def test_batch_calc(self):
+    preference_params = np.array([1, 0.7, 0.8, 0.5, 0.2, 0.9])
+    revenues = np.array([0, 0.7, 0.8, 0.9, 0.8, 0.3])
+    assortments = list(iter_assortments(product_num=5))
+    masks = assortment_masks(assortments, 5)
+    for reward in [MeanReward(), CvarReward(0.3), CvarReward(0.7)]:
+      reward.set_preference_params(preference_params)
+      reward.set_revenues(revenues)
+      np.testing.assert_allclose(
+          reward.batch_calc(masks),
+          [reward.calc(set(assortment)) for assortment in assortments])
+
+  def test_multi_start_local_search_best_assortment(self):
+    reward = CvarReward(0.7)
+    reward.set_preference_params(
+        np.array([1, 0.7, 0.8, 0.5, 0.2, 0.9, 0.4, 0.6]))
+    reward.set_revenues(np.array([0, 0.7, 0.8, 0.9, 0.8, 0.3, 0.5, 1.0]))
+    results = [
+        multi_start_local_search_best_assortment(reward=reward,
+                                                 random_neighbors=5,
+                                                 card_limit=3,
+                                                 restarts=4,
+                                                 init_assortments=[{1, 2}],
+                                                 seed=0) for _ in range(2)
+    ]
+    # results are determined by the seed
+    assert results[0] == results[1]
+    # running the restarts in parallel equals running them one after another
+    sequential_results = [
+        local_search_best_assortment(
+            reward=reward,
+            random_neighbors=5,
+            card_limit=3,
+            init_assortment={1, 2} if ind == 0 else None,
+            random_state=np.random.RandomState(np.random.MT19937(seed_seq)))
+        for (ind, seed_seq) in enumerate(np.random.SeedSequence(0).spawn(4))
+    ]
+    assert results[0] == max(sequential_results, key=lambda x: x[0])
+    assert multi_start_local_search_best_assortment(reward=reward,
+                                                    random_neighbors=5,
+                                                    card_limit=3,
+                                                    restarts=4,
+                                                    init_assortments=[{1, 2}],
+                                                    seed=0,
+                                                    processes=1) == results[0]
+    best_reward, best_assortment = results[0]
+    assert len(best_assortment) <= 3
+    # the warm start is a lower bound
+    assert best_reward >= reward.calc({1, 2}) - 1e-8
+    # restarts return their initial assortments when there is no time left
+    best_reward, best_assortment = multi_start_local_search_best_assortment(
+        reward=reward,
+        random_neighbors=5,
+        card_limit=3,
+        restarts=1,
+        init_assortments=[{1, 2}],
+        time_budget=0)
+    assert best_assortment == {1, 2}
+    assert best_reward == reward.calc({1, 2})
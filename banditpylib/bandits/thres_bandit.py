@@ -4,7 +4,7 @@ import numpy as np
 
 from banditpylib.arms import Arm
 from banditpylib.learners import Goal, MaxCorrectAnswers, AllCorrect
-from .utils import Bandit
+from .utils import Bandit, read_only_array
 
 
 class ThresholdingBandit(Bandit):
@@ -18,6 +18,10 @@ class ThresholdingBandit(Bandit):
   accepts a parameter :math:`\epsilon >= 0` which is the radius of indifference
   zone meaning that the answers about the arms with expected rewards within
   :math:`[\theta - \epsilon, \theta + \epsilon]` do not matter.
+
+  The means of the arms, the correct answers and whether each answer matters
+  are computed once when the bandit is constructed and exposed as read-only
+  arrays so that regrets are computed in a vectorized way.
   """
   def __init__(self,
                arms: List[Arm],
@@ -36,21 +40,19 @@ class ThresholdingBandit(Bandit):
       raise Exception('The number of arms %d is less than 2.' % len(arms))
     self.__arms = arms
     self.__arm_num = len(arms)
+    self.__means = read_only_array([arm.mean for arm in arms])
     # correct answers of all the arms whether its expected rewards is above the
     # threshold or not
-    self.__correct_answers = [
-        1 if self.__arms[arm_id].mean >= theta else 0
-        for arm_id in range(self.__arm_num)
-    ]
+    self.__correct_answers = read_only_array(
+        (self.__means >= theta).astype(int))
     if eps < 0:
       raise Exception('Radius of indifference zone is less than 0!')
     # The answer of the learner does not matter if the expected rewards of an
     # arm is within the range [theta-eps, theta+eps]. Hence weight assigned to
     # such an arm is 0.
-    self.__weights = [
-        0 if theta - eps <= self.__arms[arm_id].mean <= theta + eps else 1
-        for arm_id in range(self.__arm_num)
-    ]
+    self.__weights = read_only_array(
+        ((self.__means < theta - eps) | (self.__means > theta + eps)).astype(
+            int))
 
   def _name(self) -> str:
     """
@@ -66,6 +68,22 @@ class ThresholdingBandit(Bandit):
       This function should be called before the start of the game.
     """
     self.__total_pulls = 0
+    self.__arm_pulls = np.zeros(self.__arm_num, dtype=int)
+
+  @property
+  def means(self) -> np.ndarray:
+    """means of the arms"""
+    return self.__means
+
+  @property
+  def correct_answers(self) -> np.ndarray:
+    """whether the mean of each arm is above the threshold"""
+    return self.__correct_answers
+
+  @property
+  def weights(self) -> np.ndarray:
+    """whether the answer of each arm matters"""
+    return self.__weights
 
   def arm_num(self) -> int:
     """
@@ -74,6 +92,20 @@ class ThresholdingBandit(Bandit):
     """
     return self.__arm_num
 
+  def total_pulls(self) -> int:
+    """
+    Returns:
+      total number of pulls so far
+    """
+    return self.__total_pulls
+
+  def arm_pulls(self) -> np.ndarray:
+    """
+    Returns:
+      number of pulls of each arm
+    """
+    return self.__arm_pulls
+
   def __take_action(self, arm_id: int, pulls: int) -> \
       Optional[Tuple[np.ndarray, None]]:
     """Pull one arm
@@ -93,6 +125,7 @@ class ThresholdingBandit(Bandit):
       return None
     # empirical rewards when `arm_id` is pulled for `pulls` times
     em_rewards = self.__arms[arm_id].pull(pulls=pulls)
+    self.__arm_pulls[arm_id] += pulls
     self.__total_pulls += pulls
     return (em_rewards, None)
 
@@ -132,17 +165,13 @@ class ThresholdingBandit(Bandit):
     """
     if isinstance(goal, MaxCorrectAnswers):
       # aggregate regret which is equal to the number of wrong answers
-      agg_regret = 0
-      for arm_id in range(self.__arm_num):
-        agg_regret += (goal.value[arm_id] !=
-                       self.__correct_answers[arm_id]) * self.__weights[arm_id]
-      return agg_regret
+      return int(
+          np.dot(np.asarray(goal.value) != self.__correct_answers,
+                 self.__weights))
     elif isinstance(goal, AllCorrect):
       # simple regret which is 1 when there is at least one wrong answer and 0
       # otherwise
-      for arm_id in range(self.__arm_num):
-        if (goal.value[arm_id] !=
-            self.__correct_answers[arm_id]) and self.__weights[arm_id] == 1:
-          return 1
-      return 0
+      return int(
+          np.any((np.asarray(goal.value) != self.__correct_answers)
+                 & (self.__weights == 1)))
     raise Exception('Goal %s is not supported.' % goal.name)
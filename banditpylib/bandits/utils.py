@@ -2,9 +2,24 @@ from abc import ABC, abstractmethod
 
 from typing import Any, List, Optional, Tuple
 
+import numpy as np
+
 from banditpylib.learners import Goal
 
 
+def read_only_array(values: Any) -> np.ndarray:
+  """
+  Args:
+    values: values of the array
+
+  Returns:
+    read-only copy of `values`
+  """
+  array = np.array(values)
+  array.setflags(write=False)
+  return array
+
+
 class Bandit(ABC):
   """Bandit environment
 
@@ -4,6 +4,7 @@ from .utils import *
 __all__ = [
     'argmax',
     'argmax_tuple',
+    'TournamentTree',
     'Goal',
     'BestArmId',
     'MaxReward',
@@ -0,0 +1,27 @@
+r"""
+Policies for finite-armed linear bandit with goal regret minimization.
+
+We introduce notations in the following.
+
+.. csv-table:: Notations
+
+  :math:`T`, time horizon
+  :math:`N`, total number of arms
+  :math:`d`, dimension of the features
+  :math:`x_i`, feature of arm :math:`i`
+  :math:`\lambda`, regularization parameter
+  :math:`A_t`, design matrix :math:`\lambda I + \sum_{s < t} x_s x_s^\top` before time :math:`t`
+  :math:`\hat{\theta}_t`, regularized least squares estimate of theta before time :math:`t`
+"""
+from .utils import *
+from .linucb import *
+from .lin_ts import *
+from .oful import *
+
+
+__all__ = [
+    'LinearBanditLearner',
+    'LinUCB',
+    'LinTS',
+    'OFUL'
+]
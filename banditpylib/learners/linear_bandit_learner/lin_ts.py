@@ -0,0 +1,67 @@
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from .utils import LinearBanditLearner
+
+
+class LinTS(LinearBanditLearner):
+  r"""Thompson sampling for linear bandits :cite:`agrawal2013thompson`
+
+  At time :math:`t`, sample :math:`\tilde{\theta}_t` from
+  :math:`\mathcal{N}(\hat{\theta}_t, v^2 A_t^{-1})` and play arm
+  :math:`\mathrm{argmax}_{i \in [0, N-1]} x_i^\top \tilde{\theta}_t`.
+
+  Since a factor of :math:`A_t^{-1}` is kept, sampling costs :math:`O(d^2)`
+  without any Cholesky decomposition.
+  """
+  def __init__(self,
+               features: Union[np.ndarray, Callable[[np.ndarray], np.ndarray]],
+               horizon: int,
+               name: Optional[str] = None,
+               reg: float = 1.0,
+               arm_num: Optional[int] = None,
+               block_size: int = 4096,
+               v: float = 1.0):
+    r"""
+    Args:
+      features: features of the arms as a matrix or a function generating
+        them. See :class:`LinearBanditLearner`.
+      horizon: total number of time steps
+      name: alias name
+      reg: regularization parameter :math:`\lambda`
+      arm_num: number of arms. It is required when `features` is a function.
+      block_size: number of arms whose features are generated at a time when
+        `features` is a function
+      v: scale :math:`v` of the posterior covariance
+    """
+    super().__init__(features=features,
+                     horizon=horizon,
+                     name=name,
+                     reg=reg,
+                     arm_num=arm_num,
+                     block_size=block_size)
+    if v < 0:
+      raise Exception('Scale %.2f is less than 0!' % v)
+    self.__v = v
+
+  def _name(self) -> str:
+    """
+    Returns:
+      default learner name
+    """
+    return 'lin_ts'
+
+  def virtual_means(self) -> np.ndarray:
+    """
+    Returns:
+      means of the arms under a sampled theta
+    """
+    return self.arm_means(self.sample_theta(self.__v))
+
+  def _select_arm(self) -> int:
+    """
+    Returns:
+      arm with the maximum virtual mean
+    """
+    return int(np.argmax(self.virtual_means()))
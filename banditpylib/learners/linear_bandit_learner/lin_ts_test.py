@@ -0,0 +1,33 @@
+import numpy as np
+
+from banditpylib.bandits import LinearBandit
+from .lin_ts import LinTS
+
+
+class TestLinTS:
+  """Test linear Thompson sampling policy"""
+
+  def test_simple_run(self):
+    features = np.array([[1, 0], [0, 1], [0.6, 0.6]])
+    theta = np.array([1, 0.2])
+    horizon = 200
+    bandit = LinearBandit(features, theta, var=0.01)
+    bandit.reset()
+    learner = LinTS(features=features, horizon=horizon, v=0.1)
+    learner.reset()
+    for _ in range(horizon):
+      actions = learner.actions()
+      learner.update(bandit.feed(actions))
+    assert learner.actions() is None
+    # arm 0 is the best arm and should be pulled most of the time
+    assert bandit.arm_pulls()[0] > horizon / 2
+
+  def test_virtual_means(self):
+    features = np.random.random((10, 3))
+    learner = LinTS(features=features, horizon=100, v=0)
+    learner.reset()
+    for _ in range(10):
+      learner.actions()
+      learner.update([(np.random.random(1), None)])
+    # no exploration is done when the scale is 0
+    assert np.allclose(learner.virtual_means(), learner.em_means)
@@ -0,0 +1,68 @@
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from .utils import LinearBanditLearner
+
+
+class LinUCB(LinearBanditLearner):
+  r"""LinUCB policy :cite:`li2010contextual`
+
+  At time :math:`t`, play arm
+
+  .. math::
+    \mathrm{argmax}_{i \in [0, N-1]} \left\{ x_i^\top \hat{\theta}_t + \alpha
+    \|x_i\|_{A_t^{-1}} \right\}
+
+  The indexes of all the arms are computed with one matrix-vector product.
+  """
+  def __init__(self,
+               features: Union[np.ndarray, Callable[[np.ndarray], np.ndarray]],
+               horizon: int,
+               name: Optional[str] = None,
+               reg: float = 1.0,
+               arm_num: Optional[int] = None,
+               block_size: int = 4096,
+               alpha: float = 1.0):
+    r"""
+    Args:
+      features: features of the arms as a matrix or a function generating
+        them. See :class:`LinearBanditLearner`.
+      horizon: total number of time steps
+      name: alias name
+      reg: regularization parameter :math:`\lambda`
+      arm_num: number of arms. It is required when `features` is a function.
+      block_size: number of arms whose features are generated at a time when
+        `features` is a function
+      alpha: scale of the confidence widths
+    """
+    super().__init__(features=features,
+                     horizon=horizon,
+                     name=name,
+                     reg=reg,
+                     arm_num=arm_num,
+                     block_size=block_size)
+    if alpha < 0:
+      raise Exception('Alpha %.2f is less than 0!' % alpha)
+    self.__alpha = alpha
+
+  def _name(self) -> str:
+    """
+    Returns:
+      default learner name
+    """
+    return 'linucb'
+
+  def UCB(self) -> np.ndarray:
+    """
+    Returns:
+      optimistic estimate of arms' real means
+    """
+    return self.em_means + self.__alpha * self.widths
+
+  def _select_arm(self) -> int:
+    """
+    Returns:
+      arm with the maximum index
+    """
+    return int(np.argmax(self.UCB()))
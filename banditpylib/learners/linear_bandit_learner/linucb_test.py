@@ -0,0 +1,79 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from banditpylib.bandits import LinearBandit
+from .linucb import LinUCB
+
+
+class TestLinUCB:
+  """Test LinUCB policy"""
+
+  def test_simple_run(self):
+    features = np.array([[1, 0], [0, 1], [0.6, 0.6]])
+    theta = np.array([1, 0.2])
+    horizon = 200
+    bandit = LinearBandit(features, theta, var=0.01)
+    bandit.reset()
+    learner = LinUCB(features=features, horizon=horizon)
+    learner.reset()
+    for _ in range(horizon):
+      actions = learner.actions()
+      learner.update(bandit.feed(actions))
+    assert learner.actions() is None
+    # arm 0 is the best arm and should be pulled most of the time
+    assert bandit.arm_pulls()[0] > horizon / 2
+
+  def test_design_matrix(self):
+    features = np.random.random((10, 4))
+    reg = 0.5
+    learner = LinUCB(features=features, horizon=100, reg=reg)
+    learner.reset()
+    design_matrix = reg * np.identity(4)
+    b = np.zeros(4)
+    for _ in range(30):
+      arm_id = learner.actions()[0][0]
+      rewards = np.random.random(2)
+      learner.update([(rewards, None)])
+      design_matrix += 2 * np.outer(features[arm_id], features[arm_id])
+      b += rewards.sum() * features[arm_id]
+    inverse = np.linalg.inv(design_matrix)
+    # rank-one updates agree with the inverse of the design matrix
+    assert np.allclose(learner.theta_hat, inverse @ b)
+    assert np.allclose(learner.widths**2,
+                       np.sum((features @ inverse) * features, axis=1))
+
+  def test_batched_update(self):
+    features = np.random.random((5, 3))
+    learner = LinUCB(features=features, horizon=10)
+    batched_learner = LinUCB(features=features, horizon=10)
+    learner.reset()
+    batched_learner.reset()
+    learner._select_arm = MagicMock(return_value=2)
+    batched_learner._select_arm = MagicMock(return_value=2)
+    batched_learner.actions()
+    batched_learner.update([(np.array([0.5, 1, 0]), None)])
+    # three pulls merged into one update match three separate updates
+    for reward in [0.5, 1, 0]:
+      learner.actions()
+      learner.update([(np.array([reward]), None)])
+    assert np.allclose(learner.theta_hat, batched_learner.theta_hat)
+    assert np.allclose(learner.UCB(), batched_learner.UCB())
+
+  def test_generated_features(self):
+    features = np.random.random((10, 3))
+    learner = LinUCB(features=features, horizon=20)
+    # features generated block by block give the same indexes
+    generated_learner = LinUCB(features=lambda arm_ids: features[arm_ids],
+                               horizon=20,
+                               arm_num=10,
+                               block_size=3)
+    learner.reset()
+    generated_learner.reset()
+    for _ in range(20):
+      actions = learner.actions()
+      assert generated_learner.actions() == actions
+      feedback = [(np.random.random(1), None)]
+      learner.update(feedback)
+      generated_learner.update(feedback)
+    assert np.allclose(learner.UCB(), generated_learner.UCB())
@@ -0,0 +1,98 @@
+import math
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from .utils import LinearBanditLearner
+
+
+class OFUL(LinearBanditLearner):
+  r"""Optimism in the face of uncertainty for linear bandits
+  :cite:`abbasi2011improved`
+
+  At time :math:`t`, play arm
+
+  .. math::
+    \mathrm{argmax}_{i \in [0, N-1]} \left\{ x_i^\top \hat{\theta}_t +
+    \beta_t \|x_i\|_{A_t^{-1}} \right\}
+
+  where
+
+  .. math::
+    \beta_t = R \sqrt{ 2 \log(1 / \delta) + \log \det(A_t) - d \log \lambda }
+    + \sqrt{\lambda} S
+
+  is the radius of the confidence ellipsoid, :math:`R` is the sub-Gaussian
+  parameter of the noise and :math:`S` is an upper bound of
+  :math:`\|\theta\|_2`. The log determinant of the design matrix is updated
+  together with its inverse so that no determinant is ever computed.
+  """
+  def __init__(self,
+               features: Union[np.ndarray, Callable[[np.ndarray], np.ndarray]],
+               horizon: int,
+               name: Optional[str] = None,
+               reg: float = 1.0,
+               arm_num: Optional[int] = None,
+               block_size: int = 4096,
+               delta: float = 0.05,
+               noise_std: float = 1.0,
+               theta_norm: float = 1.0):
+    r"""
+    Args:
+      features: features of the arms as a matrix or a function generating
+        them. See :class:`LinearBanditLearner`.
+      horizon: total number of time steps
+      name: alias name
+      reg: regularization parameter :math:`\lambda`
+      arm_num: number of arms. It is required when `features` is a function.
+      block_size: number of arms whose features are generated at a time when
+        `features` is a function
+      delta: confidence level :math:`\delta`
+      noise_std: sub-Gaussian parameter :math:`R` of the noise
+      theta_norm: upper bound :math:`S` of the norm of theta
+    """
+    super().__init__(features=features,
+                     horizon=horizon,
+                     name=name,
+                     reg=reg,
+                     arm_num=arm_num,
+                     block_size=block_size)
+    if delta <= 0 or delta >= 1:
+      raise Exception('Confidence level %.2f is not in (0, 1)!' % delta)
+    if noise_std < 0:
+      raise Exception('Noise std %.2f is less than 0!' % noise_std)
+    if theta_norm < 0:
+      raise Exception('Norm of theta %.2f is less than 0!' % theta_norm)
+    self.__delta = delta
+    self.__noise_std = noise_std
+    self.__theta_norm = theta_norm
+
+  def _name(self) -> str:
+    """
+    Returns:
+      default learner name
+    """
+    return 'oful'
+
+  def beta(self) -> float:
+    """
+    Returns:
+      radius of the confidence ellipsoid
+    """
+    return self.__noise_std * math.sqrt(
+        2 * math.log(1 / self.__delta) + self.log_det_ratio) + math.sqrt(
+            self.reg) * self.__theta_norm
+
+  def UCB(self) -> np.ndarray:
+    """
+    Returns:
+      optimistic estimate of arms' real means
+    """
+    return self.em_means + self.beta() * self.widths
+
+  def _select_arm(self) -> int:
+    """
+    Returns:
+      arm with the maximum index
+    """
+    return int(np.argmax(self.UCB()))
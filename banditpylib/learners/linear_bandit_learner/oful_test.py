@@ -0,0 +1,37 @@
+import numpy as np
+
+from banditpylib.arms import RewardStats
+from banditpylib.bandits import LinearBandit
+from .oful import OFUL
+
+
+class TestOFUL:
+  """Test OFUL policy"""
+
+  def test_simple_run(self):
+    features = np.array([[1, 0], [0, 1], [0.6, 0.6]])
+    theta = np.array([1, 0.2])
+    horizon = 200
+    bandit = LinearBandit(features, theta, var=0.01)
+    bandit.reset()
+    learner = OFUL(features=features, horizon=horizon, noise_std=0.1)
+    learner.reset()
+    for _ in range(horizon):
+      actions = learner.actions()
+      learner.update(bandit.feed(actions))
+    assert learner.actions() is None
+    # arm 0 is the best arm and should be pulled most of the time
+    assert bandit.arm_pulls()[0] > horizon / 2
+
+  def test_log_det_ratio(self):
+    features = np.random.random((10, 4))
+    reg = 2.0
+    learner = OFUL(features=features, horizon=1000, reg=reg)
+    learner.reset()
+    design_matrix = reg * np.identity(4)
+    for pulls in range(1, 20):
+      arm_id = learner.actions()[0][0]
+      learner.update([(RewardStats(pulls, pulls / 2, pulls / 2), None)])
+      design_matrix += pulls * np.outer(features[arm_id], features[arm_id])
+    assert np.isclose(learner.log_det_ratio,
+                      np.linalg.slogdet(design_matrix)[1] - 4 * np.log(reg))
@@ -0,0 +1,290 @@
+import math
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+from abc import abstractmethod
+
+import numpy as np
+
+from banditpylib.arms import RewardStats
+from banditpylib.bandits import LinearBanditItf
+from banditpylib.learners import Learner, Goal, MaxReward
+
+
+# pylint: disable=W0223
+class LinearBanditLearner(Learner):
+  r"""Base class for learners in the finite-armed linear bandit
+
+  This type of learners aim to maximize the expected total rewards. They keep
+  the regularized least squares estimate
+
+  .. math::
+    \hat{\theta}_t = A_t^{-1} b_t, \quad A_t = \lambda I + \sum_{s < t} x_s
+    x_s^\top, \quad b_t = \sum_{s < t} r_s x_s
+
+  where :math:`x_s` is the feature of the arm played at time :math:`s` and
+  :math:`r_s` is the reward.
+
+  Instead of :math:`A_t^{-1}` itself, a factor :math:`F_t` with
+  :math:`A_t^{-1} = F_t F_t^\top` is kept and each update is a rank-one
+  Sherman-Morrison update of the factor, which costs :math:`O(d^2)` rather than
+  the :math:`O(d^3)` of an inversion. The squared confidence widths
+  :math:`\|x_i\|_{A_t^{-1}}^2` of all the arms are updated with one
+  matrix-vector product per update, so scoring all the arms costs
+  :math:`O(Nd)` per time step. Multiple pulls of the same arm are merged into
+  one update.
+
+  As in :class:`banditpylib.bandits.LinearBandit`, the features can be given by
+  a function generating the features of any arms. The features are then
+  generated block by block whenever the arms are scored or the confidence
+  widths are updated, so only :math:`O(N)` numbers are stored.
+  """
+  def __init__(self,
+               features: Union[np.ndarray, Callable[[np.ndarray], np.ndarray]],
+               horizon: int,
+               name: Optional[str],
+               reg: float = 1.0,
+               arm_num: Optional[int] = None,
+               block_size: int = 4096):
+    r"""
+    Args:
+      features: features of the arms. It is either a matrix whose rows are the
+        features of the arms or a function which generates the features of a
+        given array of arm ids as a matrix. In the latter case, the features
+        are never stored and `arm_num` must be given.
+      horizon: total number of time steps
+      name: alias name
+      reg: regularization parameter :math:`\lambda`
+      arm_num: number of arms. It is required when `features` is a function.
+      block_size: number of arms whose features are generated at a time when
+        `features` is a function
+    """
+    super().__init__(name)
+    if callable(features):
+      if arm_num is None:
+        raise Exception('Number of arms is required when features are '
+                        'generated!')
+      if block_size < 1:
+        raise Exception('Block size %d is less than 1!' % block_size)
+      self.__features = None
+      self.__feature_fn = features
+      self.__arm_num = arm_num
+      self.__block_size = block_size
+      self.__dim = np.shape(features(np.arange(1)))[1]
+    else:
+      self.__features = np.asarray(features, dtype=float)
+      if self.__features.ndim != 2:
+        raise Exception('Features should be a matrix with one row per arm!')
+      self.__feature_fn = None
+      self.__arm_num, self.__dim = self.__features.shape
+    if self.__arm_num < 2:
+      raise Exception('Number of arms %d is less then 2!' % self.__arm_num)
+    if horizon < 1:
+      raise Exception('Horizon %d is less than 1!' % horizon)
+    self.__horizon = horizon
+    if reg <= 0:
+      raise Exception('Regularization parameter %.2f is no greater than 0!' %
+                      reg)
+    self.__reg = reg
+    # goals are immutable so the same object is returned every time
+    self.__goal = MaxReward()
+
+  @property
+  def running_environment(self) -> type:
+    """type of environment the learner works with"""
+    return LinearBanditItf
+
+  def arm_num(self) -> int:
+    """
+    Returns:
+      number of arms
+    """
+    return self.__arm_num
+
+  def dim(self) -> int:
+    """
+    Returns:
+      dimension of the features
+    """
+    return self.__dim
+
+  def horizon(self) -> int:
+    """
+    Returns:
+      horizon of the game
+    """
+    return self.__horizon
+
+  def features(self, arm_ids: np.ndarray = None) -> np.ndarray:
+    """
+    Args:
+      arm_ids: arms whose features are returned. If it is `None`, the features
+        of all the arms are returned, which are generated if the features are
+        given by a function.
+
+    Returns:
+      feature vectors as rows of a matrix
+    """
+    if arm_ids is None:
+      arm_ids = np.arange(self.__arm_num)
+    if self.__features is not None:
+      return self.__features[arm_ids]
+    return self.__feature_fn(np.asarray(arm_ids))
+
+  def __feature_blocks(self) -> Iterator[Tuple[slice, np.ndarray]]:
+    """
+    Returns:
+      iterator of the blocks of arms with their features. There is only one
+      block if the features are stored as a matrix.
+    """
+    if self.__features is not None:
+      yield (slice(None), self.__features)
+      return
+    for start in range(0, self.__arm_num, self.__block_size):
+      end = min(self.__arm_num, start + self.__block_size)
+      features = np.asarray(self.__feature_fn(np.arange(start, end)),
+                            dtype=float)
+      if features.shape != (end - start, self.__dim):
+        raise Exception('Shape of generated features %s is not (%d, %d)!' %
+                        (features.shape, end - start, self.__dim))
+      yield (slice(start, end), features)
+
+  def arm_means(self, theta: np.ndarray) -> np.ndarray:
+    """
+    Args:
+      theta: parameter theta
+
+    Returns:
+      means of the arms if the parameter is `theta`
+    """
+    means = np.empty(self.__arm_num)
+    for (arm_ids, features) in self.__feature_blocks():
+      means[arm_ids] = features @ theta
+    return means
+
+  @property
+  def reg(self) -> float:
+    """regularization parameter"""
+    return self.__reg
+
+  def reset(self):
+    """Reset the learner
+
+    .. warning::
+      This function should be called before the start of the game.
+    """
+    # factor of the inverse of the design matrix
+    self.__factor = np.eye(self.__dim) / math.sqrt(self.__reg)
+    self.__b = np.zeros(self.__dim)
+    self.__theta_hat = np.zeros(self.__dim)
+    self.__sq_widths = np.empty(self.__arm_num)
+    for (arm_ids, features) in self.__feature_blocks():
+      self.__sq_widths[arm_ids] = np.sum(features**2, axis=1) / self.__reg
+    # log det(A_t) - d log(reg)
+    self.__log_det_ratio = 0.0
+    # current time step
+    self.__time = 1
+    self.__last_actions = None
+
+  @property
+  def theta_hat(self) -> np.ndarray:
+    """regularized least squares estimate of theta"""
+    return self.__theta_hat
+
+  @property
+  def em_means(self) -> np.ndarray:
+    """estimated means of the arms"""
+    return self.arm_means(self.__theta_hat)
+
+  @property
+  def widths(self) -> np.ndarray:
+    r"""confidence widths :math:`\|x_i\|_{A_t^{-1}}` of the arms"""
+    return np.sqrt(np.maximum(self.__sq_widths, 0))
+
+  @property
+  def log_det_ratio(self) -> float:
+    r""":math:`\log \det(A_t) - d \log \lambda`"""
+    return self.__log_det_ratio
+
+  def sample_theta(self, scale: float) -> np.ndarray:
+    r"""Draw theta from :math:`\mathcal{N}(\hat{\theta}_t, v^2 A_t^{-1})`
+
+    Args:
+      scale: scale :math:`v` of the covariance
+
+    Returns:
+      sampled theta
+    """
+    return self.__theta_hat + scale * (self.__factor @ np.random.normal(
+        size=self.__dim))
+
+  def __rank_one_update(self, arm_id: int, pulls: int, total_rewards: float):
+    """Add the pulls of one arm to the design matrix
+
+    Args:
+      arm_id: arm pulled
+      pulls: number of pulls
+      total_rewards: total rewards of the pulls
+    """
+    feature = self.features([arm_id])[0]
+    # the design matrix is increased by u u^T
+    w = self.__factor.T @ (math.sqrt(pulls) * feature)
+    a = self.__factor @ w
+    w_norm = w @ w
+    denom = 1 + w_norm
+    for (arm_ids, features) in self.__feature_blocks():
+      self.__sq_widths[arm_ids] -= (features @ a)**2 / denom
+    if w_norm > 0:
+      # F (I - beta w w^T) is a factor of A^{-1} - a a^T / denom
+      beta = (1 - 1 / math.sqrt(denom)) / w_norm
+      self.__factor -= beta * np.outer(a, w)
+    self.__log_det_ratio += math.log(denom)
+    self.__b += total_rewards * feature
+    self.__theta_hat = self.__factor @ (self.__factor.T @ self.__b)
+
+  @abstractmethod
+  def _select_arm(self) -> int:
+    """
+    Returns:
+      arm to pull at the current time step
+    """
+
+  def actions(self, context=None) -> Optional[List[Tuple[int, int]]]:
+    """
+    Args:
+      context: context of the linear bandit which should be `None`
+
+    Returns:
+      arms to pull
+    """
+    del context
+    if self.__time > self.__horizon:
+      self.__last_actions = None
+    else:
+      self.__last_actions = [(self._select_arm(), 1)]
+    return self.__last_actions
+
+  def update(self, feedback: List[Tuple[np.ndarray, None]]):
+    """Learner update
+
+    The feedback of all the actions is used, so a batch of pulls can be passed
+    in at once.
+
+    Args:
+      feedback: feedback returned by the bandit environment by executing
+        :func:`actions`
+    """
+    for (ind, (arm_id, _)) in enumerate(self.__last_actions):
+      rewards = feedback[ind][0]
+      if isinstance(rewards, RewardStats):
+        (pulls, total_rewards) = (rewards.pulls, rewards.total_rewards)
+      else:
+        rewards = np.asarray(rewards, dtype=float)
+        (pulls, total_rewards) = (len(rewards), rewards.sum())
+      if pulls > 0:
+        self.__rank_one_update(arm_id, pulls, total_rewards)
+        self.__time += pulls
+
+  @property
+  def goal(self) -> Goal:
+    """goal of the learner"""
+    return self.__goal
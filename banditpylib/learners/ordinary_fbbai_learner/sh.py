@@ -3,7 +3,7 @@ from typing import List, Tuple, Optional
 import math
 import numpy as np
 
-from banditpylib.arms import PseudoArm
+from banditpylib.arms import PseudoArmBank
 from banditpylib.learners import argmax_tuple
 from .utils import OrdinaryFBBAILearner
 
@@ -43,7 +43,7 @@ class SH(OrdinaryFBBAILearner):
     .. warning::
       This function should be called before the start of the game.
     """
-    self.__pseudo_arms = [PseudoArm() for arm_id in range(self.arm_num())]
+    self.__pseudo_arms = PseudoArmBank(arm_num=self.arm_num())
     self.__active_arms = list(range(self.arm_num()))
     self.__budget_left = self.budget()
     self.__best_arm = None
@@ -88,19 +88,17 @@ class SH(OrdinaryFBBAILearner):
         :func:`actions`
     """
     for (ind, (rewards, _)) in enumerate(feedback):
-      self.__pseudo_arms[self.__last_actions[ind][0]].update(rewards)
+      self.__pseudo_arms.update(self.__last_actions[ind][0], rewards)
       self.__budget_left -= len(rewards)
+    active_arms = np.array(self.__active_arms)
+    em_means = self.__pseudo_arms.em_means[active_arms]
     if self.__last_round:
-      self.__best_arm = argmax_tuple([
-          (self.__pseudo_arms[arm_id].em_mean,
-           arm_id) for arm_id in self.__active_arms])
+      self.__best_arm = argmax_tuple(list(zip(em_means, self.__active_arms)))
     else:
       # remove half of the arms with the worst empirical means
-      sorted_active_arms = sorted(self.__active_arms,
-                                  key=lambda x: self.__pseudo_arms[x].em_mean,
-                                  reverse=True)
-      self.__active_arms = sorted_active_arms[:math.
-                                              ceil(len(self.__active_arms) / 2)]
+      sorted_active_arms = active_arms[np.argsort(-em_means, kind='stable')]
+      self.__active_arms = list(
+          sorted_active_arms[:math.ceil(len(self.__active_arms) / 2)])
     self.__round += 1
 
   def best_arm(self) -> int:
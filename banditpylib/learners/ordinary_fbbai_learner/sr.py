@@ -3,7 +3,7 @@ from typing import List, Tuple, Optional
 import math
 import numpy as np
 
-from banditpylib.arms import PseudoArm
+from banditpylib.arms import PseudoArmBank
 from .utils import OrdinaryFBBAILearner
 
 
@@ -35,7 +35,7 @@ class SR(OrdinaryFBBAILearner):
     .. warning::
       This function should be called before the start of the game.
     """
-    self.__pseudo_arms = [PseudoArm() for arm_id in range(self.arm_num())]
+    self.__pseudo_arms = PseudoArmBank(arm_num=self.arm_num())
     # calculate pulls_per_round
     self.__pulls_per_round = [-1]
     nk = [0]
@@ -82,12 +82,11 @@ class SR(OrdinaryFBBAILearner):
     """
     for (ind, (rewards, _)) in enumerate(feedback):
       if rewards is not None:
-        self.__pseudo_arms[self.__last_actions[ind][0]].update(rewards)
+        self.__pseudo_arms.update(self.__last_actions[ind][0], rewards)
         self.__budget_left -= len(rewards)
     # remove the arm with the least mean
-    arm_id_to_remove = min([(arm_id, self.__pseudo_arms[arm_id].em_mean)
-                            for arm_id in self.__active_arms],
-                           key=lambda x: x[1])[0]
+    em_means = self.__pseudo_arms.em_means
+    arm_id_to_remove = min(self.__active_arms, key=lambda x: em_means[x])
     self.__active_arms.remove(arm_id_to_remove)
     if self.__round == self.arm_num() - 1:
       self.__best_arm = list(self.__active_arms)[0]
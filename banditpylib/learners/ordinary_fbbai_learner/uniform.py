@@ -2,7 +2,7 @@ from typing import List, Tuple, Optional
 
 import numpy as np
 
-from banditpylib.arms import PseudoArm
+from banditpylib.arms import PseudoArmBank
 from banditpylib.learners import argmax
 from .utils import OrdinaryFBBAILearner
 
@@ -35,7 +35,7 @@ class Uniform(OrdinaryFBBAILearner):
     .. warning::
       This function should be called before the start of the game.
     """
-    self.__pseudo_arms = [PseudoArm() for arm_id in range(self.arm_num())]
+    self.__pseudo_arms = PseudoArmBank(arm_num=self.arm_num())
     self.__best_arm = None
     self.__last_round = False
 
@@ -68,9 +68,9 @@ class Uniform(OrdinaryFBBAILearner):
         `self.__last_actions`
     """
     for (ind, (rewards, _)) in enumerate(feedback):
-      self.__pseudo_arms[self.__last_actions[ind][0]].update(rewards)
+      self.__pseudo_arms.update(self.__last_actions[ind][0], rewards)
     if self.__last_round:
-      self.__best_arm = argmax([arm.em_mean for arm in self.__pseudo_arms])
+      self.__best_arm = argmax(list(self.__pseudo_arms.em_means))
 
   def best_arm(self) -> int:
     """
@@ -20,6 +20,8 @@ class OrdinaryFBBAILearner(Learner):
       name: alias name
     """
     super().__init__(name)
+    # goal returned last time which is reused while the best arm is unchanged
+    self.__goal = None
     if arm_num <= 1:
       raise Exception('Number of arms %d is less then 2!' % arm_num)
     self.__arm_num = arm_num
@@ -64,4 +66,7 @@ class OrdinaryFBBAILearner(Learner):
   @property
   def goal(self) -> Goal:
     """goal of the learner"""
-    return BestArmId(best_arm=self.best_arm())
+    best_arm = self.best_arm()
+    if self.__goal is None or self.__goal.value != best_arm:
+      self.__goal = BestArmId(best_arm=best_arm)
+    return self.__goal
@@ -3,22 +3,33 @@ from typing import List, Tuple, Optional
 import math
 import numpy as np
 
-from banditpylib.arms import PseudoArm
-from banditpylib.learners import argmax_tuple
+from banditpylib.arms import PseudoArmBank
+from banditpylib.learners import argmax, TournamentTree
 from .utils import OrdinaryFCBAILearner
 
 
 class LilUCBHeuristic(OrdinaryFCBAILearner):
-  """lilUCB heuristic policy :cite:`jamieson2014lil`"""
-  def __init__(self, arm_num: int, confidence: float, name: str = None):
+  """lilUCB heuristic policy :cite:`jamieson2014lil`
+
+  .. note::
+    Since the upper confidence bound of an arm only depends on its own
+    empirical information, when `incremental` is set, the bounds are maintained
+    in a :class:`banditpylib.learners.TournamentTree` and only the bound of the
+    pulled arm is updated during each time step.
+  """
+  def __init__(self, arm_num: int, confidence: float, name: str = None,
+               incremental: bool = False):
     """
     Args:
       arm_num: number of arms
       confidence: confidence level. It should be within (0, 1). The algorithm
         should output the best arm with probability at least this value.
       name: alias name
+      incremental: whether to maintain the upper confidence bounds
+        incrementally
     """
     super().__init__(arm_num=arm_num, confidence=confidence, name=name)
+    self.__incremental = incremental
 
   def _name(self) -> str:
     """
@@ -33,7 +44,7 @@ class LilUCBHeuristic(OrdinaryFCBAILearner):
     .. warning::
       This function should be called before the start of the game.
     """
-    self.__pseudo_arms = [PseudoArm() for arm_id in range(self.arm_num())]
+    self.__pseudo_arms = PseudoArmBank(arm_num=self.arm_num())
     # parameters suggested by the paper
     self.__beta = 0.5
     self.__a = 1 + 10 / self.arm_num()
@@ -41,6 +52,10 @@ class LilUCBHeuristic(OrdinaryFCBAILearner):
     self.__delta = (1 - self.confidence()) / 5
     # total number of pulls used
     self.__total_pulls = 0
+    # maximum number of pulls among the arms
+    self.__max_pulls = 0
+    # upper confidence bounds maintained incrementally
+    self.__tree = None
     self.__stage = 'initialization'
 
   def confidence_radius(self, pulls: int) -> float:
@@ -62,11 +77,23 @@ class LilUCBHeuristic(OrdinaryFCBAILearner):
     Returns:
       upper confidence bound
     """
-    return np.array([
-        pseudo_arm.em_mean + self.confidence_radius(pseudo_arm.total_pulls())
-        for pseudo_arm in self.__pseudo_arms
+    return self.__pseudo_arms.em_means + np.array([
+        self.confidence_radius(pulls)
+        for pulls in self.__pseudo_arms.total_pulls()
     ])
 
+  def __arm_ucb(self, arm_id: int) -> float:
+    """
+    Args:
+      arm_id: arm id
+
+    Returns:
+      upper confidence bound of `arm_id`
+    """
+    total_pulls = self.__pseudo_arms.total_pulls()[arm_id]
+    return self.__pseudo_arms.total_rewards()[arm_id] / total_pulls + \
+        self.confidence_radius(total_pulls)
+
   def actions(self, context=None) -> Optional[List[Tuple[int, int]]]:
     """
     Args:
@@ -79,11 +106,17 @@ class LilUCBHeuristic(OrdinaryFCBAILearner):
       self.__last_actions = [(arm_id, 1) for arm_id in range(self.arm_num())]
     else:
       # self.__stage == 'main'
-      for pseudo_arm in self.__pseudo_arms:
-        if pseudo_arm.total_pulls() >= (
-            1 + self.__a * (self.__total_pulls - pseudo_arm.total_pulls())):
-          return None
-      self.__last_actions = [(np.argmax(self.ucb()), 1)]
+      # the stopping condition holds for some arm if and only if it holds for
+      # the arm with the maximum number of pulls
+      if self.__max_pulls >= (
+          1 + self.__a * (self.__total_pulls - self.__max_pulls)):
+        return None
+      if self.__incremental:
+        if self.__tree is None:
+          self.__tree = TournamentTree(self.ucb())
+        self.__last_actions = [(self.__tree.argmax(), 1)]
+      else:
+        self.__last_actions = [(np.argmax(self.ucb()), 1)]
     return self.__last_actions
 
   def update(self, feedback: List[Tuple[np.ndarray, None]]):
@@ -94,8 +127,13 @@ class LilUCBHeuristic(OrdinaryFCBAILearner):
         :func:`actions`
     """
     for (ind, (rewards, _)) in enumerate(feedback):
-      self.__pseudo_arms[self.__last_actions[ind][0]].update(rewards)
+      arm_id = self.__last_actions[ind][0]
+      self.__pseudo_arms.update(arm_id, rewards)
       self.__total_pulls += len(rewards)
+      self.__max_pulls = max(self.__max_pulls,
+                             self.__pseudo_arms.total_pulls()[arm_id])
+      if self.__tree is not None:
+        self.__tree.update(arm_id, self.__arm_ucb(arm_id))
     if self.__stage == 'initialization':
       self.__stage = 'main'
 
@@ -104,6 +142,4 @@ class LilUCBHeuristic(OrdinaryFCBAILearner):
     Returns:
       best arm identified by the learner
     """
-    return argmax_tuple([(pseudo_arm.total_pulls(), arm_id)
-                         for (arm_id,
-                              pseudo_arm) in enumerate(self.__pseudo_arms)])
+    return argmax(self.__pseudo_arms.total_pulls())
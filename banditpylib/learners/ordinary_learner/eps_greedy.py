@@ -2,7 +2,7 @@ from typing import List, Tuple, Optional
 
 import numpy as np
 
-from banditpylib.arms import PseudoArm
+from banditpylib.arms import PseudoArmBank
 from .utils import OrdinaryLearner
 
 
@@ -12,16 +12,27 @@ class EpsGreedy(OrdinaryLearner):
   With probability :math:`\frac{\epsilon}{t}` do uniform sampling and with the
   remaining probability play the arm with the maximum empirical mean.
   """
-  def __init__(
-      self, arm_num: int, horizon: int, name: str = None, eps: float = 1.0):
+  def __init__(self,
+               arm_num: int,
+               horizon: int,
+               name: str = None,
+               eps: float = 1.0,
+               batch_size: int = 1,
+               batch_growth: float = 1.0):
     """
     Args:
       arm_num: number of arms
       horizon: total number of time steps
       name: alias name
       eps: epsilon
+      batch_size: minimum number of pulls per round
+      batch_growth: growth rate of the ends of rounds
     """
-    super().__init__(arm_num=arm_num, horizon=horizon, name=name)
+    super().__init__(arm_num=arm_num,
+                     horizon=horizon,
+                     name=name,
+                     batch_size=batch_size,
+                     batch_growth=batch_growth)
     if eps <= 0:
       raise Exception('Epsilon %.2f in %s is no greater than 0!' % \
           (eps, self.__name))
@@ -40,10 +51,23 @@ class EpsGreedy(OrdinaryLearner):
     .. warning::
       This function should be called before the start of the game.
     """
-    self.__pseudo_arms = [PseudoArm() for arm_id in range(self.arm_num())]
+    self.__pseudo_arms = PseudoArmBank(arm_num=self.arm_num())
     # current time step
     self.__time = 1
 
+  def batch_actions(self, total_pulls: np.ndarray, total_rewards: np.ndarray,
+                    sum_of_square_rewards: np.ndarray, time: int) -> np.ndarray:
+    """Empirically best arms or random arms in each trial"""
+    trials = len(total_pulls)
+    if time <= self.arm_num():
+      return np.full(trials, (time - 1) % self.arm_num())
+    arm_ids = np.argmax(total_rewards / total_pulls, axis=1)
+    # with probability eps/t, randomly select an arm to pull
+    # pylint: disable=no-member
+    explore = np.random.random(trials) <= self.__eps / time
+    arm_ids[explore] = np.random.randint(0, self.arm_num(), np.sum(explore))
+    return arm_ids
+
   def actions(self, context=None) -> Optional[List[Tuple[int, int]]]:
     """
     Args:
@@ -57,15 +81,19 @@ class EpsGreedy(OrdinaryLearner):
     if self.__time > self.horizon():
       self.__last_actions = None
     elif self.__time <= self.arm_num():
-      self.__last_actions = [((self.__time - 1) % self.arm_num(), 1)]
+      self.__last_actions = self._aggregate(self._warm_up_round(self.__time))
+    elif self.is_batched():
+      times = self.__time + np.arange(self.round_pulls(self.__time))
+      arm_ids = np.full(len(times), np.argmax(self.__pseudo_arms.em_means))
+      # with probability eps/t, randomly select an arm to pull at time t
+      explore = np.random.random(len(times)) <= self.__eps / times
+      arm_ids[explore] = np.random.randint(0, self.arm_num(), np.sum(explore))
+      self.__last_actions = self._aggregate(arm_ids)
     # with probability eps/t, randomly select an arm to pull
     elif np.random.random() <= self.__eps / self.__time:
       self.__last_actions = [(np.random.randint(0, self.arm_num()), 1)]
     else:
-      self.__last_actions = [
-          (np.argmax(np.array([arm.em_mean
-                               for arm in self.__pseudo_arms])), 1)
-      ]
+      self.__last_actions = [(np.argmax(self.__pseudo_arms.em_means), 1)]
     return self.__last_actions
 
   def update(self, feedback: List[Tuple[np.ndarray, None]]):
@@ -75,5 +103,10 @@ class EpsGreedy(OrdinaryLearner):
       feedback: feedback returned by the bandit environment by executing
         :func:`actions`
     """
-    self.__pseudo_arms[self.__last_actions[0][0]].update(feedback[0][0])
+    if self.is_batched():
+      for (ind, (arm_id, _)) in enumerate(self.__last_actions):
+        self.__pseudo_arms.update(arm_id, feedback[ind][0])
+        self.__time += len(feedback[ind][0])
+      return
+    self.__pseudo_arms.update(self.__last_actions[0][0], feedback[0][0])
     self.__time += 1
@@ -1,8 +1,10 @@
 from typing import List, Tuple, Optional
 
+import math
 import numpy as np
 
-from banditpylib.arms import PseudoArm
+from banditpylib.arms import PseudoArmBank
+from banditpylib.learners import TournamentTree
 from .utils import OrdinaryLearner
 
 
@@ -18,15 +20,31 @@ class MOSS(OrdinaryLearner):
   .. note::
     MOSS uses time horizon in its confidence interval. Reward has to be bounded
     in [0, 1].
+
+  .. note::
+    Since the index of an arm only depends on its own empirical information,
+    when `incremental` is set, the indexes are maintained in a
+    :class:`banditpylib.learners.TournamentTree` and only the index of the
+    pulled arm is updated during each time step.
   """
-  def __init__(self, arm_num: int, horizon: int, name: str = None):
+  def __init__(self, arm_num: int, horizon: int, name: str = None,
+               incremental: bool = False, batch_size: int = 1,
+               batch_growth: float = 1.0):
     """
     Args:
       arm_num: number of arms
       horizon: total number of time steps
       name: alias name
+      incremental: whether to maintain the indexes incrementally
+      batch_size: minimum number of pulls per round
+      batch_growth: growth rate of the ends of rounds
     """
-    super().__init__(arm_num=arm_num, horizon=horizon, name=name)
+    super().__init__(arm_num=arm_num,
+                     horizon=horizon,
+                     name=name,
+                     batch_size=batch_size,
+                     batch_growth=batch_growth)
+    self.__incremental = incremental
 
   def _name(self) -> str:
     """
@@ -41,24 +59,47 @@ class MOSS(OrdinaryLearner):
     .. warning::
       This function should be called before the start of the game.
     """
-    self.__pseudo_arms = [PseudoArm() for arm_id in range(self.arm_num())]
+    self.__pseudo_arms = PseudoArmBank(arm_num=self.arm_num())
     # current time step
     self.__time = 1
+    # indexes of arms maintained incrementally
+    self.__tree = None
 
   def MOSS(self) -> np.ndarray:
     """
     Returns:
       optimistic estimate of arms' real means using horizon
     """
-    moss = [
-        arm.em_mean + np.sqrt(
-            np.maximum(
-                0, np.log(self.horizon() /
-                          (self.arm_num() * arm.total_pulls()))) /
-            arm.total_pulls()) for arm in self.__pseudo_arms
-    ]
+    total_pulls = self.__pseudo_arms.total_pulls()
+    moss = self.__pseudo_arms.em_means + np.sqrt(
+        np.maximum(0, np.log(self.horizon() /
+                             (self.arm_num() * total_pulls))) / total_pulls)
     return moss
 
+  def __arm_moss(self, arm_id: int) -> float:
+    """
+    Args:
+      arm_id: arm id
+
+    Returns:
+      optimistic estimate of the real mean of `arm_id` using horizon
+    """
+    total_pulls = self.__pseudo_arms.total_pulls()[arm_id]
+    return self.__pseudo_arms.total_rewards()[arm_id] / total_pulls + \
+        math.sqrt(max(0, math.log(self.horizon() /
+                                  (self.arm_num() * total_pulls))) /
+                  total_pulls)
+
+  def batch_actions(self, total_pulls: np.ndarray, total_rewards: np.ndarray,
+                    sum_of_square_rewards: np.ndarray, time: int) -> np.ndarray:
+    """Arms with the maximum MOSS index in each trial"""
+    if time <= self.arm_num():
+      return np.full(len(total_pulls), (time - 1) % self.arm_num())
+    moss = total_rewards / total_pulls + np.sqrt(
+        np.maximum(0, np.log(self.horizon() /
+                             (self.arm_num() * total_pulls))) / total_pulls)
+    return np.argmax(moss, axis=1)
+
   def actions(self, context=None) -> Optional[List[Tuple[int, int]]]:
     """
     Args:
@@ -71,7 +112,19 @@ class MOSS(OrdinaryLearner):
     if self.__time > self.horizon():
       self.__last_actions = None
     elif self.__time <= self.arm_num():
-      self.__last_actions = [((self.__time - 1) % self.arm_num(), 1)]
+      self.__last_actions = self._aggregate(self._warm_up_round(self.__time))
+    elif self.is_batched():
+      em_means = self.__pseudo_arms.em_means
+      self.__last_actions = self._aggregate(
+          self._optimistic_round(
+              self.__time, self.__pseudo_arms.total_pulls(),
+              lambda pulls, _: em_means + np.sqrt(
+                  np.maximum(0, np.log(self.horizon() /
+                                       (self.arm_num() * pulls))) / pulls)))
+    elif self.__incremental:
+      if self.__tree is None:
+        self.__tree = TournamentTree(self.MOSS())
+      self.__last_actions = [(self.__tree.argmax(), 1)]
     else:
       self.__last_actions = [(np.argmax(self.MOSS()), 1)]
     return self.__last_actions
@@ -83,5 +136,13 @@ class MOSS(OrdinaryLearner):
       feedback: feedback returned by the bandit environment by executing
         :func:`actions`
     """
-    self.__pseudo_arms[self.__last_actions[0][0]].update(feedback[0][0])
+    if self.is_batched():
+      for (ind, (arm_id, _)) in enumerate(self.__last_actions):
+        self.__pseudo_arms.update(arm_id, feedback[ind][0])
+        self.__time += len(feedback[ind][0])
+      return
+    self.__pseudo_arms.update(self.__last_actions[0][0], feedback[0][0])
+    if self.__tree is not None:
+      arm_id = self.__last_actions[0][0]
+      self.__tree.update(arm_id, self.__arm_moss(arm_id))
     self.__time += 1
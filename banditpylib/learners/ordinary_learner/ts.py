@@ -2,7 +2,7 @@ from typing import List, Tuple, Optional
 
 import numpy as np
 
-from banditpylib.arms import PseudoArm
+from banditpylib.arms import PseudoArmBank
 from .utils import OrdinaryLearner
 
 
@@ -13,11 +13,17 @@ class ThompsonSampling(OrdinaryLearner):
   virtual mean from the posterior distribution for every arm. Play the arm with
   the maximum sampled virtual mean.
 
+  The parameters of the posterior distributions of all the arms are kept in
+  arrays which are updated incrementally, and the virtual means of all the
+  arms are drawn with one vectorized call. In batch mode, one virtual mean of
+  every arm is drawn for each pull of the round.
+
   .. warning::
     Reward should be Bernoulli when Beta prior is chosen.
   """
   def __init__(self, arm_num: int, horizon: int,
-               name: str = None, prior_dist: str = 'beta'):
+               name: str = None, prior_dist: str = 'beta',
+               batch_size: int = 1, batch_growth: float = 1.0):
     """
     Args:
       arm_num: number of arms
@@ -25,8 +31,14 @@ class ThompsonSampling(OrdinaryLearner):
       name: alias name
       prior_dist: prior distribution of thompson sampling. Only two priors are
         supported i.e., `beta` and `gaussian`
+      batch_size: minimum number of pulls per round
+      batch_growth: growth rate of the ends of rounds
     """
-    super().__init__(arm_num=arm_num, horizon=horizon, name=name)
+    super().__init__(arm_num=arm_num,
+                     horizon=horizon,
+                     name=name,
+                     batch_size=batch_size,
+                     batch_growth=batch_growth)
     if prior_dist not in ['gaussian', 'beta']:
       raise Exception('Prior distribution %s is not supported!' % prior_dist)
     self.__prior_dist = prior_dist
@@ -44,37 +56,73 @@ class ThompsonSampling(OrdinaryLearner):
     .. warning::
       This function should be called before the start of the game.
     """
-    self.__pseudo_arms = [PseudoArm() for arm_id in range(self.arm_num())]
+    self.__pseudo_arms = PseudoArmBank(arm_num=self.arm_num())
     # current time step
     self.__time = 1
+    if self.__prior_dist == 'beta':
+      # the mean of each arm has a uniform prior Beta(1, 1)
+      self.__posterior_params = (np.ones(self.arm_num()),
+                                 np.ones(self.arm_num()))
+    else:
+      # the mean of each arm has a Gaussian prior Normal(0, 1)
+      self.__posterior_params = (np.zeros(self.arm_num()),
+                                 np.ones(self.arm_num()))
+
+  def __update_posterior(self, arm_id: int):
+    """Update the posterior parameters of one arm
+
+    Args:
+      arm_id: arm whose empirical information has changed
+    """
+    total_pulls = self.__pseudo_arms.total_pulls()[arm_id]
+    total_rewards = self.__pseudo_arms.total_rewards()[arm_id]
+    if self.__prior_dist == 'beta':
+      self.__posterior_params[0][arm_id] = 1 + total_rewards
+      self.__posterior_params[1][arm_id] = 1 + total_pulls - total_rewards
+    else:
+      self.__posterior_params[0][arm_id] = total_rewards / (total_pulls + 1)
+      self.__posterior_params[1][arm_id] = 1.0 / (total_pulls + 1)
+
+  def virtual_means(self, samples: int = None) -> np.ndarray:
+    """Draw virtual means from the posterior distributions
+
+    Args:
+      samples: number of virtual means to draw for every arm. If it is `None`,
+        one virtual mean is drawn for every arm.
+
+    Returns:
+      virtual means of the arms. If `samples` is not `None`, each row is one
+      sample of the virtual means of all the arms.
+    """
+    size = None if samples is None else (samples, self.arm_num())
+    if self.__prior_dist == 'beta':
+      return np.random.beta(*self.__posterior_params, size=size)
+    return np.random.normal(*self.__posterior_params, size=size)
 
   def actions_from_beta_prior(self) -> int:
     """
     Returns:
       arm to pull using beta prior
     """
-    # the mean of each arm has a uniform prior Beta(1, 1)
-    virtual_means = np.zeros(self.arm_num())
-    for arm_id in range(self.arm_num()):
-      a = 1 + self.__pseudo_arms[arm_id].total_rewards()
-      b = 1 + self.__pseudo_arms[arm_id].total_pulls(
-      ) - self.__pseudo_arms[arm_id].total_rewards()
-      virtual_means[arm_id] = np.random.beta(a, b)
-    return np.argmax(virtual_means)
+    return np.argmax(self.virtual_means())
 
   def actions_from_gaussian_prior(self) -> int:
     """
     Returns:
       arm to pull using gaussian prior
     """
-    # the mean of each arm has a Gaussian prior Normal(0, 1)
-    virtual_means = np.zeros(self.arm_num())
-    for arm_id in range(self.arm_num()):
-      mu = self.__pseudo_arms[arm_id].total_rewards() / (
-          self.__pseudo_arms[arm_id].total_pulls() + 1)
-      sigma = 1.0 / (self.__pseudo_arms[arm_id].total_pulls() + 1)
-      virtual_means[arm_id] = np.random.normal(mu, sigma)
-    return np.argmax(virtual_means)
+    return np.argmax(self.virtual_means())
+
+  def batch_actions(self, total_pulls: np.ndarray, total_rewards: np.ndarray,
+                    sum_of_square_rewards: np.ndarray, time: int) -> np.ndarray:
+    """Arms with the maximum virtual mean in each trial"""
+    if self.__prior_dist == 'beta':
+      virtual_means = np.random.beta(1 + total_rewards,
+                                     1 + total_pulls - total_rewards)
+    else:
+      virtual_means = np.random.normal(total_rewards / (total_pulls + 1),
+                                       1.0 / (total_pulls + 1))
+    return np.argmax(virtual_means, axis=1)
 
   def actions(self, context=None) -> Optional[List[Tuple[int, int]]]:
     """
@@ -87,6 +135,10 @@ class ThompsonSampling(OrdinaryLearner):
     del context
     if self.__time > self.horizon():
       self.__last_actions = None
+    elif self.is_batched():
+      # draw one independent posterior sample of every arm per pull
+      self.__last_actions = self._aggregate(
+          np.argmax(self.virtual_means(self.round_pulls(self.__time)), axis=1))
     else:
       self.__last_actions = [(self.actions_from_beta_prior(),
                               1)] if self.__prior_dist == 'beta' else [
@@ -101,5 +153,12 @@ class ThompsonSampling(OrdinaryLearner):
       feedback: feedback returned by the bandit environment by executing
         :func:`actions`
     """
-    self.__pseudo_arms[self.__last_actions[0][0]].update(feedback[0][0])
+    if self.is_batched():
+      for (ind, (arm_id, _)) in enumerate(self.__last_actions):
+        self.__pseudo_arms.update(arm_id, feedback[ind][0])
+        self.__update_posterior(arm_id)
+        self.__time += len(feedback[ind][0])
+      return
+    self.__pseudo_arms.update(self.__last_actions[0][0], feedback[0][0])
+    self.__update_posterior(self.__last_actions[0][0])
     self.__time += 1
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock
 
+import numpy as np
+
 from .ts import ThompsonSampling
 
 
@@ -12,3 +14,32 @@ class TestThompsonSampling:
     ts_learner.actions_from_beta_prior = MagicMock(return_value=1)
     # always pull arm 1
     assert ts_learner.actions() == [(1, 1)]
+
+  def test_batched_run(self):
+    ts_learner = ThompsonSampling(arm_num=4, horizon=10, batch_size=4)
+    ts_learner.reset()
+    actions = ts_learner.actions()
+    # all the pulls of the round are committed at once
+    assert sum([pulls for (_, pulls) in actions]) == 4
+    ts_learner.update([(np.ones(pulls), None) for (_, pulls) in actions])
+    actions = ts_learner.actions()
+    assert sum([pulls for (_, pulls) in actions]) == 4
+    ts_learner.update([(np.ones(pulls), None) for (_, pulls) in actions])
+    # only 2 time steps are left
+    actions = ts_learner.actions()
+    assert sum([pulls for (_, pulls) in actions]) == 2
+    ts_learner.update([(np.ones(pulls), None) for (_, pulls) in actions])
+    assert ts_learner.actions() is None
+
+  def test_virtual_means(self):
+    ts_learner = ThompsonSampling(arm_num=4, horizon=10)
+    ts_learner.reset()
+    ts_learner.actions_from_beta_prior = MagicMock(return_value=1)
+    ts_learner.actions()
+    ts_learner.update([(np.ones(1), None)])
+    virtual_means = ts_learner.virtual_means(samples=10000)
+    assert virtual_means.shape == (10000, 4)
+    # posterior of arm 1 is Beta(2, 1) and the others are Beta(1, 1)
+    assert np.allclose(np.mean(virtual_means, axis=0),
+                       [1 / 2, 2 / 3, 1 / 2, 1 / 2],
+                       atol=0.02)
@@ -1,8 +1,10 @@
 from typing import List, Tuple, Optional
 
+import math
 import numpy as np
 
-from banditpylib.arms import PseudoArm
+from banditpylib.arms import PseudoArmBank
+from banditpylib.learners import TournamentTree
 from .utils import OrdinaryLearner
 
 
@@ -14,21 +16,40 @@ class UCB(OrdinaryLearner):
   .. math::
     \mathrm{argmax}_{i \in [0, N-1]} \left\{ \hat{\mu}_i(t) + \sqrt{ \frac{
     \alpha  \ln(t) }{T_i(t)} } \right\}
+
+  .. note::
+    When `incremental` is set, the upper confidence bounds are maintained in a
+    :class:`banditpylib.learners.TournamentTree`. The upper confidence bound of
+    each arm is a linear function of :math:`\sqrt{\ln(t)}` whose slope is
+    :math:`\sqrt{\alpha / T_i(t)}`, so the tree only needs to replay the
+    changes of the winners as time goes by and an arm is selected in
+    :math:`O(\log N)` amortized time rather than :math:`O(N)`.
   """
   def __init__(self, arm_num: int, horizon: int,
-               name: str = None, alpha: float = 2.0):
+               name: str = None, alpha: float = 2.0,
+               incremental: bool = False, batch_size: int = 1,
+               batch_growth: float = 1.0):
     """
     Args:
       arm_num: number of arms
       horizon: total number of time steps
       name: alias name
       alpha: alpha
+      incremental: whether to maintain the upper confidence bounds
+        incrementally
+      batch_size: minimum number of pulls per round
+      batch_growth: growth rate of the ends of rounds
     """
-    super().__init__(arm_num=arm_num, horizon=horizon, name=name)
+    super().__init__(arm_num=arm_num,
+                     horizon=horizon,
+                     name=name,
+                     batch_size=batch_size,
+                     batch_growth=batch_growth)
     if alpha <= 0:
       raise Exception('Alpha %.2f in %s is no greater than 0!' %
                       (alpha, self.__name))
     self.__alpha = alpha
+    self.__incremental = incremental
 
   def _name(self) -> str:
     """
@@ -43,22 +64,44 @@ class UCB(OrdinaryLearner):
     .. warning::
       This function should be called before the start of the game.
     """
-    self.__pseudo_arms = [PseudoArm() for arm_id in range(self.arm_num())]
+    self.__pseudo_arms = PseudoArmBank(arm_num=self.arm_num())
     # current time step
     self.__time = 1
+    # upper confidence bounds maintained in incremental mode
+    self.__tree = None
 
   def UCB(self) -> np.ndarray:
     """
     Returns:
       optimistic estimate of arms' real means
     """
-    ucb = [
-        arm.em_mean +
-        np.sqrt(self.__alpha * np.log(self.__time) / arm.total_pulls())
-        for arm in self.__pseudo_arms
-    ]
+    ucb = self.__pseudo_arms.em_means + np.sqrt(
+        self.__alpha * np.log(self.__time) / self.__pseudo_arms.total_pulls())
     return ucb
 
+  def __incremental_argmax(self) -> int:
+    """
+    Returns:
+      arm with the maximum upper confidence bound
+    """
+    if self.__tree is None:
+      self.__tree = TournamentTree(
+          self.__pseudo_arms.em_means,
+          np.sqrt(self.__alpha / self.__pseudo_arms.total_pulls()),
+          math.sqrt(math.log(self.__time)))
+    else:
+      self.__tree.advance(math.sqrt(math.log(self.__time)))
+    return self.__tree.argmax()
+
+  def batch_actions(self, total_pulls: np.ndarray, total_rewards: np.ndarray,
+                    sum_of_square_rewards: np.ndarray, time: int) -> np.ndarray:
+    """Arms with the maximum upper confidence bound in each trial"""
+    if time <= self.arm_num():
+      return np.full(len(total_pulls), (time - 1) % self.arm_num())
+    ucb = total_rewards / total_pulls + np.sqrt(
+        self.__alpha * np.log(time) / total_pulls)
+    return np.argmax(ucb, axis=1)
+
   def actions(self, context=None) -> Optional[List[Tuple[int, int]]]:
     """
     Args:
@@ -71,7 +114,16 @@ class UCB(OrdinaryLearner):
     if self.__time > self.horizon():
       self.__last_actions = None
     elif self.__time <= self.arm_num():
-      self.__last_actions = [((self.__time - 1) % self.arm_num(), 1)]
+      self.__last_actions = self._aggregate(self._warm_up_round(self.__time))
+    elif self.is_batched():
+      em_means = self.__pseudo_arms.em_means
+      self.__last_actions = self._aggregate(
+          self._optimistic_round(
+              self.__time, self.__pseudo_arms.total_pulls(),
+              lambda pulls, time: em_means + np.sqrt(
+                  self.__alpha * np.log(time) / pulls)))
+    elif self.__incremental:
+      self.__last_actions = [(self.__incremental_argmax(), 1)]
     else:
       self.__last_actions = [(np.argmax(self.UCB()), 1)]
     return self.__last_actions
@@ -83,5 +135,16 @@ class UCB(OrdinaryLearner):
       feedback: feedback returned by the bandit environment by executing
         :func:`actions`
     """
-    self.__pseudo_arms[self.__last_actions[0][0]].update(feedback[0][0])
+    if self.is_batched():
+      for (ind, (arm_id, _)) in enumerate(self.__last_actions):
+        self.__pseudo_arms.update(arm_id, feedback[ind][0])
+        self.__time += len(feedback[ind][0])
+      return
+    self.__pseudo_arms.update(self.__last_actions[0][0], feedback[0][0])
+    if self.__tree is not None:
+      arm_id = self.__last_actions[0][0]
+      total_pulls = self.__pseudo_arms.total_pulls()[arm_id]
+      self.__tree.update(
+          arm_id, self.__pseudo_arms.total_rewards()[arm_id] / total_pulls,
+          math.sqrt(self.__alpha / total_pulls))
     self.__time += 1
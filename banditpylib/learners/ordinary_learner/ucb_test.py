@@ -24,3 +24,43 @@ class TestUCB:
     for _ in range(arm_num + 1, horizon + 1):
       assert learner.actions() == [(0, 1)]
       learner.update(([np.array([0])], ))
+
+  def test_incremental(self):
+    arm_num = 20
+    horizon = 500
+    learner = UCB(arm_num=arm_num, horizon=horizon)
+    incremental_learner = UCB(arm_num=arm_num, horizon=horizon,
+                              incremental=True)
+    learner.reset()
+    incremental_learner.reset()
+    means = np.random.random(arm_num)
+    # both learners should pull the same arms when fed with the same rewards
+    for _ in range(horizon):
+      actions = learner.actions()
+      assert incremental_learner.actions() == actions
+      # pylint: disable=no-member
+      rewards = np.random.binomial(1, means[actions[0][0]], 1)
+      learner.update([(rewards, None)])
+      incremental_learner.update([(rewards, None)])
+
+  def test_batched_run(self):
+    arm_num = 5
+    horizon = 100
+    learner = UCB(arm_num=arm_num, horizon=horizon, batch_size=10,
+                  batch_growth=1.5)
+    learner.reset()
+    means = np.random.random(arm_num)
+    rounds = 0
+    total_pulls = 0
+    while True:
+      actions = learner.actions()
+      if actions is None:
+        break
+      # pylint: disable=no-member
+      learner.update([(np.random.binomial(1, means[arm_id], pulls), None)
+                      for (arm_id, pulls) in actions])
+      rounds += 1
+      total_pulls += sum([pulls for (_, pulls) in actions])
+    assert total_pulls == horizon
+    # 1 round of warm-up and rounds ending at 15, 25, 38, 58, 88 and 100
+    assert rounds == 7
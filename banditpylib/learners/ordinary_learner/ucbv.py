@@ -2,7 +2,7 @@ from typing import List, Tuple, Optional
 
 import numpy as np
 
-from banditpylib.arms import PseudoArm
+from banditpylib.arms import PseudoArmBank
 from .utils import OrdinaryLearner
 
 
@@ -19,15 +19,22 @@ class UCBV(OrdinaryLearner):
     Reward has to be bounded within :math:`[0, b]`.
   """
   def __init__(self, arm_num: int, horizon: int,
-               name: str = None, b: float = 1.0):
+               name: str = None, b: float = 1.0, batch_size: int = 1,
+               batch_growth: float = 1.0):
     """
     Args:
       arm_num: number of arms
       horizon: total number of time steps
       name: alias name
       b: upper bound of reward
+      batch_size: minimum number of pulls per round
+      batch_growth: growth rate of the ends of rounds
     """
-    super().__init__(arm_num=arm_num, horizon=horizon, name=name)
+    super().__init__(arm_num=arm_num,
+                     horizon=horizon,
+                     name=name,
+                     batch_size=batch_size,
+                     batch_growth=batch_growth)
     if b <= 0:
       raise Exception('%s: b is set to %.2f which is no greater than 0!' %
                       (self.name, b))
@@ -46,7 +53,7 @@ class UCBV(OrdinaryLearner):
     .. warning::
       This function should be called before the start of the game.
     """
-    self.__pseudo_arms = [PseudoArm() for arm_id in range(self.arm_num())]
+    self.__pseudo_arms = PseudoArmBank(arm_num=self.arm_num())
     # current time step
     self.__time = 1
 
@@ -55,14 +62,24 @@ class UCBV(OrdinaryLearner):
     Returns:
       optimistic estimate of arms' real means using empirical variance
     """
-    ucbv = [
-        arm.em_mean +
-        np.sqrt(2 * arm.em_var * np.log(self.__time) / arm.total_pulls()) +
-        self.__b * np.log(self.__time) / arm.total_pulls()
-        for arm in self.__pseudo_arms
-    ]
+    total_pulls = self.__pseudo_arms.total_pulls()
+    ucbv = self.__pseudo_arms.em_means + np.sqrt(
+        2 * self.__pseudo_arms.em_vars * np.log(self.__time) / total_pulls) + \
+        self.__b * np.log(self.__time) / total_pulls
     return ucbv
 
+  def batch_actions(self, total_pulls: np.ndarray, total_rewards: np.ndarray,
+                    sum_of_square_rewards: np.ndarray, time: int) -> np.ndarray:
+    """Arms with the maximum UCBV index in each trial"""
+    if time <= self.arm_num():
+      return np.full(len(total_pulls), (time - 1) % self.arm_num())
+    em_means = total_rewards / total_pulls
+    em_vars = sum_of_square_rewards / total_pulls - em_means**2
+    ucbv = em_means + np.sqrt(
+        2 * em_vars * np.log(time) / total_pulls) + \
+        self.__b * np.log(time) / total_pulls
+    return np.argmax(ucbv, axis=1)
+
   def actions(self, context=None) -> Optional[List[Tuple[int, int]]]:
     """
     Args:
@@ -75,7 +92,16 @@ class UCBV(OrdinaryLearner):
     if self.__time > self.horizon():
       self.__last_actions = None
     elif self.__time <= self.arm_num():
-      self.__last_actions = [((self.__time - 1) % self.arm_num(), 1)]
+      self.__last_actions = self._aggregate(self._warm_up_round(self.__time))
+    elif self.is_batched():
+      em_means = self.__pseudo_arms.em_means
+      em_vars = self.__pseudo_arms.em_vars
+      self.__last_actions = self._aggregate(
+          self._optimistic_round(
+              self.__time, self.__pseudo_arms.total_pulls(),
+              lambda pulls, time: em_means + np.sqrt(
+                  2 * em_vars * np.log(time) / pulls) + self.__b * np.log(
+                      time) / pulls))
     else:
       self.__last_actions = [(np.argmax(self.UCBV()), 1)]
     return self.__last_actions
@@ -87,5 +113,10 @@ class UCBV(OrdinaryLearner):
       feedback: feedback returned by the bandit environment by executing
         :func:`actions`
     """
-    self.__pseudo_arms[self.__last_actions[0][0]].update(feedback[0][0])
+    if self.is_batched():
+      for (ind, (arm_id, _)) in enumerate(self.__last_actions):
+        self.__pseudo_arms.update(arm_id, feedback[ind][0])
+        self.__time += len(feedback[ind][0])
+      return
+    self.__pseudo_arms.update(self.__last_actions[0][0], feedback[0][0])
     self.__time += 1
@@ -35,6 +35,11 @@ class Uniform(OrdinaryLearner):
     # current time step
     self.__time = 1
 
+  def batch_actions(self, total_pulls: np.ndarray, total_rewards: np.ndarray,
+                    sum_of_square_rewards: np.ndarray, time: int) -> np.ndarray:
+    """Arms pulled in a round-robin way in each trial"""
+    return np.full(len(total_pulls), (time - 1) % self.arm_num())
+
   def actions(self, context=None) -> Optional[List[Tuple[int, int]]]:
     """
     Args:
@@ -1,4 +1,7 @@
-from typing import Optional
+import math
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
 
 from banditpylib.bandits import OrdinaryBanditItf
 from banditpylib.learners import Learner, Goal, MaxReward
@@ -6,16 +9,31 @@ from banditpylib.learners import Learner, Goal, MaxReward
 
 # pylint: disable=W0223
 class OrdinaryLearner(Learner):
-  """Base class for learners in the ordinary multi-armed bandit
+  r"""Base class for learners in the ordinary multi-armed bandit
 
   This type of learners aim to maximize the expected total rewards.
+
+  By default, the learner pulls one arm per round. In batch mode i.e., when
+  `batch_size` is greater than 1 or `batch_growth` is greater than 1, the
+  learner commits to all the pulls of a round before observing any of their
+  rewards. The round starting at time step :math:`t` has
+  :math:`\max\{B, \lceil (g - 1) t \rceil\}` pulls, where :math:`B` is
+  `batch_size` and :math:`g` is `batch_growth`, so the rounds form a geometric
+  grid when :math:`g > 1`.
   """
-  def __init__(self, arm_num: int, horizon: int, name: Optional[str]):
+  def __init__(self,
+               arm_num: int,
+               horizon: int,
+               name: Optional[str],
+               batch_size: int = 1,
+               batch_growth: float = 1.0):
     """
     Args:
       arm_num: number of arms
       horizon: total number of time steps
       name: alias name
+      batch_size: minimum number of pulls per round
+      batch_growth: growth rate of the ends of rounds
     """
     super().__init__(name)
     if arm_num <= 1:
@@ -25,6 +43,14 @@ class OrdinaryLearner(Learner):
       raise Exception('Horizon %d is less than number of arms %d!' % \
           (horizon, arm_num))
     self.__horizon = horizon
+    if batch_size < 1:
+      raise Exception('Batch size %d is less than 1!' % batch_size)
+    if batch_growth < 1:
+      raise Exception('Batch growth %.2f is less than 1!' % batch_growth)
+    self.__batch_size = batch_size
+    self.__batch_growth = batch_growth
+    # goals are immutable so the same object is returned every time
+    self.__goal = MaxReward()
 
   @property
   def running_environment(self) -> type:
@@ -53,7 +79,102 @@ class OrdinaryLearner(Learner):
     """
     self.__horizon = horizon
 
+  def is_batched(self) -> bool:
+    """
+    Returns:
+      whether the learner pulls more than one arm per round
+    """
+    return self.__batch_size > 1 or self.__batch_growth > 1
+
+  def round_pulls(self, time: int) -> int:
+    """
+    Args:
+      time: time step at which the round starts
+
+    Returns:
+      number of pulls of the round starting at `time`
+    """
+    pulls = max(self.__batch_size,
+                math.ceil((self.__batch_growth - 1) * time))
+    return min(pulls, self.__horizon - time + 1)
+
+  @staticmethod
+  def _aggregate(arm_ids: np.ndarray) -> List[Tuple[int, int]]:
+    """Aggregate pulls of the same arm
+
+    Args:
+      arm_ids: arm of each pull
+
+    Returns:
+      arms to pull with the number of pulls of each arm
+    """
+    pulls = np.bincount(arm_ids)
+    return [(int(arm_id), int(pulls[arm_id]))
+            for arm_id in np.flatnonzero(pulls)]
+
+  def _warm_up_round(self, time: int) -> np.ndarray:
+    """Arms to pull in the round starting at `time` during warm-up
+
+    During the first `arm_num` time steps, each arm is pulled once in turn and
+    the round ends once all the arms have been pulled.
+
+    Args:
+      time: time step at which the round starts
+
+    Returns:
+      arm of each pull in the round
+    """
+    return np.arange(time - 1,
+                     min(self.__arm_num, time - 1 + self.round_pulls(time)))
+
+  def _optimistic_round(
+      self, time: int, total_pulls: np.ndarray,
+      index: Callable[[np.ndarray, int], np.ndarray]) -> np.ndarray:
+    """Arms to pull in the round starting at `time` by an index policy
+
+    The pulls are chosen one by one by maximizing the index, where the pulls
+    already chosen in the round are counted as if they had been played i.e.,
+    their pending rewards only shrink the confidence bounds.
+
+    Args:
+      time: time step at which the round starts
+      total_pulls: total number of pulls of each arm
+      index: function computing the index of each arm given the number of pulls
+        of each arm and the time step
+
+    Returns:
+      arm of each pull in the round
+    """
+    pulls = np.array(total_pulls, dtype=float)
+    arm_ids = np.zeros(self.round_pulls(time), dtype=int)
+    for i in range(len(arm_ids)):
+      arm_ids[i] = np.argmax(index(pulls, time + i))
+      pulls[arm_ids[i]] += 1
+    return arm_ids
+
+  def batch_actions(self, total_pulls: np.ndarray, total_rewards: np.ndarray,
+                    sum_of_square_rewards: np.ndarray, time: int) -> np.ndarray:
+    """Arms to pull in a batch of independent trials played in lockstep
+
+    This method is used by
+    :class:`banditpylib.protocols.BatchSinglePlayerProtocol` to play many
+    trials at once. Each row of the statistics corresponds to one trial and
+    each column corresponds to one arm. Learners supporting batch trials
+    override this method and compute the actions of all the trials with
+    vectorized operations.
+
+    Args:
+      total_pulls: total number of pulls of each arm in each trial
+      total_rewards: total rewards of each arm in each trial
+      sum_of_square_rewards: sum of squared rewards of each arm in each trial
+      time: current time step which is shared by all the trials
+
+    Returns:
+      arm to pull in each trial
+    """
+    raise Exception('%s does not support batch trials!' % self.name)
+
   @property
   def goal(self) -> Goal:
     """goal of the learner"""
-    return MaxReward()
+    return self.__goal
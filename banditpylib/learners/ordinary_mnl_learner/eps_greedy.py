@@ -2,8 +2,8 @@ from typing import List, Tuple, Set, Optional
 
 import numpy as np
 
-from banditpylib.bandits import search_best_assortment, Reward, search, \
-    local_search_best_assortment
+from banditpylib.bandits import search_best_assortment, Reward, \
+    local_search_best_assortment, sample_assortment
 from .utils import OrdinaryMNLLearner
 
 
@@ -21,7 +21,8 @@ class EpsGreedy(OrdinaryMNLLearner):
                name=None,
                use_local_search=False,
                random_neighbors=10,
-               eps=1.0):
+               eps=1.0,
+               full_neighborhood=False):
     """
     Args:
       revenues: product revenues
@@ -34,6 +35,8 @@ class EpsGreedy(OrdinaryMNLLearner):
       random_neighbors: number of random neighbors to look up if local search is
         used
       eps: epsilon
+      full_neighborhood: whether to look up all the neighbors rather than random
+        ones if local search is used
     """
     super().__init__(
         revenues=revenues,
@@ -42,7 +45,8 @@ class EpsGreedy(OrdinaryMNLLearner):
         card_limit=card_limit,
         name=name,
         use_local_search=use_local_search,
-        random_neighbors=random_neighbors)
+        random_neighbors=random_neighbors,
+        full_neighborhood=full_neighborhood)
     if eps <= 0:
       raise Exception('Epsilon %.2f in %s is no greater than 0!' % \
           (eps, self.__name))
@@ -86,14 +90,13 @@ class EpsGreedy(OrdinaryMNLLearner):
     return unbiased_est
 
   def select_ramdom_assort(self) -> Set[int]:
-    assortments: List[Set[int]] = []
-    search(assortments=assortments,
-           product_num=self.product_num(),
-           next_product_id=1,
-           assortment=set(),
-           card_limit=self.card_limit())
-    # pylint: disable=no-member
-    return assortments[int(np.random.randint(0, len(assortments)))]
+    """
+    Returns:
+      assortment sampled uniformly from all the assortments satisfying
+      cardinality limit
+    """
+    return sample_assortment(product_num=self.product_num(),
+                             card_limit=self.card_limit())
 
   def actions(self, context=None) -> Optional[List[Tuple[Set[int], int]]]:
     """
@@ -123,6 +126,7 @@ class EpsGreedy(OrdinaryMNLLearner):
         _, best_assortment = local_search_best_assortment(
             reward=self.reward,
             random_neighbors=self.random_neighbors,
+            full_neighborhood=self.full_neighborhood,
             card_limit=self.card_limit(),
             init_assortment=(
                 self.__last_actions[0][0] if self.__last_actions else None))
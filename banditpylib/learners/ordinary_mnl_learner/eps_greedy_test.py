@@ -21,6 +21,22 @@ class TestEpsGreedy:
     assert random_assortment != set()
     assert len(random_assortment) <= card_limit
 
+  def test_exploration(self):
+    revenues = np.array([0, 0.7, 0.8, 0.9, 1.0])
+    horizon = 100
+    reward = MeanReward()
+    card_limit = 2
+    learner = EpsGreedy(revenues=revenues,
+                        horizon=horizon,
+                        reward=reward,
+                        card_limit=card_limit)
+    learner.reset()
+    # an assortment is sampled at random at the first time step since the
+    # exploration probability is eps / t = 1
+    ((assortment, _), ) = learner.actions()
+    assert 1 <= len(assortment) <= card_limit
+    assert assortment.issubset({1, 2, 3, 4})
+
   def test_simple_run(self):
     revenues = np.array([0, 0.45, 0.8, 0.9, 1.0])
     horizon = 100
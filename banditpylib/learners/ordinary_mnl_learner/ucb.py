@@ -16,7 +16,8 @@ class UCB(OrdinaryMNLLearner):
                card_limit=np.inf,
                name=None,
                use_local_search=False,
-               random_neighbors=10):
+               random_neighbors=10,
+               full_neighborhood=False):
     """
     Args:
       revenues: product revenues
@@ -28,6 +29,8 @@ class UCB(OrdinaryMNLLearner):
         assortment
       random_neighbors: number of random neighbors to look up if local search is
         used
+      full_neighborhood: whether to look up all the neighbors rather than random
+        ones if local search is used
     """
     super().__init__(
         revenues=revenues,
@@ -36,7 +39,8 @@ class UCB(OrdinaryMNLLearner):
         card_limit=card_limit,
         name=name,
         use_local_search=use_local_search,
-        random_neighbors=random_neighbors)
+        random_neighbors=random_neighbors,
+        full_neighborhood=full_neighborhood)
 
   def _name(self) -> str:
     """
@@ -103,6 +107,7 @@ class UCB(OrdinaryMNLLearner):
         _, best_assortment = local_search_best_assortment(
             reward=self.reward,
             random_neighbors=self.random_neighbors,
+            full_neighborhood=self.full_neighborhood,
             card_limit=self.card_limit(),
             init_assortment=(
                 self.__last_actions[0][0] if self.__last_actions else None))
@@ -22,7 +22,8 @@ class OrdinaryMNLLearner(Learner):
                card_limit: int,
                name: str,
                use_local_search: bool,
-               random_neighbors: int):
+               random_neighbors: int,
+               full_neighborhood: bool = False):
     """
     Args:
       revenues: product revenues
@@ -34,8 +35,12 @@ class OrdinaryMNLLearner(Learner):
         assortment
       random_neighbors: number of random neighbors to look up if local search is
         enabled
+      full_neighborhood: whether to look up all the neighbors rather than random
+        ones if local search is enabled
     """
     super().__init__(name)
+    # goals are immutable so the same object is returned every time
+    self.__goal = MaxReward()
     self.__product_num = len(revenues) - 1
     if self.__product_num < 2:
       raise Exception('Number of products %d is less then 2!' %
@@ -58,6 +63,7 @@ class OrdinaryMNLLearner(Learner):
       raise Exception('Times of local search %d is less than 3!' %
                       random_neighbors)
     self.__random_neighbors = random_neighbors
+    self.__full_neighborhood = full_neighborhood
 
   @property
   def running_environment(self) -> type:
@@ -107,6 +113,11 @@ class OrdinaryMNLLearner(Learner):
     """number of random neighbors to look up when local search is enabled"""
     return self.__random_neighbors
 
+  @property
+  def full_neighborhood(self) -> bool:
+    """whether all the neighbors are looked up when local search is enabled"""
+    return self.__full_neighborhood
+
   def set_horizon(self, horizon: int):
     """
     Args:
@@ -117,4 +128,4 @@ class OrdinaryMNLLearner(Learner):
   @property
   def goal(self) -> Goal:
     """goal of the learner"""
-    return MaxReward()
+    return self.__goal
@@ -1,22 +1,30 @@
 from typing import List, Tuple, Optional
 
+import math
 import numpy as np
 
-from banditpylib.arms import PseudoArm
-from banditpylib.learners import Goal, AllCorrect
+from banditpylib.arms import PseudoArmBank
+from banditpylib.learners import Goal, AllCorrect, TournamentTree
 from .utils import ThresBanditLearner
 
 
 class APT(ThresBanditLearner):
   """Anytime Parameter-free Thresholding algorithm
   :cite:`DBLP:conf/icml/LocatelliGC16`
+
+  .. note::
+    Since the metric of an arm only depends on its own empirical information,
+    when `incremental` is set, the metrics are maintained in a
+    :class:`banditpylib.learners.TournamentTree` and only the metric of the
+    pulled arm is updated during each time step.
   """
   def __init__(self,
                arm_num: int,
                budget: int,
                theta: float,
                eps: float,
-               name: str = None):
+               name: str = None,
+               incremental: bool = False):
     """
     Args:
       arm_num: number of arms
@@ -24,10 +32,12 @@ class APT(ThresBanditLearner):
       theta: threshold
       eps: radius of indifferent zone
       name: alias name
+      incremental: whether to maintain the metrics incrementally
     """
     super().__init__(arm_num=arm_num, budget=budget, name=name)
     self.__theta = theta
     self.__eps = eps
+    self.__incremental = incremental
 
   def _name(self) -> str:
     """
@@ -42,22 +52,34 @@ class APT(ThresBanditLearner):
     .. warning::
       This function should be called before the start of the game.
     """
-    self.__pseudo_arms = [PseudoArm() for arm_id in range(self.arm_num())]
+    self.__pseudo_arms = PseudoArmBank(arm_num=self.arm_num())
     # current time step
     self.__time = 1
+    # negative metrics of arms maintained incrementally
+    self.__tree = None
 
   def __metrics(self) -> np.ndarray:
     """
     Returns:
       metrics of apt for each arm
     """
-    metrics = [
-        np.sqrt(arm.total_pulls()) *
-        (np.abs(arm.em_mean - self.__theta) + self.__eps)
-        for arm in self.__pseudo_arms
-    ]
+    metrics = np.sqrt(self.__pseudo_arms.total_pulls()) * (
+        np.abs(self.__pseudo_arms.em_means - self.__theta) + self.__eps)
     return metrics
 
+  def __arm_metric(self, arm_id: int) -> float:
+    """
+    Args:
+      arm_id: arm id
+
+    Returns:
+      metric of apt for `arm_id`
+    """
+    total_pulls = self.__pseudo_arms.total_pulls()[arm_id]
+    return math.sqrt(total_pulls) * (abs(
+        self.__pseudo_arms.total_rewards()[arm_id] / total_pulls -
+        self.__theta) + self.__eps)
+
   def actions(self, context=None) -> Optional[List[Tuple[int, int]]]:
     """
     Args:
@@ -71,6 +93,10 @@ class APT(ThresBanditLearner):
       self.__last_actions = None
     elif self.__time <= self.arm_num():
       self.__last_actions = [((self.__time - 1) % self.arm_num(), 1)]
+    elif self.__incremental:
+      if self.__tree is None:
+        self.__tree = TournamentTree(-self.__metrics())
+      self.__last_actions = [(self.__tree.argmax(), 1)]
     else:
       self.__last_actions = [(np.argmin(self.__metrics()), 1)]
     return self.__last_actions
@@ -82,12 +108,13 @@ class APT(ThresBanditLearner):
       feedback: feedback returned by the bandit environment by executing
         `self.__last_actions`
     """
-    self.__pseudo_arms[self.__last_actions[0][0]].update(feedback[0][0])
+    self.__pseudo_arms.update(self.__last_actions[0][0], feedback[0][0])
+    if self.__tree is not None:
+      arm_id = self.__last_actions[0][0]
+      self.__tree.update(arm_id, -self.__arm_metric(arm_id))
     self.__time += 1
 
   @property
   def goal(self) -> Goal:
-    answers = [
-        1 if arm.em_mean >= self.__theta else 0 for arm in self.__pseudo_arms
-    ]
+    answers = (self.__pseudo_arms.em_means >= self.__theta).astype(int).tolist()
     return AllCorrect(answers=answers)
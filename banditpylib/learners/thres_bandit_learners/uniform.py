@@ -2,7 +2,7 @@ from typing import List, Tuple, Optional
 
 import numpy as np
 
-from banditpylib.arms import PseudoArm
+from banditpylib.arms import PseudoArmBank
 from banditpylib.learners import Goal, AllCorrect
 from .utils import ThresBanditLearner
 
@@ -43,7 +43,7 @@ class Uniform(ThresBanditLearner):
     .. warning::
       This function should be called before the start of the game.
     """
-    self.__pseudo_arms = [PseudoArm() for arm_id in range(self.arm_num())]
+    self.__pseudo_arms = PseudoArmBank(arm_num=self.arm_num())
     # current time step
     self.__time = 1
 
@@ -69,12 +69,10 @@ class Uniform(ThresBanditLearner):
       feedback: feedback returned by the bandit environment by executing
         `self.__last_actions`
     """
-    self.__pseudo_arms[self.__last_actions[0][0]].update(feedback[0][0])
+    self.__pseudo_arms.update(self.__last_actions[0][0], feedback[0][0])
     self.__time += 1
 
   @property
   def goal(self) -> Goal:
-    answers = [
-        1 if arm.em_mean >= self.__theta else 0 for arm in self.__pseudo_arms
-    ]
+    answers = (self.__pseudo_arms.em_means >= self.__theta).astype(int).tolist()
     return AllCorrect(answers=answers)
@@ -38,8 +38,172 @@ def argmax_tuple(values: List[Tuple[float, int]]) -> int:
   return np.random.choice(max_value_indexes)
 
 
+class TournamentTree:
+  r"""Tournament tree
+
+  This class maintains the index with the highest value among a list of
+  values, where the value of index :math:`i` is a linear function
+  :math:`a_i + b_i x` of a parameter :math:`x` which can only increase. When
+  all the slopes :math:`b_i` are 0, this is an ordinary tournament tree.
+
+  Each internal node of the tree stores the winner of its subtree and the
+  value of :math:`x` at which the loser overtakes the winner i.e., a kinetic
+  tournament tree. Changing one value costs :math:`O(\log n)` and looking up
+  the index with the highest value costs :math:`O(1)`, where :math:`n` is the
+  number of values. Increasing :math:`x` costs :math:`O(\log n)` for each
+  winner that changes.
+
+  When there is a tie, the smallest index is returned, which is consistent with
+  `np.argmax`.
+  """
+  def __init__(self,
+               values: List[float],
+               slopes: List[float] = None,
+               x: float = 0.0):
+    """
+    Args:
+      values: initial values i.e., intercepts of the linear functions
+      slopes: slopes of the linear functions. All slopes are 0 if it is `None`.
+      x: initial value of the parameter
+    """
+    if len(values) < 1:
+      raise Exception('Number of values %d is less than 1!' % len(values))
+    self.__size = len(values)
+    # leaves of the tree start from `self.__capacity`
+    self.__capacity = 1
+    while self.__capacity < self.__size:
+      self.__capacity *= 2
+    padding = self.__capacity - self.__size
+    intercepts = np.concatenate(
+        (np.asarray(values, dtype=float), np.full(padding, -np.inf)))
+    slopes = np.concatenate(
+        (np.zeros(self.__size) if slopes is None else np.asarray(
+            slopes, dtype=float), np.zeros(padding)))
+    # winner of the subtree rooted at each node, the value of x at which the
+    # winner of the node changes and the minimum of such values within the
+    # subtree, which are computed level by level from the leaves
+    winners = [np.arange(self.__capacity)]
+    certs = [np.full(self.__capacity, np.inf)]
+    min_certs = [np.full(self.__capacity, np.inf)]
+    while len(winners[-1]) > 1:
+      left, right = winners[-1][0::2], winners[-1][1::2]
+      left_wins = (intercepts[left] + slopes[left] * x) >= (
+          intercepts[right] + slopes[right] * x)
+      winner = np.where(left_wins, left, right)
+      loser = np.where(left_wins, right, left)
+      slope_diff = slopes[loser] - slopes[winner]
+      cert = np.full(len(winner), np.inf)
+      overtaking = slope_diff > 0
+      cert[overtaking] = np.maximum(
+          x, (intercepts[winner[overtaking]] - intercepts[loser[overtaking]]) /
+          slope_diff[overtaking])
+      cert[np.isnan(cert)] = np.inf
+      winners.append(winner)
+      certs.append(cert)
+      min_certs.append(
+          np.minimum(cert,
+                     np.minimum(min_certs[-1][0::2], min_certs[-1][1::2])))
+    # python lists are faster than numpy arrays for element-wise access
+    self.__intercepts = intercepts.tolist()
+    self.__slopes = slopes.tolist()
+    self.__x = float(x)
+    self.__winners = [0] + np.concatenate(winners[::-1]).tolist()
+    self.__certs = [np.inf] + np.concatenate(certs[::-1]).tolist()
+    self.__min_certs = [np.inf] + np.concatenate(min_certs[::-1]).tolist()
+
+  def __len__(self) -> int:
+    return self.__size
+
+  @property
+  def x(self) -> float:
+    """current value of the parameter"""
+    return self.__x
+
+  def value(self, index: int) -> float:
+    """
+    Args:
+      index: index of the value
+
+    Returns:
+      current value of `index`
+    """
+    return self.__intercepts[index] + self.__slopes[index] * self.__x
+
+  def __fix(self, node: int):
+    """Recompute the winners of `node` and its ancestors
+
+    Args:
+      node: node to start from
+    """
+    intercepts, slopes, x = self.__intercepts, self.__slopes, self.__x
+    while node >= 1:
+      left, right = self.__winners[2 * node], self.__winners[2 * node + 1]
+      if intercepts[left] + slopes[left] * x >= \
+          intercepts[right] + slopes[right] * x:
+        winner, loser = left, right
+      else:
+        winner, loser = right, left
+      cert = np.inf
+      if slopes[loser] > slopes[winner]:
+        cert = max(x, (intercepts[winner] - intercepts[loser]) /
+                   (slopes[loser] - slopes[winner]))
+        if cert != cert:
+          # nan is caused by infinite values
+          cert = np.inf
+      self.__winners[node] = winner
+      self.__certs[node] = cert
+      self.__min_certs[node] = min(cert, self.__min_certs[2 * node],
+                                   self.__min_certs[2 * node + 1])
+      node //= 2
+
+  def update(self, index: int, value: float, slope: float = 0.0):
+    """Change one value
+
+    Args:
+      index: index of the value to change
+      value: new value i.e., intercept of the linear function
+      slope: new slope of the linear function
+    """
+    if index < 0 or index >= self.__size:
+      raise Exception('Index %d is out of range [0, %d)!' %
+                      (index, self.__size))
+    self.__intercepts[index] = float(value)
+    self.__slopes[index] = float(slope)
+    self.__fix((self.__capacity + index) // 2)
+
+  def advance(self, x: float):
+    """Increase the parameter
+
+    Args:
+      x: new value of the parameter
+    """
+    if x < self.__x:
+      raise Exception('Parameter %.2f is less than the current one %.2f!' %
+                      (x, self.__x))
+    self.__x = float(x)
+    # replay the nodes whose winners change one by one
+    while self.__min_certs[1] < self.__x:
+      node = 1
+      while self.__certs[node] >= self.__x:
+        node = 2 * node if self.__min_certs[2 * node] < self.__x \
+            else 2 * node + 1
+      self.__fix(node)
+
+  def argmax(self) -> int:
+    """
+    Returns:
+      index with the highest value
+    """
+    return self.__winners[1]
+
+
 class Goal(ABC):
-  """Base class for the goal of a learner"""
+  """Base class for the goal of a learner
+
+  Goals are immutable so that learners can cache and share them.
+  """
+  __slots__ = ('__value',)
+
   def __init__(self, value: Any):
     """
     Args:
@@ -60,6 +224,8 @@ class Goal(ABC):
 
 class BestArmId(Goal):
   """Best arm identification"""
+  __slots__ = ()
+
   def __init__(self, best_arm: int):
     """
     Args:
@@ -75,6 +241,8 @@ class BestArmId(Goal):
 
 class MaxReward(Goal):
   """Reward maximization"""
+  __slots__ = ()
+
   def __init__(self):
     """
     Args:
@@ -90,6 +258,8 @@ class MaxReward(Goal):
 
 class MaxCorrectAnswers(Goal):
   """Maximize correct answers"""
+  __slots__ = ()
+
   def __init__(self, answers: List[int]):
     """
     Args:
@@ -105,6 +275,8 @@ class MaxCorrectAnswers(Goal):
 
 class AllCorrect(Goal):
   """Make all answers correct"""
+  __slots__ = ()
+
   def __init__(self, answers: List[int]):
     """
     Args:
@@ -0,0 +1,47 @@
+import numpy as np
+
+from .utils import TournamentTree, BestArmId, MaxReward
+
+
+class TestTournamentTree:
+  """Test tournament tree"""
+
+  def test_argmax(self):
+    values = np.random.random(11)
+    tree = TournamentTree(values)
+    assert tree.argmax() == np.argmax(values)
+    for _ in range(20):
+      index = np.random.randint(0, len(values))
+      values[index] = np.random.random()
+      tree.update(index, values[index])
+      assert tree.argmax() == np.argmax(values)
+
+  def test_tie(self):
+    tree = TournamentTree([0, 1, 1, 0, 1])
+    assert tree.argmax() == 1
+    tree.update(1, 0)
+    assert tree.argmax() == 2
+
+  def test_advance(self):
+    intercepts = np.random.random(13)
+    slopes = np.random.random(13)
+    tree = TournamentTree(intercepts, slopes)
+    for x in np.linspace(0, 5, 50):
+      tree.advance(x)
+      assert tree.argmax() == np.argmax(intercepts + slopes * x)
+      index = np.random.randint(0, len(intercepts))
+      intercepts[index] = np.random.random()
+      slopes[index] = np.random.random()
+      tree.update(index, intercepts[index], slopes[index])
+      assert tree.argmax() == np.argmax(intercepts + slopes * x)
+
+
+class TestGoal:
+  """Test goals"""
+
+  def test_slots(self):
+    goal = BestArmId(best_arm=1)
+    assert goal.value == 1
+    # goals have no instance dictionary
+    assert not hasattr(goal, '__dict__')
+    assert not hasattr(MaxReward(), '__dict__')
@@ -1,8 +1,16 @@
 from .utils import *
+from .writers import *
+from .checkpoints import *
 from .single_player import *
+from .batch_single_player import *
 
 
 __all__ = [
+    'ResultWriter',
+    'JsonlWriter',
+    'NpzWriter',
+    'CheckpointScheduler',
     'Protocol',
     'SinglePlayerProtocol',
+    'BatchSinglePlayerProtocol',
 ]
@@ -0,0 +1,128 @@
+from typing import List, Dict, Union
+
+import numpy as np
+
+from absl import logging
+
+from banditpylib.bandits import OrdinaryBandit
+from banditpylib.learners.ordinary_learner import OrdinaryLearner
+from .checkpoints import CheckpointScheduler
+from .utils import Protocol, set_random_seed
+
+
+class BatchSinglePlayerProtocol(Protocol):
+  """Batch single player protocol
+
+  This protocol simulates a batch of independent trials of the ordinary
+  single-player game in lockstep. The empirical information of all the trials
+  is kept in arrays of shape (trials, arms) and during each time step, the
+  protocol runs the following steps in sequence.
+
+  * ask the learner for the arm to pull in every trial via
+    :func:`banditpylib.learners.ordinary_learner.OrdinaryLearner.batch_actions`
+  * pull the arms of all the trials via
+    :func:`banditpylib.bandits.OrdinaryBandit.batch_pull`
+  * update the empirical information of all the trials
+
+  The simulation stops when the horizon of the learner is reached.
+
+  .. note::
+    Each trial of :func:`play` simulates `batch_size` games and hence dumps
+    `batch_size` times as many records as :class:`SinglePlayerProtocol`.
+
+  .. warning::
+    Only learners of the ordinary bandit pulling one arm per time step are
+    supported.
+  """
+  def __init__(self,
+               bandit: OrdinaryBandit,
+               learners: List[OrdinaryLearner],
+               batch_size: int = 1000,
+               intermediate_regrets: Union[List[int],
+                                           CheckpointScheduler] = None):
+    """
+    Args:
+      bandit: bandit environment
+      learners: learners to be compared with
+      batch_size: number of games simulated in lockstep within one trial
+      intermediate_regrets: a list of intermediate times or a checkpoint
+        scheduler to record intermediate regrets
+    """
+    super().__init__(bandit=bandit, learners=learners)
+    if not isinstance(bandit, OrdinaryBandit):
+      raise Exception('Bandit %s is not an ordinary bandit!' % bandit.name)
+    if batch_size < 1:
+      raise Exception('Batch size %d is less than 1!' % batch_size)
+    self.__batch_size = batch_size
+    if not isinstance(intermediate_regrets, CheckpointScheduler):
+      intermediate_regrets = CheckpointScheduler(
+          intermediate_regrets if intermediate_regrets is not None else [])
+    self.__intermediate_regrets = intermediate_regrets
+
+  @property
+  def name(self) -> str:
+    """default protocol name"""
+    return 'batch_single_player_protocol'
+
+  def _one_trial(self, random_seed: int, debug: bool) -> List[Dict]:
+    """One trial of the game
+
+    This method simulates `batch_size` games in lockstep.
+
+    Args:
+      random_seed: random seed
+      debug: whether to run the trial in debug mode
+
+    Returns:
+      result of one trial
+    """
+    if debug:
+      logging.set_verbosity(logging.DEBUG)
+    set_random_seed(random_seed)
+
+    self.bandit.reset()
+    self.current_learner.reset()
+
+    shape = (self.__batch_size, self.bandit.arm_num())
+    total_pulls = np.zeros(shape)
+    total_rewards = np.zeros(shape)
+    sum_of_square_rewards = np.zeros(shape)
+    trial_ids = np.arange(self.__batch_size)
+
+    one_trial_data = []
+    # number of rounds to communicate with the bandit environment
+    adaptive_rounds = 0
+
+    def record_data():
+      if self.bandit.expected_regret:
+        regrets = self.bandit.batch_expected_regret(total_pulls)
+      else:
+        regrets = self.bandit.batch_regret(np.sum(total_rewards, axis=1),
+                                           adaptive_rounds)
+      for regret in regrets:
+        one_trial_data.append(
+            dict({
+                'bandit': self.bandit.name,
+                'learner': self.current_learner.name,
+                'rounds': adaptive_rounds,
+                'total_actions': adaptive_rounds,
+                'regret': float(regret)
+            }))
+
+    for time in range(1, self.current_learner.horizon() + 1):
+      arm_ids = self.current_learner.batch_actions(total_pulls, total_rewards,
+                                                   sum_of_square_rewards, time)
+
+      # record intermediate regrets
+      if self.__intermediate_regrets.position(adaptive_rounds) is not None:
+        record_data()
+
+      rewards = self.bandit.batch_pull(arm_ids)
+      total_pulls[trial_ids, arm_ids] += 1
+      total_rewards[trial_ids, arm_ids] += rewards
+      sum_of_square_rewards[trial_ids, arm_ids] += rewards**2
+      adaptive_rounds += 1
+
+    # record final regret
+    record_data()
+    return one_trial_data
@@ -0,0 +1,25 @@
+import tempfile
+
+from banditpylib.arms import BernoulliArm
+from banditpylib.bandits import OrdinaryBandit
+from banditpylib.learners.ordinary_learner import UCB
+from .batch_single_player import BatchSinglePlayerProtocol
+
+
+class TestBatchSinglePlayer:
+  """Test batch single player protocol"""
+
+  def test_simple_run(self):
+    means = [0.3, 0.5, 0.7]
+    arms = [BernoulliArm(mean) for mean in means]
+    ordinary_bandit = OrdinaryBandit(arms)
+    ucb_learner = UCB(arm_num=3, horizon=10)
+    batch_single_player = BatchSinglePlayerProtocol(bandit=ordinary_bandit,
+                                                    learners=[ucb_learner],
+                                                    batch_size=4)
+    temp_file = tempfile.NamedTemporaryFile()
+    batch_single_player.play(trials=3, output_filename=temp_file.name)
+    with open(temp_file.name, 'r') as f:
+      # check number of records is 3 * 4
+      lines = f.readlines()
+      assert len(lines) == 12
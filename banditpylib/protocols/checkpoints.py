@@ -0,0 +1,90 @@
+import math
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+class CheckpointScheduler:
+  """Checkpoint scheduler
+
+  This class stores the checkpoints i.e., the numbers of rounds at which
+  intermediate regrets are recorded. Checkpoints are kept sorted without
+  duplicates and each one is mapped to its position so that whether a round is
+  a checkpoint and where to store its result are both looked up in constant
+  time.
+  """
+  def __init__(self, checkpoints: Iterable[int]):
+    """
+    Args:
+      checkpoints: numbers of rounds at which intermediate regrets are recorded
+    """
+    checkpoints = sorted(set(int(checkpoint) for checkpoint in checkpoints))
+    if checkpoints and checkpoints[0] < 0:
+      raise Exception('Checkpoint %d is negative!' % checkpoints[0])
+    self.__checkpoints = np.array(checkpoints, dtype=int)
+    self.__positions = {
+        checkpoint: position
+        for (position, checkpoint) in enumerate(checkpoints)
+    }
+
+  @classmethod
+  def log_spaced(cls, horizon: int, num: int) -> 'CheckpointScheduler':
+    """Checkpoints evenly spaced on a log scale
+
+    Args:
+      horizon: last checkpoint
+      num: maximum number of checkpoints. There may be fewer checkpoints since
+        the small ones are rounded to the same integers.
+
+    Returns:
+      checkpoint scheduler with checkpoints within [1, `horizon`]
+    """
+    if horizon < 1:
+      raise Exception('Horizon %d is less than 1!' % horizon)
+    if num < 1:
+      raise Exception('Number of checkpoints %d is less than 1!' % num)
+    return cls(np.rint(np.geomspace(1, horizon, num)).astype(int))
+
+  @classmethod
+  def geometric(cls, horizon: int, ratio: float = 2.0,
+                start: int = 1) -> 'CheckpointScheduler':
+    """Checkpoints forming a geometric grid
+
+    Args:
+      horizon: maximum checkpoint
+      ratio: ratio between two consecutive checkpoints
+      start: first checkpoint
+
+    Returns:
+      checkpoint scheduler with checkpoints `start`, `start * ratio`, ...
+      rounded up to integers and no greater than `horizon`
+    """
+    if ratio <= 1:
+      raise Exception('Ratio %.2f is no greater than 1!' % ratio)
+    if start < 1:
+      raise Exception('First checkpoint %d is less than 1!' % start)
+    checkpoints = []
+    checkpoint = float(start)
+    while math.ceil(checkpoint) <= horizon:
+      checkpoints.append(math.ceil(checkpoint))
+      checkpoint *= ratio
+    return cls(checkpoints)
+
+  def __len__(self) -> int:
+    return len(self.__checkpoints)
+
+  @property
+  def checkpoints(self) -> np.ndarray:
+    """sorted checkpoints"""
+    return self.__checkpoints
+
+  def position(self, rounds: int) -> Optional[int]:
+    """
+    Args:
+      rounds: number of rounds
+
+    Returns:
+      position of `rounds` among the checkpoints. `None` if `rounds` is not a
+      checkpoint.
+    """
+    return self.__positions.get(rounds)
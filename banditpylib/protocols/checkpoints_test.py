@@ -0,0 +1,17 @@
+from .checkpoints import CheckpointScheduler
+
+
+class TestCheckpointScheduler:
+  """Test checkpoint scheduler"""
+
+  def test_position(self):
+    scheduler = CheckpointScheduler([10, 2, 5, 5])
+    assert list(scheduler.checkpoints) == [2, 5, 10]
+    assert scheduler.position(5) == 1
+    assert scheduler.position(6) is None
+
+  def test_grids(self):
+    scheduler = CheckpointScheduler.log_spaced(horizon=1000, num=4)
+    assert list(scheduler.checkpoints) == [1, 10, 100, 1000]
+    scheduler = CheckpointScheduler.geometric(horizon=20, ratio=1.5, start=2)
+    assert list(scheduler.checkpoints) == [2, 3, 5, 7, 11, 16]
@@ -1,12 +1,13 @@
-from typing import List, Dict
-
-import numpy as np
+from typing import List, Dict, Union
 
 from absl import logging
 
+import numpy as np
+
 from banditpylib.bandits import Bandit
 from banditpylib.learners import Learner
-from .utils import Protocol
+from .checkpoints import CheckpointScheduler
+from .utils import Protocol, set_random_seed
 
 
 class SinglePlayerProtocol(Protocol):
@@ -24,21 +25,42 @@ class SinglePlayerProtocol(Protocol):
   .. note::
     The total number of rounds shows how adaptive the learner is and it is at
     most the total number of actions.
+
+  .. note::
+    Intermediate regrets are recorded at the checkpoints of a
+    :class:`CheckpointScheduler`. By default, one record is dumped per
+    checkpoint. When `compact_records` is set, the intermediate regrets and the
+    total actions at the checkpoints are stored in preallocated arrays and
+    dumped together with the final regret as one record per trial under keys
+    `intermediate_regrets` and `intermediate_actions`. Entries of checkpoints
+    which are not reached are `nan` and -1 respectively. :class:`JsonlWriter`
+    writes `nan` as `null`.
+
+  .. note::
+    When snapshots are enabled in :func:`play`, the progress of a trial is
+    saved between rounds so that an interrupted trial can be continued.
   """
   def __init__(self,
                bandit: Bandit,
                learners: List[Learner],
-               intermediate_regrets: List[int] = None):
+               intermediate_regrets: Union[List[int],
+                                           CheckpointScheduler] = None,
+               compact_records: bool = False):
     """
     Args:
       bandit: bandit environment
       learner: learners to be compared with
-      intermediate_regrets: a list of intermediate times to record
-        intermediate regrets
+      intermediate_regrets: a list of intermediate times or a checkpoint
+        scheduler to record intermediate regrets
+      compact_records: whether to dump one record per trial with the
+        intermediate regrets stored in arrays
     """
     super().__init__(bandit=bandit, learners=learners)
-    self.__intermediate_regrets = \
-        intermediate_regrets if intermediate_regrets is not None else []
+    if not isinstance(intermediate_regrets, CheckpointScheduler):
+      intermediate_regrets = CheckpointScheduler(
+          intermediate_regrets if intermediate_regrets is not None else [])
+    self.__intermediate_regrets = intermediate_regrets
+    self.__compact_records = compact_records
 
   @property
   def name(self) -> str:
@@ -59,17 +81,30 @@ class SinglePlayerProtocol(Protocol):
     """
     if debug:
       logging.set_verbosity(logging.DEBUG)
-    np.random.seed(random_seed)
-
-    # reset the bandit environment and the learner
-    self.bandit.reset()
-    self.current_learner.reset()
-
-    one_trial_data = []
+    set_random_seed(random_seed)
+
+    state = self._load_snapshot(random_seed)
+    if state is None:
+      # reset the bandit environment and the learner
+      self.bandit.reset()
+      self.current_learner.reset()
+      checkpoints = len(self.__intermediate_regrets)
+      state = {
+          'one_trial_data': [],
+          'adaptive_rounds': 0,
+          'total_actions': 0,
+          'intermediate_regrets': np.full(checkpoints, np.nan),
+          'intermediate_actions': np.full(checkpoints, -1)
+      }
+
+    one_trial_data = state['one_trial_data']
     # number of rounds to communicate with the bandit environment
-    adaptive_rounds = 0
+    adaptive_rounds = state['adaptive_rounds']
     # total actions executed by the bandit environment
-    total_actions = 0
+    total_actions = state['total_actions']
+    # results at the checkpoints when records are compact
+    intermediate_regrets = state['intermediate_regrets']
+    intermediate_actions = state['intermediate_actions']
 
     def record_data():
       one_trial_data.append(
@@ -90,8 +125,14 @@ class SinglePlayerProtocol(Protocol):
         break
 
       # record intermediate regrets
-      if adaptive_rounds in self.__intermediate_regrets:
-        record_data()
+      position = self.__intermediate_regrets.position(adaptive_rounds)
+      if position is not None:
+        if self.__compact_records:
+          intermediate_regrets[position] = self.bandit.regret(
+              self.current_learner.goal)
+          intermediate_actions[position] = total_actions
+        else:
+          record_data()
 
       feedback = self.bandit.feed(actions)
       self.current_learner.update(feedback)
@@ -102,6 +143,20 @@ class SinglePlayerProtocol(Protocol):
           total_actions += int(times)
         adaptive_rounds += 1
 
+      if self._snapshot_due():
+        self._save_snapshot(
+            random_seed, {
+                'one_trial_data': one_trial_data,
+                'adaptive_rounds': adaptive_rounds,
+                'total_actions': total_actions,
+                'intermediate_regrets': intermediate_regrets,
+                'intermediate_actions': intermediate_actions
+            })
+
     # record final regret
     record_data()
+    if self.__compact_records:
+      one_trial_data[-1]['intermediate_regrets'] = intermediate_regrets.tolist()
+      one_trial_data[-1]['intermediate_actions'] = intermediate_actions.tolist()
+    self._remove_snapshot(random_seed)
     return one_trial_data
@@ -1,9 +1,14 @@
+import json
+import os
 import tempfile
 
 from banditpylib.arms import BernoulliArm
 from banditpylib.bandits import OrdinaryBandit
-from banditpylib.learners.ordinary_learner import EpsGreedy
+from banditpylib.learners.ordinary_learner import EpsGreedy, \
+    ThompsonSampling
+from .checkpoints import CheckpointScheduler
 from .single_player import SinglePlayerProtocol
+from .writers import NpzWriter
 
 
 class TestSinglePlayer:
@@ -22,3 +27,140 @@ class TestSinglePlayer:
       # check number of records is 3
       lines = f.readlines()
       assert len(lines) == 3
+
+  def test_npz_output(self):
+    means = [0.3, 0.5, 0.7]
+    arms = [BernoulliArm(mean) for mean in means]
+    ordinary_bandit = OrdinaryBandit(arms)
+    eps_greedy_learner = EpsGreedy(arm_num=3, horizon=10)
+    single_player = SinglePlayerProtocol(bandit=ordinary_bandit,
+                                         learners=[eps_greedy_learner])
+    with tempfile.TemporaryDirectory() as temp_dir:
+      output_filename = os.path.join(temp_dir, 'results.npz')
+      single_player.play(trials=3, output_filename=output_filename)
+      # check number of records is 3
+      assert len(NpzWriter.load(output_filename)['regret']) == 3
+
+  def test_chunked_run(self):
+    means = [0.3, 0.5, 0.7]
+    arms = [BernoulliArm(mean) for mean in means]
+    ordinary_bandit = OrdinaryBandit(arms)
+    eps_greedy_learner = EpsGreedy(arm_num=3, horizon=10)
+    single_player = SinglePlayerProtocol(bandit=ordinary_bandit,
+                                         learners=[eps_greedy_learner])
+    temp_file = tempfile.NamedTemporaryFile()
+    single_player.play(trials=5, output_filename=temp_file.name, chunk_size=2)
+    with open(temp_file.name, 'r') as f:
+      # check number of records is 5
+      lines = f.readlines()
+      assert len(lines) == 5
+
+  def test_reproducible_run(self):
+    means = [0.3, 0.5, 0.7]
+    arms = [BernoulliArm(mean) for mean in means]
+    ordinary_bandit = OrdinaryBandit(arms)
+    eps_greedy_learner = EpsGreedy(arm_num=3, horizon=10)
+    single_player = SinglePlayerProtocol(bandit=ordinary_bandit,
+                                         learners=[eps_greedy_learner])
+    results = []
+    for _ in range(2):
+      temp_file = tempfile.NamedTemporaryFile()
+      single_player.play(trials=5, output_filename=temp_file.name, seed=0)
+      with open(temp_file.name, 'r') as f:
+        results.append(sorted(f.readlines()))
+    assert results[0] == results[1]
+
+  def test_scheduling_independent_run(self):
+    means = [0.3, 0.5, 0.7]
+    arms = [BernoulliArm(mean) for mean in means]
+    ordinary_bandit = OrdinaryBandit(arms)
+    learners = [
+        EpsGreedy(arm_num=3, horizon=50),
+        ThompsonSampling(arm_num=3, horizon=50)
+    ]
+    single_player = SinglePlayerProtocol(bandit=ordinary_bandit,
+                                         learners=learners)
+    results = []
+    # results of a seed do not depend on how the trials are split into tasks
+    # or on the number of processes running them
+    for (processes, chunk_size) in [(1, 6), (3, 1), (2, 4)]:
+      temp_file = tempfile.NamedTemporaryFile()
+      single_player.play(trials=6,
+                         output_filename=temp_file.name,
+                         processes=processes,
+                         chunk_size=chunk_size,
+                         seed=0)
+      with open(temp_file.name, 'r') as f:
+        results.append(sorted(f.readlines()))
+    assert len(results[0]) == 12
+    assert results[0] == results[1] == results[2]
+
+  def test_multiple_learners(self):
+    means = [0.3, 0.5, 0.7]
+    arms = [BernoulliArm(mean) for mean in means]
+    ordinary_bandit = OrdinaryBandit(arms)
+    learners = [
+        EpsGreedy(arm_num=3, horizon=10, name='eps_greedy_%d' % i)
+        for i in range(3)
+    ]
+    single_player = SinglePlayerProtocol(bandit=ordinary_bandit,
+                                         learners=learners)
+    temp_file = tempfile.NamedTemporaryFile()
+    single_player.play(trials=4, output_filename=temp_file.name, processes=2)
+    with open(temp_file.name, 'r') as f:
+      names = [json.loads(line)['learner'] for line in f.readlines()]
+    # trials of all the learners share one pool
+    assert sorted(names) == sorted([learner.name for learner in learners] * 4)
+
+  def test_resumed_run(self):
+    means = [0.3, 0.5, 0.7]
+    arms = [BernoulliArm(mean) for mean in means]
+    ordinary_bandit = OrdinaryBandit(arms)
+    eps_greedy_learner = EpsGreedy(arm_num=3, horizon=10)
+    single_player = SinglePlayerProtocol(bandit=ordinary_bandit,
+                                         learners=[eps_greedy_learner])
+    with tempfile.TemporaryDirectory() as temp_dir:
+      output_filename = os.path.join(temp_dir, 'output.json')
+      single_player.play(trials=5, output_filename=output_filename, seed=0,
+                         snapshot_interval=0)
+      # snapshots of finished trials are removed
+      assert not os.path.exists(output_filename + '.snapshots')
+      with open(output_filename, 'r') as f:
+        full_results = sorted(f.readlines())
+      # interrupt the game after 2 trials are finished
+      with open(output_filename, 'w') as f:
+        f.write(''.join(full_results[:2]))
+      with open(output_filename + '.manifest', 'r') as f:
+        lines = f.readlines()
+      finished_seeds = [json.loads(line)['random_seed']
+                        for line in full_results[:2]]
+      with open(output_filename + '.manifest', 'w') as f:
+        f.write(''.join([lines[0]] + [
+            line for line in lines[1:]
+            if json.loads(line)['random_seed'] in finished_seeds
+        ]))
+      single_player.play(trials=5, output_filename=output_filename,
+                         resume=True)
+      with open(output_filename, 'r') as f:
+        assert sorted(f.readlines()) == full_results
+
+  def test_compact_records(self):
+    means = [0.3, 0.5, 0.7]
+    arms = [BernoulliArm(mean) for mean in means]
+    ordinary_bandit = OrdinaryBandit(arms)
+    eps_greedy_learner = EpsGreedy(arm_num=3, horizon=10)
+    single_player = SinglePlayerProtocol(
+        bandit=ordinary_bandit,
+        learners=[eps_greedy_learner],
+        intermediate_regrets=CheckpointScheduler.geometric(horizon=20),
+        compact_records=True)
+    temp_file = tempfile.NamedTemporaryFile()
+    single_player.play(trials=3, output_filename=temp_file.name)
+    with open(temp_file.name, 'r') as f:
+      records = [json.loads(line) for line in f.readlines()]
+    # one record per trial
+    assert len(records) == 3
+    # checkpoints 1, 2, 4 and 8 are reached but 16 is not
+    assert records[0]['intermediate_actions'] == [1, 2, 4, 8, -1]
+    # the regret at the unreached checkpoint is written as null
+    assert records[0]['intermediate_regrets'][-1] is None
@@ -1,24 +1,96 @@
 import json
 import multiprocessing
 from multiprocessing import Pool
+import os
+import pickle
 import time
-from typing import List, Dict, Union
+from typing import Any, List, Dict, Optional, Set, Tuple, Union
 
 from abc import ABC, abstractmethod
 from absl import logging
 
+import numpy as np
+
 from banditpylib.bandits import Bandit
 from banditpylib.learners import Learner
+from .writers import ResultWriter, create_writer
+
+
+def set_random_seed(random_seed: int):
+  """Seed the global random number generator of numpy
+
+  Args:
+    random_seed: random seed which can be any non-negative integer
+  """
+  # hash the seed so that any integer can be used and close seeds give
+  # uncorrelated random streams
+  np.random.seed(np.random.SeedSequence(random_seed).generate_state(4))
+
 
+def _read_manifest(manifest_filename: str) -> Tuple[Dict, Set[Tuple[int, int]]]:
+  """Read the manifest of a game
 
-def time_seed() -> int:
-  """Generate random seed using current time
+  The first line of the manifest is the header of the game and each of the
+  following lines records one finished trial.
+
+  Args:
+    manifest_filename: manifest file
 
   Returns:
-    random seed
+    header of the game and the finished trials. Each finished trial is
+    identified by the index of the learner and its random seed.
+  """
+  with open(manifest_filename, 'r') as f:
+    lines = f.readlines()
+  header = json.loads(lines[0])
+  finished_trials = set()
+  for line in lines[1:]:
+    # the last line may be incomplete if the game was interrupted
+    try:
+      record = json.loads(line)
+    except json.JSONDecodeError:
+      continue
+    finished_trials.add((record['learner'], record['random_seed']))
+  return (header, finished_trials)
+
+
+# protocol shipped to the worker process by the pool initializer
+_protocol = None
+
+
+def _init_worker(protocol: 'Protocol'):
+  """Initialize the worker process
+
+  Args:
+    protocol: protocol to run in the worker process
   """
-  tem_time = time.time()
-  return int((tem_time - int(tem_time)) * 10000000)
+  global _protocol  # pylint: disable=global-statement
+  _protocol = protocol
+
+
+def _run_trials(
+    task: Tuple[int, List[int], bool]
+) -> Tuple[int, List[int], List[Union[Dict, List[Dict]]]]:
+  """Run a block of trials in the worker process
+
+  Args:
+    task: index of the learner to play, random seed of each trial and whether
+      to run the trials in debug mode
+
+  Returns:
+    index of the learner, random seeds and results of the trials. The random
+    seed of each trial is also recorded in its results under key
+    `random_seed`.
+  """
+  (learner_index, random_seeds, debug) = task
+  _protocol._select_learner(learner_index)  # pylint: disable=protected-access
+  results = []
+  for random_seed in random_seeds:
+    result = _protocol._one_trial(random_seed, debug)  # pylint: disable=protected-access
+    for data_point in (result if isinstance(result, list) else [result]):
+      data_point['random_seed'] = random_seed
+    results.append(result)
+  return (learner_index, random_seeds, results)
 
 
 class Protocol(ABC):
@@ -44,6 +116,11 @@ class Protocol(ABC):
     self.__learners = learners
     # learner the simulator is currently running
     self.__current_learner: Learner
+    self.__current_learner_index = 0
+    # directory of the snapshots of unfinished trials
+    self.__snapshot_dir: Optional[str] = None
+    self.__snapshot_interval = 0.0
+    self.__last_snapshot_time = 0.0
 
   @property
   @abstractmethod
@@ -60,6 +137,97 @@ class Protocol(ABC):
     """current learner the simulator is using"""
     return self.__current_learner
 
+  def _select_learner(self, learner_index: int):
+    """Set the current learner
+
+    Args:
+      learner_index: index of the learner
+    """
+    self.__current_learner = self.__learners[learner_index]
+    self.__current_learner_index = learner_index
+
+  def __snapshot_filename(self, random_seed: int) -> str:
+    """
+    Args:
+      random_seed: random seed of the trial
+
+    Returns:
+      snapshot file of the trial of the current learner
+    """
+    return os.path.join(
+        self.__snapshot_dir,
+        '%d_%d.pkl' % (self.__current_learner_index, random_seed))
+
+  def _snapshot_due(self) -> bool:
+    """
+    Returns:
+      whether a snapshot of the current trial should be taken
+    """
+    return self.__snapshot_dir is not None and \
+        time.time() - self.__last_snapshot_time >= self.__snapshot_interval
+
+  def _save_snapshot(self, random_seed: int, state: Dict[str, Any]):
+    """Save a snapshot of the current trial
+
+    The bandit environment, the current learner and the state of the random
+    number generator are saved together with `state`.
+
+    Args:
+      random_seed: random seed of the trial
+      state: progress of the trial kept by the protocol
+    """
+    filename = self.__snapshot_filename(random_seed)
+    # write to a temporary file first so that a snapshot is never half written
+    with open(filename + '.tmp', 'wb') as f:
+      pickle.dump(
+          {
+              'bandit': self.__bandit,
+              'learner': self.__current_learner,
+              'random_state': np.random.get_state(),
+              'state': state
+          }, f)
+    os.replace(filename + '.tmp', filename)
+    self.__last_snapshot_time = time.time()
+
+  def _load_snapshot(self, random_seed: int) -> Optional[Dict[str, Any]]:
+    """Restore the current trial from its snapshot
+
+    The bandit environment, the current learner and the state of the random
+    number generator are restored if the snapshot exists.
+
+    Args:
+      random_seed: random seed of the trial
+
+    Returns:
+      progress of the trial kept by the protocol. `None` if there is no
+      snapshot of the trial.
+    """
+    self.__last_snapshot_time = time.time()
+    if self.__snapshot_dir is None:
+      return None
+    filename = self.__snapshot_filename(random_seed)
+    if not os.path.exists(filename):
+      return None
+    with open(filename, 'rb') as f:
+      snapshot = pickle.load(f)
+    self.__bandit = snapshot['bandit']
+    self.__current_learner = snapshot['learner']
+    self.__learners[self.__current_learner_index] = self.__current_learner
+    np.random.set_state(snapshot['random_state'])
+    return snapshot['state']
+
+  def _remove_snapshot(self, random_seed: int):
+    """Remove the snapshot of a finished trial
+
+    Args:
+      random_seed: random seed of the trial
+    """
+    if self.__snapshot_dir is None:
+      return
+    filename = self.__snapshot_filename(random_seed)
+    if os.path.exists(filename):
+      os.remove(filename)
+
   @abstractmethod
   def _one_trial(self, random_seed: int, debug: bool) -> \
       Union[Dict, List[Dict]]:
@@ -75,23 +243,16 @@ class Protocol(ABC):
       result of one trial
     """
 
-  def __write_to_file(self, data: Union[Dict, List[Dict]]):
-    """Write the result of one trial to file
-
-    Args:
-      data: result of one trial
-    """
-    with open(self.__output_filename, 'a') as f:
-      if isinstance(data, list):
-        for data_point in data:
-          json.dump(data_point, f)
-          f.write('\n')
-      else:
-        json.dump(data, f)
-        f.write('\n')
-      f.flush()
-
-  def play(self, trials: int, output_filename: str, processes=-1, debug=False):
+  def play(self,
+           trials: int,
+           output_filename: str,
+           processes=-1,
+           debug=False,
+           writer: ResultWriter = None,
+           chunk_size: int = None,
+           seed: int = None,
+           resume: bool = False,
+           snapshot_interval: float = None):
     """Start playing the game
 
     Args:
@@ -101,41 +262,162 @@ class Protocol(ABC):
       debug: debug mode. When it is set to `True`, `trials` will be
         automatically set to 1 and debug information of the trial will be
         printed out.
+      writer: writer used to dump the results. If it is `None`,
+        :class:`NpzWriter` is used when `output_filename` ends with `.npz` and
+        :class:`JsonlWriter` is used otherwise. The writer is closed when the
+        game ends.
+      chunk_size: number of trials run by one task. If it is `None`, the
+        trials of all the learners are split into about 4 tasks per process.
+      seed: root random seed. The random seed of each trial is spawned from it
+        via `np.random.SeedSequence` so that the trials get independent random
+        streams and the game can be replayed exactly. If it is `None`, fresh
+        entropy is used and logged.
+      resume: whether to resume an interrupted game. The trials recorded as
+        finished in the manifest are skipped and the root random seed is read
+        from the manifest if `seed` is `None`.
+      snapshot_interval: minimum number of seconds between two snapshots of a
+        running trial. If it is `None`, no snapshot is taken. Snapshots are
+        stored in directory `output_filename.snapshots` and an interrupted
+        trial continues from its last snapshot when the game is resumed.
+
+    .. note::
+      One pool of processes is shared by all the learners. The bandit
+      environment and the learners are sent to each process only once when the
+      process starts rather than with every task. The tasks of all the learners
+      are queued together so that idle processes pick up the trials of the next
+      learner while the last trials of the previous one are still running, and
+      results are written as soon as their tasks complete.
+
+    .. note::
+      The bandit environment and the learners draw from the global random
+      number generator of numpy, which is reseeded with the seed of the trial
+      before the bandit and the learner are reset. Since no random numbers are
+      drawn between trials, the results of a seed do not depend on
+      `processes` or `chunk_size`.
+
+    .. note::
+      The manifest of the game i.e., the root random seed, the number of trials
+      and the learners followed by the index of the learner and the random seed
+      of each finished trial, is written to `output_filename.manifest`. The
+      finished trials are appended to the manifest each time the writer
+      flushes, so a trial is recorded as finished only after its results are
+      in the output file and the buffering of the writer is kept.
 
     .. warning::
-      By default, `output_filename` will be opened with mode `a`.
+      By default, `output_filename` will be opened with mode `a`. When a game
+      is resumed, the results of the trials which were being written when the
+      game was interrupted may appear twice in the output file. They can be
+      told apart by key `random_seed`.
     """
     if debug:
       trials = 1
 
-    for learner in self.__learners:
-      # set current learner
-      self.__current_learner = learner
+    if writer is None:
+      writer = create_writer(output_filename)
+
+    processes = multiprocessing.cpu_count() if processes < 0 else processes
+    if chunk_size is None:
+      chunk_size = max(1, trials * len(self.__learners) // (4 * processes))
+    if chunk_size < 1:
+      raise Exception('Chunk size %d is less than 1!' % chunk_size)
+
+    learner_names = [learner.name for learner in self.__learners]
+    manifest_filename = output_filename + '.manifest'
+    finished_trials: Set[Tuple[int, int]] = set()
+    if resume and os.path.exists(manifest_filename):
+      (header, finished_trials) = _read_manifest(manifest_filename)
+      if header['trials'] != trials or header['learners'] != learner_names:
+        raise Exception('Game in %s does not match the game to resume!' %
+                        manifest_filename)
+      if seed is None:
+        seed = header['seed']
+      elif seed != header['seed']:
+        raise Exception('Random seed %d does not match random seed %d in %s!' %
+                        (seed, header['seed'], manifest_filename))
+      logging.info('resume the game with %d finished trials',
+                   len(finished_trials))
 
-      logging.info('start %s\'s play with %s',
-                   self.__current_learner.name, self.__bandit.name)
+    root_seed_seq = np.random.SeedSequence(seed)
+    logging.info('root random seed is %d', root_seed_seq.entropy)
+    # each learner gets its own random streams
+    learner_seed_seqs = root_seed_seq.spawn(len(self.__learners))
 
-      start_time = time.time()
-      self.__output_filename = output_filename
-      pool = Pool(processes=(
-          multiprocessing.cpu_count() if processes < 0 else processes))
+    if not finished_trials:
+      with open(manifest_filename, 'w') as f:
+        f.write(
+            json.dumps({
+                'seed': root_seed_seq.entropy,
+                'trials': trials,
+                'learners': learner_names
+            }) + '\n')
 
-      trial_results = []
-      for _ in range(trials):
-        result = pool.apply_async(self._one_trial,
-                                  args=[time_seed(), debug],
-                                  callback=self.__write_to_file)
+    if snapshot_interval is not None:
+      self.__snapshot_dir = output_filename + '.snapshots'
+      self.__snapshot_interval = snapshot_interval
+      os.makedirs(self.__snapshot_dir, exist_ok=True)
+    else:
+      self.__snapshot_dir = None
+
+    tasks = []
+    for (learner_index, learner_seed_seq) in enumerate(learner_seed_seqs):
+      # 64-bit seeds make collisions among trials unlikely
+      random_seeds = [
+          int(trial_seed_seq.generate_state(1, np.uint64)[0])
+          for trial_seed_seq in learner_seed_seq.spawn(trials)
+      ]
+      random_seeds = [
+          random_seed for random_seed in random_seeds
+          if (learner_index, random_seed) not in finished_trials
+      ]
+      for start in range(0, len(random_seeds), chunk_size):
+        tasks.append(
+            (learner_index, random_seeds[start:start + chunk_size], debug))
+    # number of unfinished tasks of each learner
+    tasks_left = np.bincount([task[0] for task in tasks],
+                             minlength=len(self.__learners))
+
+    for learner in self.__learners:
+      logging.info('start %s\'s play with %s', learner.name,
+                   self.__bandit.name)
+    start_time = time.time()
 
-        trial_results.append(result)
+    manifest = open(manifest_filename, 'a')
+    # finished trials whose results are not in the output file yet
+    unrecorded_trials: List[Tuple[int, int]] = []
 
-      # can not apply for processes any more
-      pool.close()
-      pool.join()
+    def record_finished_trials():
+      # all the results written to the writer have just been flushed
+      manifest.write(''.join([
+          json.dumps({
+              'learner': learner_index,
+              'random_seed': random_seed
+          }) + '\n' for (learner_index, random_seed) in unrecorded_trials
+      ]))
+      manifest.flush()
+      unrecorded_trials.clear()
 
-      # check if there are exceptions during the trials
-      for result in trial_results:
-        result.get()
+    writer.add_flush_callback(record_finished_trials)
 
-      logging.info('%s\'s play with %s runs %.2f seconds.',
-                   self.__current_learner.name, self.__bandit.name,
-                   time.time() - start_time)
+    try:
+      with Pool(processes=processes,
+                initializer=_init_worker,
+                initargs=(self, )) as pool:
+        # exceptions raised during the trials are re-raised here
+        for (learner_index, random_seeds,
+             results) in pool.imap_unordered(_run_trials, tasks):
+          for (random_seed, result) in zip(random_seeds, results):
+            # the trial is recorded by the flush which writes its results
+            unrecorded_trials.append((learner_index, random_seed))
+            writer.write(result)
+          tasks_left[learner_index] -= 1
+          if tasks_left[learner_index] == 0:
+            writer.flush()
+            logging.info('%s\'s play with %s runs %.2f seconds.',
+                         self.__learners[learner_index].name,
+                         self.__bandit.name,
+                         time.time() - start_time)
+    finally:
+      writer.close()
+      manifest.close()
+    if self.__snapshot_dir is not None and not os.listdir(self.__snapshot_dir):
+      os.rmdir(self.__snapshot_dir)
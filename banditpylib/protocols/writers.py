@@ -0,0 +1,290 @@
+import json
+import math
+import os
+import time
+from typing import Callable, Dict, List, Optional, Set, Union
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+def _json_compatible(value):
+  """Replace the floats which are not allowed in JSON
+
+  Args:
+    value: value to convert
+
+  Returns:
+    `value` with `nan` and infinite floats replaced by `None`
+  """
+  if isinstance(value, float):
+    return value if math.isfinite(value) else None
+  if isinstance(value, dict):
+    return {key: _json_compatible(item) for (key, item) in value.items()}
+  if isinstance(value, (list, tuple)):
+    return [_json_compatible(item) for item in value]
+  return value
+
+
+def _shard_filename(output_filename: str, index: int) -> str:
+  """
+  Args:
+    output_filename: file used to dump the results
+    index: index of the shard
+
+  Returns:
+    name of the shard of `output_filename` with index `index`
+  """
+  if output_filename.endswith('.npz'):
+    output_filename = output_filename[:-len('.npz')]
+  return '%s.part%d.npz' % (output_filename, index)
+
+
+class ResultWriter(ABC):
+  """Abstract class for a writer which dumps the results of trials
+
+  Records are buffered in memory and flushed to the output file once
+  `flush_records` records have been buffered or `flush_interval` seconds have
+  passed since the last flush. :func:`close` should be called to flush the
+  remaining records when no more records will be written. Callbacks added by
+  :func:`add_flush_callback` are called whenever records are flushed so that
+  the caller knows which records are already in the output file.
+  """
+  def __init__(self,
+               output_filename: str,
+               flush_records: int = 1000,
+               flush_interval: float = 10.0):
+    """
+    Args:
+      output_filename: file used to dump the results
+      flush_records: maximum number of records buffered before flushing
+      flush_interval: maximum number of seconds between two flushes
+    """
+    if flush_records < 1:
+      raise Exception('Number of records %d to flush is less than 1!' %
+                      flush_records)
+    self.__output_filename = output_filename
+    self.__flush_records = flush_records
+    self.__flush_interval = flush_interval
+    self.__buffer: List[Dict] = []
+    self.__last_flush_time = time.time()
+    self.__closed = False
+    self.__flush_callbacks: List[Callable[[], None]] = []
+
+  @property
+  def output_filename(self) -> str:
+    """file used to dump the results"""
+    return self.__output_filename
+
+  @property
+  def closed(self) -> bool:
+    """whether the writer is closed"""
+    return self.__closed
+
+  @abstractmethod
+  def _flush(self, records: List[Dict]):
+    """Flush buffered records
+
+    Args:
+      records: buffered records
+    """
+
+  @abstractmethod
+  def _close(self):
+    """Release resources held by the writer"""
+
+  def add_flush_callback(self, callback: Callable[[], None]):
+    """Add a callback called after records are flushed
+
+    Args:
+      callback: function called after the buffered records are written to the
+        output file
+    """
+    self.__flush_callbacks.append(callback)
+
+  def write(self, data: Union[Dict, List[Dict]]):
+    """Write the result of one trial
+
+    Args:
+      data: result of one trial
+    """
+    if self.__closed:
+      raise Exception('Writer of %s is closed!' % self.__output_filename)
+    if isinstance(data, list):
+      self.__buffer.extend(data)
+    else:
+      self.__buffer.append(data)
+    if len(self.__buffer) >= self.__flush_records or \
+        time.time() - self.__last_flush_time >= self.__flush_interval:
+      self.flush()
+
+  def flush(self):
+    """Flush buffered records"""
+    if self.__buffer:
+      self._flush(self.__buffer)
+      self.__buffer = []
+      for callback in self.__flush_callbacks:
+        callback()
+    self.__last_flush_time = time.time()
+
+  def close(self):
+    """Flush the remaining records and close the writer"""
+    if self.__closed:
+      return
+    self.flush()
+    self._close()
+    self.__closed = True
+
+
+class JsonlWriter(ResultWriter):
+  """JSON lines writer
+
+  Each record is dumped as a json object in one line. The output file is opened
+  once with mode `a`. Since `nan` and infinite floats are not valid JSON, they
+  are written as `null`.
+  """
+  def __init__(self,
+               output_filename: str,
+               flush_records: int = 1000,
+               flush_interval: float = 10.0):
+    """
+    Args:
+      output_filename: file used to dump the results
+      flush_records: maximum number of records buffered before flushing
+      flush_interval: maximum number of seconds between two flushes
+    """
+    super().__init__(output_filename=output_filename,
+                     flush_records=flush_records,
+                     flush_interval=flush_interval)
+    self.__file = open(output_filename, 'a')
+
+  def _flush(self, records: List[Dict]):
+    """Flush buffered records
+
+    Args:
+      records: buffered records
+    """
+    lines = []
+    for record in records:
+      try:
+        lines.append(json.dumps(record, allow_nan=False) + '\n')
+      except ValueError:
+        lines.append(
+            json.dumps(_json_compatible(record), allow_nan=False) + '\n')
+    self.__file.write(''.join(lines))
+    self.__file.flush()
+
+  def _close(self):
+    """Close the output file"""
+    self.__file.close()
+
+
+class NpzWriter(ResultWriter):
+  """NumPy `.npz` writer
+
+  Records are stored column by column i.e., the values of each key of the
+  records form one array. Since `.npz` files can not be appended to, each flush
+  writes the buffered records to a new shard named `name.partN.npz` where
+  `name.npz` is the output file and `N` counts from 0. Shards written by
+  earlier games are kept and new shards are numbered after them, so the memory
+  used by the writer is bounded by the buffered records and the results
+  flushed before a crash are kept. :func:`load` concatenates the shards.
+
+  .. warning::
+    All the records should have the same keys.
+  """
+  def __init__(self,
+               output_filename: str,
+               flush_records: int = 1000,
+               flush_interval: float = 10.0):
+    """
+    Args:
+      output_filename: file used to dump the results
+      flush_records: maximum number of records buffered before flushing
+      flush_interval: maximum number of seconds between two flushes
+    """
+    super().__init__(output_filename=output_filename,
+                     flush_records=flush_records,
+                     flush_interval=flush_interval)
+    # index of the next shard to write
+    self.__next_shard = len(NpzWriter.shard_filenames(output_filename))
+    # keys of the records written by the writer
+    self.__keys: Optional[Set[str]] = None
+
+  @staticmethod
+  def shard_filenames(output_filename: str) -> List[str]:
+    """
+    Args:
+      output_filename: file used to dump the results
+
+    Returns:
+      existing shards of the output file in the order they were written
+    """
+    shards = []
+    while os.path.exists(_shard_filename(output_filename, len(shards))):
+      shards.append(_shard_filename(output_filename, len(shards)))
+    return shards
+
+  @staticmethod
+  def load(output_filename: str) -> Dict[str, np.ndarray]:
+    """Load the results written by :class:`NpzWriter`
+
+    Args:
+      output_filename: file used to dump the results
+
+    Returns:
+      array of the values of each key concatenated over all the shards
+    """
+    columns: Dict[str, List[np.ndarray]] = {}
+    for shard in NpzWriter.shard_filenames(output_filename):
+      with np.load(shard) as data:
+        if columns and set(data.files) != set(columns.keys()):
+          raise Exception('Keys %s of %s do not match keys %s!' %
+                          (sorted(data.files), shard, sorted(columns.keys())))
+        for key in data.files:
+          columns.setdefault(key, []).append(data[key])
+    return {key: np.concatenate(chunks) for (key, chunks) in columns.items()}
+
+  def _flush(self, records: List[Dict]):
+    """Write buffered records to a new shard
+
+    Args:
+      records: buffered records
+    """
+    keys = set(records[0].keys())
+    if self.__keys is not None and keys != self.__keys:
+      raise Exception('Keys %s of the records do not match existing keys %s!' %
+                      (sorted(keys), sorted(self.__keys)))
+    columns = {}
+    for key in keys:
+      try:
+        columns[key] = np.array([record[key] for record in records])
+      except KeyError:
+        raise Exception('Key %s is missing in some record!' % key)
+    self.__keys = keys
+    shard = _shard_filename(self.output_filename, self.__next_shard)
+    # write to a temporary file first so that a shard is never half written and
+    # to the file object so that no `.npz` suffix is appended
+    with open(shard + '.tmp', 'wb') as f:
+      np.savez(f, **columns)
+    os.replace(shard + '.tmp', shard)
+    self.__next_shard += 1
+
+  def _close(self):
+    """Nothing to release since each shard is closed once written"""
+
+
+def create_writer(output_filename: str) -> ResultWriter:
+  """Create a writer according to the extension of the output file
+
+  Args:
+    output_filename: file used to dump the results
+
+  Returns:
+    :class:`NpzWriter` if `output_filename` ends with `.npz` and
+    :class:`JsonlWriter` otherwise
+  """
+  if output_filename.endswith('.npz'):
+    return NpzWriter(output_filename)
+  return JsonlWriter(output_filename)
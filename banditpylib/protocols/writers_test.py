@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from .writers import JsonlWriter, NpzWriter
+
+
+class TestJsonlWriter:
+  """Test jsonl writer"""
+
+  def test_write(self):
+    temp_file = tempfile.NamedTemporaryFile()
+    writer = JsonlWriter(temp_file.name, flush_records=2)
+    writer.write({'learner': 'ucb', 'regret': 1.0})
+    with open(temp_file.name, 'r') as f:
+      assert not f.readlines()
+    writer.write([{'learner': 'ucb', 'regret': 2.0}] * 2)
+    with open(temp_file.name, 'r') as f:
+      assert len(f.readlines()) == 3
+    writer.write({'learner': 'moss', 'regret': 3.0})
+    writer.close()
+    with open(temp_file.name, 'r') as f:
+      records = [json.loads(line) for line in f.readlines()]
+      assert [record['regret'] for record in records] == [1.0, 2.0, 2.0, 3.0]
+
+  def test_nan(self):
+    temp_file = tempfile.NamedTemporaryFile()
+    writer = JsonlWriter(temp_file.name)
+    writer.write({'regret': float('nan'), 'regrets': [1.0, float('inf')]})
+    writer.close()
+    with open(temp_file.name, 'r') as f:
+      line = f.readline()
+    # nan and infinity which are not valid JSON are written as null
+    assert 'NaN' not in line and 'Infinity' not in line
+    assert json.loads(line) == {'regret': None, 'regrets': [1.0, None]}
+
+  def test_flush_callback(self):
+    temp_file = tempfile.NamedTemporaryFile()
+    writer = JsonlWriter(temp_file.name, flush_records=2)
+    flushed_lines = []
+
+    def count_lines():
+      with open(temp_file.name, 'r') as f:
+        flushed_lines.append(len(f.readlines()))
+
+    writer.add_flush_callback(count_lines)
+    for regret in range(3):
+      writer.write({'learner': 'ucb', 'regret': regret})
+    writer.close()
+    # the callback is called once the records are in the file
+    assert flushed_lines == [2, 3]
+
+
+class TestNpzWriter:
+  """Test npz writer"""
+
+  def test_write(self):
+    with tempfile.TemporaryDirectory() as temp_dir:
+      output_filename = os.path.join(temp_dir, 'results.npz')
+      for game in range(2):
+        writer = NpzWriter(output_filename, flush_records=2)
+        writer.write([{'learner': 'ucb', 'rounds': 10, 'regret': 1.5}] * 3)
+        # flushed records are in a shard before the writer is closed
+        assert len(NpzWriter.shard_filenames(output_filename)) == 2 * game + 1
+        writer.write({'learner': 'ucb', 'rounds': 10, 'regret': 1.5})
+        writer.close()
+      assert len(NpzWriter.shard_filenames(output_filename)) == 4
+      data = NpzWriter.load(output_filename)
+      assert list(data['learner']) == ['ucb'] * 8
+      np.testing.assert_array_equal(data['rounds'], [10] * 8)
+      np.testing.assert_array_equal(data['regret'], [1.5] * 8)